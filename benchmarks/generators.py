@@ -0,0 +1,145 @@
+# SPDX-FileCopyrightText: 2026 Jacques Supcik <jacques.supcik@hefr.ch>
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Synthetic modules for the benchmarks, each stressing one part of the
+encoder.
+"""
+
+from wasm_gen import (
+    ActiveData,
+    BaseFunction,
+    Export,
+    Function,
+    FunctionType,
+    Import,
+    Memory,
+    MemoryType,
+    Module,
+)
+from wasm_gen import instructions as I  # noqa
+from wasm_gen.core import Node
+from wasm_gen.type import f32_t, f64_t, i32_t, i64_t
+
+VALUE_TYPES = [i32_t, i64_t, f32_t, f64_t]
+
+
+def functions(n: int = 2_000, m: int = 500) -> Module:
+    """``n`` functions of about ``m`` instructions, each calling the
+    previous one."""
+    module = Module(memories=[Memory(type=MemoryType(min_pages=1))])
+    previous = None
+    for i in range(n):
+        f = Function(type=FunctionType(params=[i32_t], results=[i32_t]))
+        body: list[Node] = []
+        for j in range(m // 5):
+            body.extend(
+                [
+                    I.LocalGet(localidx=0),
+                    I.I32Const(value=i * j),
+                    I.I32Add(),
+                    I.I32Load(offset=j),
+                    I.LocalSet(localidx=0),
+                ]
+            )
+        if previous is not None:
+            body.extend([I.LocalGet(localidx=0), I.Call(function=previous), I.Drop()])
+        body.extend([I.LocalGet(localidx=0), I.End()])
+        f.body.extend(body)
+        module.funcs.append(f)
+        previous = f
+    if previous is not None:
+        module.exports.append(Export(node=previous, name="main"))
+    return module
+
+
+def imports(n: int = 20_000) -> Module:
+    """``n`` imported functions, all called from a single function."""
+    module = Module()
+    main = Function(type=FunctionType())
+    for i in range(n):
+        f = BaseFunction(type=FunctionType())
+        module.imports.append(Import(node=f, module="env", name=f"f{i}"))
+        main.body.append(I.Call(function=f))
+    main.body.append(I.End())
+    module.funcs.append(main)
+    module.exports.append(Export(node=main, name="main"))
+    return module
+
+
+def data(size: int = 64 << 20, segments: int = 16) -> Module:
+    """``segments`` active data segments totalling ``size`` bytes."""
+    pages = (size + 0xFFFF) // 0x10000
+    module = Module(memories=[Memory(type=MemoryType(min_pages=pages))])
+    chunk = size // segments
+    content = bytes(range(256)) * (chunk // 256 + 1)
+    for i in range(segments):
+        module.data.append(
+            ActiveData(
+                source=memoryview(content)[:chunk],
+                expr=[I.I32Const(value=i * chunk)],
+            )
+        )
+    return module
+
+
+def nesting(depth: int = 50_000) -> Module:
+    """A function with ``depth`` nested blocks."""
+    f = Function(type=FunctionType())
+    f.body.extend(I.Block() for _ in range(depth))
+    f.body.append(I.Br(label=depth - 1))
+    f.body.extend(I.End() for _ in range(depth + 1))
+    return Module(funcs=[f], exports=[Export(node=f, name="main")])
+
+
+def body(n: int = 1_000_000) -> Module:
+    """A function of ``n`` instructions, a typical mix of stack code:
+    constants, local accesses, arithmetic and comparisons, loads and control
+    flow."""
+    f = Function(type=FunctionType(params=[i32_t] * 4))
+    for i in range(n // 10):
+        f.body.extend(
+            [
+                I.LocalGet(localidx=i % 4),
+                I.I32Const(value=i % 1000),
+                I.I32Add(),
+                I.I32Load(),
+                I.LocalGet(localidx=0),
+                I.I32LtS(),
+                I.If(),
+                I.Drop() if i % 2 else I.Nop(),
+                I.End(),
+                I.I32Eqz(),
+            ]
+        )
+    f.body.append(I.End())
+    return Module(
+        funcs=[f],
+        memories=[Memory(type=MemoryType(min_pages=1))],
+        exports=[Export(node=f, name="main")],
+    )
+
+
+def types(n: int = 20_000) -> Module:
+    """``n`` functions with distinct types."""
+    module = Module()
+    for i in range(n):
+        params = []
+        k = i + 1
+        while k > 0:
+            k, digit = divmod(k - 1, len(VALUE_TYPES))
+            params.append(VALUE_TYPES[digit])
+        f = Function(type=FunctionType(params=params), body=[I.End()])
+        module.funcs.append(f)
+    return module
+
+
+GENERATORS = {
+    "functions": functions,
+    "imports": imports,
+    "data": data,
+    "nesting": nesting,
+    "body": body,
+    "types": types,
+}
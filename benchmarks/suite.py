@@ -0,0 +1,250 @@
+# SPDX-FileCopyrightText: 2026 Jacques Supcik <jacques.supcik@hefr.ch>
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Measure the encoder on the synthetic modules of ``generators.py``, and
+compare the results with a baseline.
+
+Run with ``uv run python benchmarks/suite.py run -o results.json`` and
+``uv run python benchmarks/suite.py compare baseline.json results.json``;
+``compare`` exits with status 1 if a measure regressed by more than the
+threshold. With ``--scaling``, the modules are also encoded with 2, 4, ...
+worker processes, up to ``os.cpu_count()`` or ``--workers``, and the speedup
+over the serial encoding is reported for each worker count.
+
+``--memory`` only measures the memory held by the built modules.
+``baseline-memory.json`` was recorded that way with wasm_gen 0.3.3, before
+the instructions were slotted; compare with it to see the bytes per
+instruction saved since.
+"""
+
+import inspect
+import json
+import os
+import platform
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from typing import Annotated, Any
+
+import typer
+from generators import GENERATORS
+from rich.console import Console
+from rich.table import Table
+
+import wasm_gen
+from wasm_gen import Module
+
+app = typer.Typer(help=__doc__)
+
+# Measures where a larger value is a regression
+MEASURES = [
+    "bytes_per_instruction",
+    "compute_indexes_s",
+    "encode_s",
+    "peak_bytes",
+]
+
+
+def scaled(generator: Callable[..., Module], scale: float) -> dict[str, int]:
+    """Return the default parameters of ``generator`` multiplied by
+    ``scale``."""
+    return {
+        name: max(1, int(p.default * scale))
+        for name, p in inspect.signature(generator).parameters.items()
+    }
+
+
+def reset(module: Module) -> None:
+    # Drop the cached encodings so that every run encodes all the bodies
+    for f in module.funcs:
+        f._encoded = None
+
+
+def worker_counts(workers: int) -> list[int]:
+    """Return the powers of two from 2 up to ``workers``, and
+    ``workers``."""
+    counts = []
+    n = 2
+    while n < workers:
+        counts.append(n)
+        n *= 2
+    if workers > 1:
+        counts.append(workers)
+    return counts
+
+
+def encode(module: Module, workers: int | None = None) -> bytes:
+    # Like bytes(module), but without computing the indexes
+    chunks: list[bytes | memoryview] = list(module.header())
+    for section in module.sections(workers):
+        chunks.extend(section.chunks())
+    return b"".join(chunks)
+
+
+def measure(
+    generator: Callable[..., Module],
+    params: dict[str, int],
+    repeat: int,
+    workers: list[int],
+    memory: bool = False,
+) -> dict[str, Any]:
+    # The memory held by the module once built
+    tracemalloc.start()
+    module = generator(**params)
+    built, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    instructions = sum(len(f.body) for f in module.funcs)
+    if memory:
+        result: dict[str, Any] = {"instructions": instructions}
+        if instructions > 0:
+            result["bytes_per_instruction"] = built / instructions
+        return result
+    compute_indexes = encode_s = float("inf")
+    parallel = dict.fromkeys(workers, float("inf"))
+    data = b""
+    for _ in range(repeat):
+        start = time.perf_counter()
+        module.compute_indexes()
+        compute_indexes = min(compute_indexes, time.perf_counter() - start)
+        reset(module)
+        start = time.perf_counter()
+        data = encode(module)
+        encode_s = min(encode_s, time.perf_counter() - start)
+        for n in workers:
+            reset(module)
+            start = time.perf_counter()
+            parallel_data = encode(module, n)
+            parallel[n] = min(parallel[n], time.perf_counter() - start)
+            assert parallel_data == data
+    reset(module)
+    tracemalloc.start()
+    bytes(module)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    result = {
+        "instructions": instructions,
+        "size_bytes": len(data),
+        "compute_indexes_s": compute_indexes,
+        "encode_s": encode_s,
+        "instructions_per_s": instructions / encode_s,
+        "mb_per_s": len(data) / encode_s / 1e6,
+        "peak_bytes": peak,
+    }
+    if instructions > 0:
+        result["bytes_per_instruction"] = built / instructions
+    if workers:
+        # Keyed by the worker count as a string, as in the JSON file
+        result["parallel"] = {
+            str(n): {"encode_s": t, "speedup": encode_s / t}
+            for n, t in parallel.items()
+        }
+    return result
+
+
+@app.command()
+def run(
+    cases: Annotated[
+        list[str] | None, typer.Argument(help="Cases to run, all by default")
+    ] = None,
+    output: Annotated[
+        Path | None, typer.Option("--output", "-o", help="JSON result file")
+    ] = None,
+    scale: Annotated[float, typer.Option(help="Size of the modules")] = 1.0,
+    repeat: Annotated[int, typer.Option(help="Runs of each case")] = 3,
+    scaling: Annotated[
+        bool, typer.Option(help="Also encode with 2, 4, ... worker processes")
+    ] = False,
+    workers: Annotated[
+        int | None,
+        typer.Option(help="Most worker processes with --scaling [cpu count]"),
+    ] = None,
+    memory: Annotated[
+        bool, typer.Option(help="Only measure the memory of the built modules")
+    ] = False,
+) -> None:
+    """Run the benchmarks."""
+    counts = worker_counts(workers or os.cpu_count() or 1) if scaling else []
+    results = {}
+    for name in cases or list(GENERATORS):
+        if name not in GENERATORS:
+            raise typer.BadParameter(f"Unknown case {name}")
+        generator = GENERATORS[name]
+        params = scaled(generator, scale)
+        result = measure(generator, params, repeat, counts, memory)
+        results[name] = {"params": params, **result}
+        line = f"{name:10s}"
+        if not memory:
+            line += (
+                f" {result['compute_indexes_s']:8.3f} s indexes "
+                f"{result['encode_s']:8.3f} s encode "
+                f"{result['instructions_per_s'] / 1e6:8.2f} Minstr/s "
+                f"{result['mb_per_s']:8.1f} MB/s "
+                f"{result['peak_bytes'] / 1e6:8.1f} MB peak"
+            )
+        if "bytes_per_instruction" in result:
+            line += f" {result['bytes_per_instruction']:6.1f} B/instr"
+        print(line)
+        for n, p in result.get("parallel", {}).items():
+            print(
+                f"{'':10s} {p['encode_s']:8.3f} s encode with {n:>3s} workers "
+                f"{p['speedup']:6.2f}x"
+            )
+    if output is not None:
+        report = {
+            "wasm_gen": wasm_gen.__version__,
+            "python": platform.python_version(),
+            "scale": scale,
+            "results": results,
+        }
+        output.write_text(json.dumps(report, indent=2) + "\n")
+
+
+def measures(result: dict[str, Any]) -> dict[str, float]:
+    """Return the measures of ``result`` where a larger value is a
+    regression, with the parallel encoding times keyed by worker count."""
+    found = {key: result[key] for key in MEASURES if key in result}
+    for n, p in result.get("parallel", {}).items():
+        found[f"encode_s[{n} workers]"] = p["encode_s"]
+    return found
+
+
+@app.command()
+def compare(
+    baseline: Path,
+    current: Path,
+    threshold: Annotated[
+        float, typer.Option(help="Tolerated slowdown, as a fraction")
+    ] = 0.1,
+) -> None:
+    """Compare results with a baseline and flag the regressions."""
+    old = json.loads(baseline.read_text())["results"]
+    new = json.loads(current.read_text())["results"]
+    table = Table("case", "measure", "baseline", "current", "change")
+    regressions = 0
+    for name in sorted(old.keys() & new.keys()):
+        if old[name]["params"] != new[name]["params"]:
+            table.add_row(name, "", "", "", "[yellow]parameters differ")
+            continue
+        before, after = measures(old[name]), measures(new[name])
+        for key in before:
+            if key not in after:
+                continue
+            ratio = after[key] / before[key] - 1 if before[key] else 0
+            change = f"{ratio:+.1%}"
+            if ratio > threshold:
+                regressions += 1
+                change = f"[red]{change}"
+            elif ratio < -threshold:
+                change = f"[green]{change}"
+            table.add_row(name, key, f"{before[key]:.4g}", f"{after[key]:.4g}", change)
+    Console().print(table)
+    if regressions > 0:
+        print(f"{regressions} regression(s) above {threshold:.0%}")
+        raise typer.Exit(1)
+
+
+if __name__ == "__main__":
+    app()
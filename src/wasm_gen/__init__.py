@@ -4,27 +4,45 @@
 
 __version__ = "0.3.3"
 
+from wasm_gen.core import BaseData, UnsupportedFeature
 from wasm_gen.data import ActiveData, PassiveData
 from wasm_gen.exports import Export
-from wasm_gen.function import BaseFunction, Function, FunctionType
+from wasm_gen.function import (
+    BaseFunction,
+    Function,
+    FunctionBuilder,
+    FunctionType,
+    Label,
+    TypeTable,
+)
 from wasm_gen.globals import BaseGlobal, Global, GlobalType
 from wasm_gen.imports import Import
 from wasm_gen.memory import BaseMemory, Memory, MemoryType
-from wasm_gen.module import Module
+from wasm_gen.module import CustomSection, Module
+from wasm_gen.table import BaseTable, Table, TableType
 
 __all__ = [
     "ActiveData",
+    "BaseData",
     "BaseFunction",
     "BaseGlobal",
     "BaseMemory",
+    "BaseTable",
+    "CustomSection",
     "Export",
     "Function",
+    "FunctionBuilder",
     "FunctionType",
     "Global",
     "GlobalType",
     "Import",
+    "Label",
     "Memory",
     "MemoryType",
     "Module",
     "PassiveData",
+    "Table",
+    "TableType",
+    "TypeTable",
+    "UnsupportedFeature",
 ]
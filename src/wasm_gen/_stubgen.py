@@ -0,0 +1,114 @@
+# SPDX-FileCopyrightText: 2026 Jacques Supcik <jacques.supcik@hefr.ch>
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Generate ``instructions.pyi`` from the opcode table.
+
+Usage: ``python -m wasm_gen._stubgen > src/wasm_gen/instructions.pyi``
+"""
+
+from wasm_gen import instructions as I  # noqa
+
+HEADER = """\
+# SPDX-FileCopyrightText: 2026 Jacques Supcik <jacques.supcik@hefr.ch>
+#
+# SPDX-License-Identifier: MIT
+
+# Generated by `python -m wasm_gen._stubgen`, do not edit.
+
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from dataclasses import {dataclass_imports}
+from typing import Any, ClassVar, Self
+
+from wasm_gen.core import BaseData, Node
+from wasm_gen.function import BaseFunction
+from wasm_gen.globals import BaseGlobal
+from wasm_gen.opcodes import Opcode
+from wasm_gen.values import TypeIndex
+
+Writer = Callable[[bytearray, Any], None]
+Reader = Callable[[bytes | memoryview, int], tuple[Any, int]]
+REQUIRED: Any
+
+@dataclass(frozen=True, slots=True)
+class Immediate:
+    name: str
+    type: Any
+    stub_type: str
+    writer: Writer
+    reader: Reader
+    default: Any = ...
+    ref: bool = ...
+
+@dataclass(frozen=True, slots=True)
+class Instruction(Node):
+    info: ClassVar[Opcode]
+    opcode: ClassVar[bytes]
+    immediates: ClassVar[tuple[Immediate, ...]]
+    def __bytes__(self) -> bytes: ...
+
+@dataclass(frozen=True, slots=True)
+class SimpleInstruction(Instruction):
+    def __new__(cls) -> Self: ...
+
+@dataclass(frozen=True, slots=True)
+class BlockInstruction(Instruction): ...
+
+@dataclass(frozen=True, slots=True)
+class MemoryInstruction(Instruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I32(MemoryInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I64(MemoryInstruction): ...
+
+def class_name(name: str) -> str: ...
+def encode_body(body: Iterable[Node], buf: bytearray) -> None: ...
+def encode_body_indexed(
+    body: Iterable[Node], buf: bytearray, index: Callable[[Any], int]
+) -> None: ...
+def decode_body(
+    data: bytes | memoryview,
+    pos: int,
+    end: int | None,
+    resolve: Callable[[Immediate, int], Any],
+) -> tuple[list[Node], int]: ...
+def iter_refs(body: Iterable[Node]) -> Iterator[Any]: ...
+def detach_refs(body: Iterable[Node]) -> list[Node]: ...
+def encode_instruction(
+    buf: bytearray, instruction: Node, fixups: list[tuple[int, Any]]
+) -> None: ...
+def instruction_classes() -> list[type[Instruction]]: ...
+"""
+
+
+def stub() -> str:
+    lines = []
+    for cls in I.instruction_classes():
+        base = cls.__mro__[1].__name__
+        lines.append("@dataclass(frozen=True, slots=True)")
+        if len(cls.immediates) == 0:
+            lines.append(f"class {cls.__name__}({base}): ...")
+            continue
+        lines.append(f"class {cls.__name__}({base}):")
+        has_default = kw_only = False
+        for i in cls.immediates:
+            if i.default is I.REQUIRED:
+                if has_default and not kw_only:
+                    lines.append("    _: KW_ONLY")
+                    kw_only = True
+                lines.append(f"    {i.name}: {i.stub_type}")
+            else:
+                has_default = True
+                lines.append(f"    {i.name}: {i.stub_type} = ...")
+    dataclass_imports = (
+        "KW_ONLY, dataclass" if "    _: KW_ONLY" in lines else "dataclass"
+    )
+    header = HEADER.format(dataclass_imports=dataclass_imports)
+    return header + "\n".join(lines) + "\n"
+
+
+if __name__ == "__main__":
+    print(stub(), end="")
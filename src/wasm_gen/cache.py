@@ -0,0 +1,241 @@
+# SPDX-FileCopyrightText: 2026 Jacques Supcik <jacques.supcik@hefr.ch>
+#
+# SPDX-License-Identifier: MIT
+
+"""
+On-disk cache of encoded modules.
+
+Modules are keyed by :func:`structural_hash`, which walks the module without
+computing its indexes or encoding it. :class:`ModuleCache` stores the
+binaries in a directory that can be shared by several processes.
+"""
+
+import hashlib
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+import wasm_gen
+from wasm_gen import instructions as I  # noqa
+from wasm_gen.core import Node
+from wasm_gen.data import ActiveData, Data, PassiveData
+from wasm_gen.function import BaseFunction, Bytecode, Function
+from wasm_gen.globals import BaseGlobal
+from wasm_gen.memory import BaseMemory
+from wasm_gen.module import Module
+from wasm_gen.table import BaseTable
+from wasm_gen.values import encode_signed, encode_unsigned
+
+
+class _Hasher:
+    def __init__(self, module: Module) -> None:
+        self.hash = hashlib.sha256(f"wasm-gen {wasm_gen.__version__}".encode())
+        # Position of the functions, tables, globals, memories and data
+        # segments in their index space, which is what their index will be.
+        self.positions: dict[int, int] = {}
+        spaces: dict[type, list[Node]] = {
+            BaseFunction: [],
+            BaseTable: [],
+            BaseGlobal: [],
+            BaseMemory: [],
+        }
+        nodes = [i.node for i in module.imports]
+        nodes += [*module.funcs, *module.tables, *module.memories, *module.globals_]
+        for node in nodes:
+            for kind, space in spaces.items():
+                if isinstance(node, kind):
+                    self.positions[id(node)] = len(space)
+                    space.append(node)
+        for position, d in enumerate(module.data):
+            if isinstance(d, Data):
+                self.positions[id(d)] = position
+
+    def put(self, data: Any) -> None:
+        """Add a length prefixed buffer."""
+        view = memoryview(data).cast("B")
+        self.hash.update(encode_unsigned(len(view)))
+        self.hash.update(view)
+
+    def put_int(self, value: int) -> None:
+        self.hash.update(encode_signed(value))
+
+    def position(self, node: Node) -> int:
+        # Nodes outside of the module cannot be encoded anyway
+        return self.positions.get(id(node), -1)
+
+    def put_body(self, body: list[Node]) -> None:
+        buf = bytearray()
+        fixups: list[tuple[int, Any]] = []
+        for instruction in body:
+            if isinstance(instruction, Bytecode):
+                buf += instruction.code
+                base = len(buf) - len(instruction.code)
+                fixups.extend((base + o, n) for o, n in instruction.fixups)
+            else:
+                I.encode_instruction(buf, instruction, fixups)
+        self.put(buf)
+        self.put_int(len(fixups))
+        for offset, node in fixups:
+            self.put_int(offset)
+            self.put_int(self.position(node))
+
+    def put_function(self, f: Function) -> None:
+        self.put(bytes(f.type))
+        # The body is encoded at most once: the encoding is cached by the
+        # function, and the code of a body that was not decoded yet is used
+        # as is when its indices are the positions.
+        for chunk in f.positioned_chunks(self.positions):
+            self.put(chunk)
+
+
+def structural_hash(module: Module) -> str:
+    """Return a hash of everything the encoding of ``module`` depends on.
+
+    Two modules with the same hash have the same encoding. The hash is
+    computed without computing the indexes: the nodes that instructions
+    refer to are identified by their position. The bodies of the functions
+    are hashed as they are encoded, and that encoding is cached by each
+    function: encoding the module afterwards does not encode the bodies
+    again, and hashing it again does not encode them at all.
+    """
+    h = _Hasher(module)
+    h.put_int(module.version)
+    types = module.type_table.types if module.type_table is not None else []
+    h.put_int(len(types))
+    for t in types:
+        h.put(bytes(t))
+
+    h.put_int(len(module.imports))
+    for i in module.imports:
+        h.put(i.module.encode())
+        h.put(i.name.encode())
+        if isinstance(i.node, BaseFunction | BaseTable | BaseMemory | BaseGlobal):
+            h.put(i.node.__class__.__name__.encode())
+            h.put(bytes(i.node.type))
+
+    h.put_int(len(module.tables))
+    for table in module.tables:
+        h.put(bytes(table))
+
+    h.put_int(len(module.memories))
+    for m in module.memories:
+        h.put(bytes(m))
+
+    h.put_int(len(module.globals_))
+    for g in module.globals_:
+        h.put(bytes(g.type))
+        h.put_body(g.expr)
+
+    h.put_int(len(module.exports))
+    for e in module.exports:
+        h.put(e.name.encode())
+        h.put(e.node.__class__.__name__.encode())
+        h.put_int(h.position(e.node))
+
+    h.put_int(len(module.funcs))
+    for f in module.funcs:
+        h.put_function(f)
+
+    h.put_int(module.data_count_section() is not None)
+    h.put_int(len(module.data))
+    for d in module.data:
+        if isinstance(d, ActiveData):
+            h.put_int(d.memory)
+            h.put_body(d.expr)
+            h.put(d.content())
+        elif isinstance(d, PassiveData):
+            h.put_int(-1)
+            h.put(d.content())
+        else:
+            h.put(d)
+
+    h.put_int(len(module.custom_sections))
+    for c in module.custom_sections:
+        h.put(c.name.encode())
+        h.put(c.content)
+        h.put_int(-1 if c.after is None else c.after)
+    return h.hash.hexdigest()
+
+
+# Temporary files older than this, in seconds, were left by an interrupted
+# write and are removed by ModuleCache.evict.
+STALE_TEMP_SECONDS = 3600
+
+
+class ModuleCache:
+    """A directory of encoded modules, keyed by their structural hash.
+
+    Entries are written to a temporary file and renamed, so that a process
+    never reads a partial entry. Reading an entry updates its modification
+    time, and the least recently used entries are removed when the total
+    size exceeds ``max_size`` bytes. Several processes may share the same
+    directory.
+    """
+
+    def __init__(self, path: str | os.PathLike[str], max_size: int = 1 << 30):
+        self.path = Path(path)
+        self.max_size = max_size
+        self.path.mkdir(parents=True, exist_ok=True)
+
+    def _entry(self, key: str) -> Path:
+        return self.path / f"{key}.wasm"
+
+    def get(self, key: str) -> bytes | None:
+        """Return the binary stored under ``key``, or None."""
+        entry = self._entry(key)
+        try:
+            data = entry.read_bytes()
+            os.utime(entry)
+        except FileNotFoundError:
+            # Missing, or evicted by another process
+            return None
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        """Store ``data`` under ``key``."""
+        fd, tmp = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, self._entry(key))
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        self.evict()
+
+    def get_or_build(self, module: Module) -> bytes:
+        """Return the binary of ``module``, from the cache if possible."""
+        key = structural_hash(module)
+        data = self.get(key)
+        if data is None:
+            data = bytes(module)
+            self.put(key, data)
+        return data
+
+    def evict(self) -> None:
+        """Remove the least recently used entries until the cache fits in
+        ``max_size`` bytes, and the temporary files left by interrupted
+        writes."""
+        stale = time.time() - STALE_TEMP_SECONDS
+        for tmp in self.path.glob("*.tmp"):
+            try:
+                if tmp.stat().st_mtime < stale:
+                    tmp.unlink()
+            except FileNotFoundError:
+                # Renamed or removed by another process
+                continue
+        entries = []
+        for entry in self.path.glob("*.wasm"):
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, entry))
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in sorted(entries):
+            if total <= self.max_size:
+                break
+            entry.unlink(missing_ok=True)
+            total -= size
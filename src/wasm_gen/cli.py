@@ -0,0 +1,126 @@
+# SPDX-FileCopyrightText: 2026 Jacques Supcik <jacques.supcik@hefr.ch>
+#
+# SPDX-License-Identifier: MIT
+
+"""
+The ``wasm-gen`` command.
+"""
+
+import runpy
+from pathlib import Path
+from typing import Annotated
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from wasm_gen.module import Module
+from wasm_gen.size import SizeReport, size_report
+
+app = typer.Typer(help="Tools for WebAssembly modules.", no_args_is_help=True)
+
+
+@app.callback()
+def main() -> None:
+    # A callback keeps ``size`` a subcommand until there are others
+    pass
+
+
+def load(path: Path, attr: str) -> bytes:
+    """Return the binary module in ``path``, or built by the Python script
+    ``path``: ``attr`` is then the name of a Module, or of a function that
+    returns one, in the script."""
+    if path.suffix != ".py":
+        return path.read_bytes()
+    namespace = runpy.run_path(str(path), run_name="__wasm_gen__")
+    if attr not in namespace:
+        raise typer.BadParameter(f"{path} does not define {attr}")
+    module = namespace[attr]
+    if callable(module):
+        module = module()
+    if not isinstance(module, Module):
+        raise typer.BadParameter(f"{attr} in {path} is not a Module")
+    return bytes(module)
+
+
+def _delta(old: int, new: int) -> str:
+    delta = new - old
+    if delta == 0:
+        return ""
+    return f"[red]{delta:+d}" if delta > 0 else f"[green]{delta:+d}"
+
+
+def _table(
+    title: str, unit: str, rows: dict[str, int], old: dict[str, int] | None
+) -> Table:
+    if old is None:
+        table = Table("", unit, title=title, title_justify="left")
+        for name, value in rows.items():
+            table.add_row(name, str(value))
+        return table
+    table = Table("", "before", "after", "change", title=title, title_justify="left")
+    for name in [*old, *(n for n in rows if n not in old)]:
+        before, after = old.get(name, 0), rows.get(name, 0)
+        if before != after:
+            table.add_row(name, str(before), str(after), _delta(before, after))
+    return table
+
+
+def _render(report: SizeReport, top: int, old: SizeReport | None) -> list[Table]:
+    # Functions are matched by name between the two builds
+    def functions(r: SizeReport) -> dict[str, int]:
+        by_size = sorted(r.functions, key=lambda f: f.size, reverse=True)
+        return {f.name: f.size for f in by_size}
+
+    def segments(r: SizeReport) -> dict[str, int]:
+        return {f"data[{i}]": size for i, size in enumerate(r.data)}
+
+    def tables(
+        r: SizeReport, limit: int | None
+    ) -> list[tuple[str, str, dict[str, int]]]:
+        return [
+            ("sections", "bytes", {**r.sections, "total": r.total}),
+            ("largest functions", "bytes", dict(list(functions(r).items())[:limit])),
+            ("most called functions", "calls", dict(r.calls.most_common(limit))),
+            ("opcodes", "count", dict(r.opcodes.most_common(limit))),
+            ("data segments", "bytes", segments(r)),
+            ("imports by module", "count", dict(r.imports.most_common())),
+        ]
+
+    if old is None:
+        return [_table(*t, None) for t in tables(report, top)]
+    return [
+        _table(*new, previous[2])
+        for new, previous in zip(tables(report, None), tables(old, None), strict=True)
+    ]
+
+
+@app.command()
+def size(
+    path: Annotated[Path, typer.Argument(help="A .wasm file or a .py script")],
+    against: Annotated[
+        Path | None,
+        typer.Option(help="Show the changes from this build instead"),
+    ] = None,
+    attr: Annotated[
+        str, typer.Option(help="Module, or function building it, in scripts")
+    ] = "module",
+    top: Annotated[int, typer.Option(help="Rows of the function tables")] = 10,
+    max_growth: Annotated[
+        int | None,
+        typer.Option(help="Fail if the module grew by more bytes than this"),
+    ] = None,
+) -> None:
+    """Print the size of a module by section, function, opcode, data
+    segment and import module."""
+    report = size_report(load(path, attr))
+    old = None if against is None else size_report(load(against, attr))
+    console = Console()
+    for table in _render(report, top, old):
+        if table.row_count > 0:
+            console.print(table)
+    if old is not None and max_growth is not None:
+        growth = report.total - old.total
+        if growth > max_growth:
+            console.print(f"[red]The module grew by {growth} bytes")
+            raise typer.Exit(1)
@@ -2,10 +2,26 @@
 #
 # SPDX-License-Identifier: MIT
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
-@dataclass
 class Node:
+    # Node is deliberately not a dataclass and has no instance storage, so
+    # that subclasses are free to be frozen and/or to use slots.
+    __slots__ = ()
+
     def __bytes__(self) -> bytes:
         raise NotImplementedError
+
+
+class UnsupportedFeature(Exception):
+    """Raised when a binary module uses a feature that cannot be represented,
+    such as an element section or an unknown opcode."""
+
+
+@dataclass
+class BaseData(Node):
+    """A data segment, as referred to by the bulk memory instructions. The
+    segments themselves are :class:`~wasm_gen.data.Data` nodes."""
+
+    _index: int = field(default=-1, kw_only=True)
@@ -2,29 +2,80 @@
 #
 # SPDX-License-Identifier: MIT
 
+import mmap
+import os
 from dataclasses import dataclass, field
 from io import BytesIO
+from typing import Any, Self
 
 from wasm_gen import instructions as I  # noqa
-from wasm_gen.core import Node
-from wasm_gen.values import UnsignedInt
+from wasm_gen.core import BaseData, Node
+from wasm_gen.values import encode_unsigned
 
 
 @dataclass
-class Data(Node):
+class Data(BaseData):
+    """A data segment.
 
-    _data: BytesIO = BytesIO()
+    The content of the segment is ``source`` when it is given, either an
+    object that supports the buffer protocol (``bytes``, ``bytearray``,
+    ``memoryview``, ``mmap``, NumPy arrays, ...) or the path of a file that
+    is mapped in memory the first time the segment is encoded. Such a
+    content is held by reference and handed to the output without being
+    copied. Otherwise the content is what was written to ``_data``.
 
-    def __bytes__(self) -> bytes:
+    The map of a file stays open until :meth:`close` is called, or until
+    the end of the ``with`` block when the segment is used as a context
+    manager.
+    """
+
+    _data: BytesIO = field(default_factory=BytesIO)
+    source: Any = field(default=None, kw_only=True)
+
+    _map: mmap.mmap | None = field(default=None, init=False, repr=False, compare=False)
+
+    def content(self) -> memoryview:
+        """Return a view of the content of the segment."""
+        if self.source is None:
+            # A view of the bytes rather than of the buffer, which could
+            # not be written to while the view exists.
+            return memoryview(self._data.getvalue())
+        if isinstance(self.source, str | os.PathLike):
+            if self._map is None:
+                with open(self.source, "rb") as f:
+                    if os.fstat(f.fileno()).st_size == 0:
+                        return memoryview(b"")
+                    self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            return memoryview(self._map)
+        return memoryview(self.source).cast("B")
+
+    def close(self) -> None:
+        """Unmap the file of the segment, if it was mapped. The views
+        returned by :meth:`content` must have been released."""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
+
+    def chunks(self) -> list[bytes | memoryview]:
         raise NotImplementedError
 
+    def __bytes__(self) -> bytes:
+        return b"".join(self.chunks())
+
 
 @dataclass
 class PassiveData(Data):
-    def __bytes__(self) -> bytes:
-        v = self._data.getvalue()
-        i = bytes(UnsignedInt(len(v))) + v
-        return b"\x01" + i
+    def chunks(self) -> list[bytes | memoryview]:
+        """Return the encoded segment as a list of buffers, the content
+        being the last one."""
+        v = self.content()
+        return [b"\x01", encode_unsigned(len(v)), v]
 
 
 @dataclass
@@ -35,18 +86,21 @@ class ActiveData(Data):
 
     expr: list[Node] = field(default_factory=list)
 
-    def __bytes__(self) -> bytes:
+    def chunks(self) -> list[bytes | memoryview]:
+        """Return the encoded segment as a list of buffers, the content
+        being the last one."""
         expr = self.expr.copy()
         if len(expr) == 0 or expr[-1].__class__ != I.End:
             expr.append(I.End())
-        e = b"".join([bytes(b) for b in expr])
-        v = self._data.getvalue()
-        i = bytes(UnsignedInt(value=len(v))) + v
-
+        e = bytearray()
         if self.memory == 0:
-            return b"\x00" + e + i
+            e.append(0x00)
         else:
-            return b"\x02" + bytes(UnsignedInt(self.memory)) + e + i
+            e.append(0x02)
+            e += encode_unsigned(self.memory)
+        I.encode_body(expr, e)
+        v = self.content()
+        return [bytes(e), encode_unsigned(len(v)), v]
 
     def append_expr(self, *expr: Node) -> None:
         self.expr.extend(expr)
@@ -6,9 +6,10 @@ from dataclasses import dataclass
 
 from wasm_gen.core import Node
 from wasm_gen.function import BaseFunction
-from wasm_gen.globals import Global
-from wasm_gen.memory import Memory
-from wasm_gen.values import Name, UnsignedInt
+from wasm_gen.globals import BaseGlobal
+from wasm_gen.memory import BaseMemory
+from wasm_gen.table import BaseTable
+from wasm_gen.values import Name, encode_unsigned
 
 func = b"\x00"
 table = b"\x01"
@@ -25,11 +26,13 @@ class Export(Node):
     def __bytes__(self) -> bytes:
         desc = None
         if isinstance(self.node, BaseFunction):
-            desc = func + bytes(UnsignedInt(value=self.node._index))
-        elif isinstance(self.node, Memory):
-            desc = mem + bytes(UnsignedInt(value=self.node._index))
-        elif isinstance(self.node, Global):
-            desc = global_ + bytes(UnsignedInt(value=self.node._index))
+            desc = func + encode_unsigned(self.node._index)
+        elif isinstance(self.node, BaseTable):
+            desc = table + encode_unsigned(self.node._index)
+        elif isinstance(self.node, BaseMemory):
+            desc = mem + encode_unsigned(self.node._index)
+        elif isinstance(self.node, BaseGlobal):
+            desc = global_ + encode_unsigned(self.node._index)
         else:
             raise Exception("Unknown import type")
 
@@ -2,11 +2,25 @@
 #
 # SPDX-License-Identifier: MIT
 
-from dataclasses import dataclass, field
+import struct
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from dataclasses import dataclass, field, replace
+from itertools import groupby
+from typing import Any, Self, SupportsIndex
 
 from wasm_gen import instructions as I  # noqa
 from wasm_gen.core import Node
-from wasm_gen.values import UnsignedInt, Vector
+from wasm_gen.globals import BaseGlobal
+from wasm_gen.opcodes import OPCODES_BY_NAME
+from wasm_gen.values import (
+    TypeIndex,
+    Vector,
+    encode_signed,
+    encode_unsigned,
+    read_unsigned,
+    write_blocktype,
+    write_unsigned,
+)
 
 
 @dataclass
@@ -16,7 +30,7 @@ class LocalVariables(Node):
     type: bytes
 
     def __bytes__(self) -> bytes:
-        return bytes(UnsignedInt(value=self.count)) + self.type
+        return encode_unsigned(self.count) + self.type
 
 
 @dataclass
@@ -33,6 +47,38 @@ class FunctionType(Node):
             + bytes(Vector(values=self.results))
         )
 
+    def signature(self) -> tuple[tuple[bytes, ...], tuple[bytes, ...]]:
+        """Return a hashable value that identifies the type."""
+        return (tuple(self.params), tuple(self.results))
+
+
+@dataclass
+class TypeTable:
+    """The function types of one or more modules, without duplicates.
+
+    A module uses a fresh table every time its indexes are computed, unless
+    one is given in :attr:`~wasm_gen.Module.type_table`. A table given to
+    several modules keeps its entries, so that a type gets the same index in
+    all of them.
+    """
+
+    types: list[FunctionType] = field(default_factory=list)
+    _indices: dict[tuple[tuple[bytes, ...], tuple[bytes, ...]], int] = field(
+        default_factory=dict, repr=False
+    )
+
+    def add(self, t: FunctionType) -> int:
+        """Set and return the index of ``t``, adding it if the table does
+        not have an equal type yet."""
+        sig = t.signature()
+        index = self._indices.get(sig)
+        if index is None:
+            index = len(self.types)
+            self._indices[sig] = index
+            self.types.append(t)
+        t._index = index
+        return index
+
 
 @dataclass
 class BaseFunction(Node):
@@ -41,21 +87,723 @@ class BaseFunction(Node):
     _index: int = -1
 
 
+class Body(list[Node]):
+    """A list of instructions that counts its mutations.
+
+    ``version`` is bumped by every method that modifies the list, which lets
+    :class:`Function` reuse the encoding of a body that did not change.
+    """
+
+    __slots__ = ("version",)
+
+    def __init__(self, iterable: Iterable[Node] = ()) -> None:
+        super().__init__(iterable)
+        self.version = 0
+
+    def append(self, instruction: Node) -> None:
+        self.version += 1
+        super().append(instruction)
+
+    def extend(self, instructions: Iterable[Node]) -> None:
+        self.version += 1
+        super().extend(instructions)
+
+    def insert(self, index: SupportsIndex, instruction: Node) -> None:
+        self.version += 1
+        super().insert(index, instruction)
+
+    def pop(self, index: SupportsIndex = -1) -> Node:
+        self.version += 1
+        return super().pop(index)
+
+    def remove(self, instruction: Node) -> None:
+        self.version += 1
+        super().remove(instruction)
+
+    def clear(self) -> None:
+        self.version += 1
+        super().clear()
+
+    def sort(self, *args: Any, **kwargs: Any) -> None:
+        self.version += 1
+        super().sort(*args, **kwargs)
+
+    def reverse(self) -> None:
+        self.version += 1
+        super().reverse()
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        self.version += 1
+        super().__setitem__(index, value)
+
+    def __delitem__(self, index: Any) -> None:
+        self.version += 1
+        super().__delitem__(index)
+
+    def __iadd__(self, instructions: Iterable[Node]) -> Self:  # type: ignore[override, misc]
+        self.version += 1
+        super().__iadd__(instructions)
+        return self
+
+    def __imul__(self, n: SupportsIndex) -> Self:
+        self.version += 1
+        super().__imul__(n)
+        return self
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # The default protocol appends the items before restoring the slots,
+        # which would find ``version`` unset.
+        return (self.__class__, (list(self),), (None, {"version": self.version}))
+
+
+def _remap_locals(body: Iterable[Node], remap: dict[int, int]) -> list[Node]:
+    local = (I.LocalGet, I.LocalSet, I.LocalTee)
+    return [
+        (
+            replace(n, localidx=remap[n.localidx])
+            if isinstance(n, local) and n.localidx in remap
+            else n
+        )
+        for n in body
+    ]
+
+
+def _same_fixups(a: list[tuple[int, Any]], b: list[tuple[int, Any]]) -> bool:
+    # Nodes are compared by identity, their index is checked separately
+    return len(a) == len(b) and all(
+        x[0] == y[0] and x[1] is y[1] for x, y in zip(a, b, strict=True)
+    )
+
+
+@dataclass
+class _EncodedBody:
+    body: Body
+    version: int
+    signature: tuple[tuple[bytes, ...], tuple[bytes, ...]]
+    local_vars: list[bytes]
+    local_types: list[bytes]
+    # Nodes whose index is written in the encoding, and their indices at the
+    # time the body was encoded.
+    refs: list[Any]
+    indices: list[int]
+    chunks: list[bytes]
+    # The Bytecode of the body, with their code and fixups at the time the
+    # body was encoded: a Bytecode can be changed without the body noticing.
+    bytecode: list[tuple[Any, bytes, list[tuple[int, Any]]]] = field(
+        default_factory=list
+    )
+
+
 @dataclass
 class Function(BaseFunction):
 
     local_vars: list[bytes] = field(default_factory=list)
     # The body is actually a list of Instructions, but if we ask for
     # Instructions here, we get a nasty circular import
-    body: list[Node] = field(default_factory=list)
+    body: list[Node] = field(default_factory=Body)
+    # Types of the locals declared with add_local, which follow the
+    # parameters and the locals of local_vars.
+    local_types: list[bytes] = field(default_factory=list)
 
-    def __bytes__(self) -> bytes:
+    _encoded: _EncodedBody | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.body, Body):
+            self.body = Body(self.body)
+
+    def add_local(self, type: bytes) -> int:
+        """Declare a local of the value type ``type`` and return its index.
+
+        The declared locals are grouped by type when the function is
+        encoded, and the local instructions of the body are renumbered to
+        match.
+        """
+        self.local_types.append(type)
+        return self._first_declared_local() + len(self.local_types) - 1
+
+    def _first_declared_local(self) -> int:
+        index = len(self.type.params)
+        for entry in self.local_vars:
+            index += read_unsigned(entry, 0)[0]
+        return index
+
+    def _locals(self, body: Iterable[Node]) -> tuple[list[bytes], dict[int, int]]:
+        """Return the encoded local entries, and the new index of each
+        declared local that moves when they are grouped by type."""
+        entries = list(self.local_vars)
+        if len(self.local_types) == 0:
+            return entries, {}
+        if any(isinstance(n, Bytecode) for n in body):
+            # The indices in the bytecode cannot be changed, only the runs of
+            # consecutive locals of the same type are grouped.
+            for t, run in groupby(self.local_types):
+                entries.append(bytes(LocalVariables(count=len(list(run)), type=t)))
+            return entries, {}
+        groups: dict[bytes, list[int]] = {}
+        for i, t in enumerate(self.local_types):
+            groups.setdefault(t, []).append(i)
+        first = self._first_declared_local()
+        remap = {}
+        new = 0
+        for t, indices in groups.items():
+            entries.append(bytes(LocalVariables(count=len(indices), type=t)))
+            for i in indices:
+                if i != new:
+                    remap[first + i] = first + new
+                new += 1
+        return entries, remap
+
+    def _cached_chunks(
+        self, positions: Mapping[int, int] | None = None
+    ) -> list[bytes] | None:
+        e = self._encoded
+        body = self.body
+        if (
+            e is None
+            or not isinstance(body, Body)
+            or e.body is not body
+            or e.version != body.version
+            or e.signature != self.type.signature()
+            or e.local_vars != self.local_vars
+            or e.local_types != self.local_types
+        ):
+            return None
+        if positions is None:
+            for node, index in zip(e.refs, e.indices, strict=True):
+                if node._index != index:
+                    return None
+        else:
+            for node, index in zip(e.refs, e.indices, strict=True):
+                if positions.get(id(node), node._index) != index:
+                    return None
+        for b, code, fixups in e.bytecode:
+            if b.code is not code or not _same_fixups(b.fixups, fixups):
+                return None
+        return e.chunks
+
+    def _encode(self, positions: Mapping[int, int] | None) -> list[bytes]:
         if len(self.body) == 0:
             raise Exception("Function body is empty")
-        if bytes(self.body[-1]) != bytes(I.End()):
+        if not isinstance(self.body[-1], I.End):
             raise Exception("Function body does not end with End instruction")
 
-        bv = bytes(Vector(values=[bytes(v) for v in self.local_vars])) + b"".join(
-            [bytes(b) for b in self.body]
+        entries, remap = self._locals(self.body)
+        lv = bytes(Vector(values=entries))
+        body = _remap_locals(self.body, remap) if remap else self.body
+        bv = bytearray()
+        # The referenced nodes and the index written for each, by id
+        written: dict[int, tuple[Any, int]] = {}
+        if positions is None:
+            I.encode_body(body, bv)
+        else:
+
+            def index(node: Any) -> int:
+                i: int = positions.get(id(node), node._index)
+                written[id(node)] = (node, i)
+                return i
+
+            I.encode_body_indexed(body, bv, index)
+        chunks = [encode_unsigned(len(lv) + len(bv)), lv, bytes(bv)]
+        if isinstance(self.body, Body):
+            if positions is None:
+                for n in I.iter_refs(self.body):
+                    written[id(n)] = (n, n._index)
+            refs = [n for n, _ in written.values()]
+            indices = [i for _, i in written.values()]
+            self._encoded = _EncodedBody(
+                body=self.body,
+                version=self.body.version,
+                signature=self.type.signature(),
+                local_vars=list(self.local_vars),
+                local_types=list(self.local_types),
+                refs=refs,
+                indices=indices,
+                chunks=chunks,
+                bytecode=[
+                    (n, n.code, list(n.fixups))
+                    for n in self.body
+                    if isinstance(n, Bytecode)
+                ],
+            )
+        return chunks
+
+    def chunks(self) -> list[bytes]:
+        """Return the code entry (size, locals, body) as a list of buffers.
+
+        The encoding is cached and reused as long as the body is only
+        modified through the methods of :class:`Body`, the type and the
+        locals do not change and the functions and globals it references
+        keep their index. A body replaced by a plain list is always encoded
+        again.
+        """
+        if (cached := self._cached_chunks()) is not None:
+            return cached
+        return self._encode(None)
+
+    def positioned_chunks(self, positions: Mapping[int, int]) -> list[bytes]:
+        """Return the code entry as :meth:`chunks` would if the index of
+        every referenced node was its entry in ``positions``, keyed by the
+        id of the node. Nodes missing from ``positions`` keep their index.
+
+        The encoding is cached like the one of :meth:`chunks`: once the
+        indexes of the module are computed, :meth:`chunks` returns it
+        without encoding the body again.
+        """
+        if (cached := self._cached_chunks(positions)) is not None:
+            return cached
+        return self._encode(positions)
+
+    def __bytes__(self) -> bytes:
+        return b"".join(self.chunks())
+
+
+@dataclass
+class Bytecode(Node):
+    """A run of already encoded instructions.
+
+    Function and global indices are only known once
+    :meth:`~wasm_gen.Module.compute_indexes` has run, so they are kept out of
+    ``code``: each fixup is an offset in ``code`` at which the LEB128 index
+    of the referenced node is inserted when the bytecode is encoded.
+    """
+
+    code: bytes
+    fixups: list[tuple[int, BaseFunction | BaseGlobal]] = field(default_factory=list)
+
+    def __bytes__(self) -> bytes:
+        if len(self.fixups) == 0:
+            return self.code
+        code = memoryview(self.code)
+        parts: list[bytes | memoryview] = []
+        pos = 0
+        for offset, node in self.fixups:
+            parts.append(code[pos:offset])
+            parts.append(encode_unsigned(node._index))
+            pos = offset
+        parts.append(code[pos:])
+        return b"".join(parts)
+
+
+def _op(name: str) -> Callable[["FunctionBuilder"], None]:
+    code = OPCODES_BY_NAME[name].encoding()
+
+    def emit(self: "FunctionBuilder") -> None:
+        self._code += code
+
+    return emit
+
+
+@dataclass(eq=False)
+class Label:
+    """A block opened by a :class:`FunctionBuilder`, which branches may
+    target while it is open.
+
+    The relative depth of a branch to the label is computed when the branch
+    is emitted. Used as a context manager, the label closes its block on
+    exit.
+    """
+
+    builder: "FunctionBuilder"
+    # Number of blocks around the block, itself included
+    depth: int
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type: Any, *_: Any) -> None:
+        # Do not hide the exception with an error about the nesting
+        if exc_type is None:
+            self.builder.end(self)
+
+
+@dataclass
+class FunctionBuilder:
+    """Assemble a function body directly into a ``bytearray``.
+
+    Each method appends the opcode and the LEB128 immediates of one
+    instruction. Only the indices of called functions and accessed globals
+    are deferred until the module is encoded. :meth:`build` returns a
+    regular :class:`Function`.
+
+    There is a method for each instruction of WebAssembly 1.0 and of the
+    sign extension proposal. The other instructions (reference types,
+    saturating truncations, bulk memory and SIMD) are appended with
+    :meth:`emit`.
+
+    :meth:`block`, :meth:`loop` and :meth:`if_` return a :class:`Label`,
+    which the branch methods accept instead of a relative depth::
+
+        with fb.block() as exit:
+            with fb.loop() as again:
+                ...
+                fb.br_if(exit)
+                fb.br(again)
+    """
+
+    type: FunctionType
+    local_vars: list[bytes] = field(default_factory=list)
+
+    _code: bytearray = field(default_factory=bytearray)
+    _fixups: list[tuple[int, BaseFunction | BaseGlobal]] = field(default_factory=list)
+    # Open blocks, innermost last
+    _labels: list[Label] = field(default_factory=list)
+
+    def emit(self, *instructions: Node) -> None:
+        """Append already built instruction objects."""
+        for instruction in instructions:
+            if isinstance(instruction, I.End):
+                self.end()
+                continue
+            if isinstance(instruction, I.BlockInstruction):
+                self._labels.append(Label(self, len(self._labels) + 1))
+            I.encode_instruction(self._code, instruction, self._fixups)
+
+    def _ref(self, opcode: int, node: BaseFunction | BaseGlobal) -> None:
+        self._code.append(opcode)
+        self._fixups.append((len(self._code), node))
+
+    def _memarg(self, opcode: int, align: int, offset: int) -> None:
+        self._code.append(opcode)
+        write_unsigned(self._code, align)
+        write_unsigned(self._code, offset)
+
+    def _block(self, opcode: int, block_type: int | TypeIndex) -> Label:
+        self._code.append(opcode)
+        write_blocktype(self._code, block_type)
+        label = Label(self, len(self._labels) + 1)
+        self._labels.append(label)
+        return label
+
+    def _label(self, label: int | Label) -> int:
+        """Return the relative depth of a branch to ``label``."""
+        if isinstance(label, int):
+            return label
+        if label.builder is not self or (
+            self._labels[label.depth - 1 : label.depth] != [label]
+        ):
+            raise Exception("Branch to a block that is not open")
+        return len(self._labels) - label.depth
+
+    unreachable = _op("unreachable")
+    nop = _op("nop")
+
+    def block(self, block_type: int | TypeIndex = 0x40) -> Label:
+        return self._block(0x02, block_type)
+
+    def loop(self, block_type: int | TypeIndex = 0x40) -> Label:
+        return self._block(0x03, block_type)
+
+    def if_(self, block_type: int | TypeIndex = 0x40) -> Label:
+        return self._block(0x04, block_type)
+
+    else_ = _op("else")
+
+    def end(self, label: Label | None = None) -> None:
+        """Close the innermost block, which must be ``label`` if given.
+
+        The final ``end`` of the function body is added by :meth:`build`, so
+        calling this method at the outermost level is a no-op.
+        """
+        if label is not None and self._labels[-1:] != [label]:
+            raise Exception("Blocks must be closed innermost first")
+        if len(self._labels) > 0:
+            self._code.append(0x0B)
+            self._labels.pop()
+
+    def br(self, label: int | Label) -> None:
+        self._code.append(0x0C)
+        write_unsigned(self._code, self._label(label))
+
+    def br_if(self, label: int | Label) -> None:
+        self._code.append(0x0D)
+        write_unsigned(self._code, self._label(label))
+
+    def br_table(self, targets: Sequence[int | Label], default: int | Label) -> None:
+        """Branch to ``targets[i]`` for an operand ``i`` in range, and to
+        ``default`` otherwise."""
+        self._code.append(0x0E)
+        write_unsigned(self._code, len(targets))
+        for target in targets:
+            write_unsigned(self._code, self._label(target))
+        write_unsigned(self._code, self._label(default))
+
+    return_ = _op("return")
+
+    def call(self, function: BaseFunction) -> None:
+        self._ref(0x10, function)
+
+    def call_indirect(self, typeidx: int, tableidx: int = 0) -> None:
+        self._code.append(0x11)
+        write_unsigned(self._code, typeidx)
+        write_unsigned(self._code, tableidx)
+
+    drop = _op("drop")
+    select = _op("select")
+
+    def local_get(self, localidx: int) -> None:
+        self._code.append(0x20)
+        write_unsigned(self._code, localidx)
+
+    def local_set(self, localidx: int) -> None:
+        self._code.append(0x21)
+        write_unsigned(self._code, localidx)
+
+    def local_tee(self, localidx: int) -> None:
+        self._code.append(0x22)
+        write_unsigned(self._code, localidx)
+
+    def global_get(self, global_: BaseGlobal) -> None:
+        self._ref(0x23, global_)
+
+    def global_set(self, global_: BaseGlobal) -> None:
+        self._ref(0x24, global_)
+
+    def table_get(self, tableidx: int) -> None:
+        self._code.append(0x25)
+        write_unsigned(self._code, tableidx)
+
+    def table_set(self, tableidx: int) -> None:
+        self._code.append(0x26)
+        write_unsigned(self._code, tableidx)
+
+    def i32_load(self, align: int = 2, offset: int = 0) -> None:
+        self._memarg(0x28, align, offset)
+
+    def i64_load(self, align: int = 3, offset: int = 0) -> None:
+        self._memarg(0x29, align, offset)
+
+    def f32_load(self, align: int = 2, offset: int = 0) -> None:
+        self._memarg(0x2A, align, offset)
+
+    def f64_load(self, align: int = 3, offset: int = 0) -> None:
+        self._memarg(0x2B, align, offset)
+
+    def i32_load8_s(self, align: int = 0, offset: int = 0) -> None:
+        self._memarg(0x2C, align, offset)
+
+    def i32_load8_u(self, align: int = 0, offset: int = 0) -> None:
+        self._memarg(0x2D, align, offset)
+
+    def i32_load16_s(self, align: int = 1, offset: int = 0) -> None:
+        self._memarg(0x2E, align, offset)
+
+    def i32_load16_u(self, align: int = 1, offset: int = 0) -> None:
+        self._memarg(0x2F, align, offset)
+
+    def i64_load8_s(self, align: int = 0, offset: int = 0) -> None:
+        self._memarg(0x30, align, offset)
+
+    def i64_load8_u(self, align: int = 0, offset: int = 0) -> None:
+        self._memarg(0x31, align, offset)
+
+    def i64_load16_s(self, align: int = 1, offset: int = 0) -> None:
+        self._memarg(0x32, align, offset)
+
+    def i64_load16_u(self, align: int = 1, offset: int = 0) -> None:
+        self._memarg(0x33, align, offset)
+
+    def i64_load32_s(self, align: int = 2, offset: int = 0) -> None:
+        self._memarg(0x34, align, offset)
+
+    def i64_load32_u(self, align: int = 2, offset: int = 0) -> None:
+        self._memarg(0x35, align, offset)
+
+    def i32_store(self, align: int = 2, offset: int = 0) -> None:
+        self._memarg(0x36, align, offset)
+
+    def i64_store(self, align: int = 3, offset: int = 0) -> None:
+        self._memarg(0x37, align, offset)
+
+    def f32_store(self, align: int = 2, offset: int = 0) -> None:
+        self._memarg(0x38, align, offset)
+
+    def f64_store(self, align: int = 3, offset: int = 0) -> None:
+        self._memarg(0x39, align, offset)
+
+    def i32_store8(self, align: int = 0, offset: int = 0) -> None:
+        self._memarg(0x3A, align, offset)
+
+    def i32_store16(self, align: int = 1, offset: int = 0) -> None:
+        self._memarg(0x3B, align, offset)
+
+    def i64_store8(self, align: int = 0, offset: int = 0) -> None:
+        self._memarg(0x3C, align, offset)
+
+    def i64_store16(self, align: int = 1, offset: int = 0) -> None:
+        self._memarg(0x3D, align, offset)
+
+    def i64_store32(self, align: int = 2, offset: int = 0) -> None:
+        self._memarg(0x3E, align, offset)
+
+    def memory_size(self, memidx: int = 0) -> None:
+        self._code.append(0x3F)
+        write_unsigned(self._code, memidx)
+
+    def memory_grow(self, memidx: int = 0) -> None:
+        self._code.append(0x40)
+        write_unsigned(self._code, memidx)
+
+    def i32_const(self, value: int) -> None:
+        self._code.append(0x41)
+        self._code += encode_signed(value)
+
+    def i64_const(self, value: int) -> None:
+        self._code.append(0x42)
+        self._code += encode_signed(value)
+
+    def f32_const(self, value: float) -> None:
+        self._code.append(0x43)
+        self._code += struct.pack("<f", value)
+
+    def f64_const(self, value: float) -> None:
+        self._code.append(0x44)
+        self._code += struct.pack("<d", value)
+
+    i32_eqz = _op("i32.eqz")
+    i32_eq = _op("i32.eq")
+    i32_ne = _op("i32.ne")
+    i32_lt_s = _op("i32.lt_s")
+    i32_lt_u = _op("i32.lt_u")
+    i32_gt_s = _op("i32.gt_s")
+    i32_gt_u = _op("i32.gt_u")
+    i32_le_s = _op("i32.le_s")
+    i32_le_u = _op("i32.le_u")
+    i32_ge_s = _op("i32.ge_s")
+    i32_ge_u = _op("i32.ge_u")
+
+    i64_eqz = _op("i64.eqz")
+    i64_eq = _op("i64.eq")
+    i64_ne = _op("i64.ne")
+    i64_lt_s = _op("i64.lt_s")
+    i64_lt_u = _op("i64.lt_u")
+    i64_gt_s = _op("i64.gt_s")
+    i64_gt_u = _op("i64.gt_u")
+    i64_le_s = _op("i64.le_s")
+    i64_le_u = _op("i64.le_u")
+    i64_ge_s = _op("i64.ge_s")
+    i64_ge_u = _op("i64.ge_u")
+
+    f32_eq = _op("f32.eq")
+    f32_ne = _op("f32.ne")
+    f32_lt = _op("f32.lt")
+    f32_gt = _op("f32.gt")
+    f32_le = _op("f32.le")
+    f32_ge = _op("f32.ge")
+
+    f64_eq = _op("f64.eq")
+    f64_ne = _op("f64.ne")
+    f64_lt = _op("f64.lt")
+    f64_gt = _op("f64.gt")
+    f64_le = _op("f64.le")
+    f64_ge = _op("f64.ge")
+
+    i32_clz = _op("i32.clz")
+    i32_ctz = _op("i32.ctz")
+    i32_popcnt = _op("i32.popcnt")
+    i32_add = _op("i32.add")
+    i32_sub = _op("i32.sub")
+    i32_mul = _op("i32.mul")
+    i32_div_s = _op("i32.div_s")
+    i32_div_u = _op("i32.div_u")
+    i32_rem_s = _op("i32.rem_s")
+    i32_rem_u = _op("i32.rem_u")
+    i32_and = _op("i32.and")
+    i32_or = _op("i32.or")
+    i32_xor = _op("i32.xor")
+    i32_shl = _op("i32.shl")
+    i32_shr_s = _op("i32.shr_s")
+    i32_shr_u = _op("i32.shr_u")
+    i32_rotl = _op("i32.rotl")
+    i32_rotr = _op("i32.rotr")
+
+    i64_clz = _op("i64.clz")
+    i64_ctz = _op("i64.ctz")
+    i64_popcnt = _op("i64.popcnt")
+    i64_add = _op("i64.add")
+    i64_sub = _op("i64.sub")
+    i64_mul = _op("i64.mul")
+    i64_div_s = _op("i64.div_s")
+    i64_div_u = _op("i64.div_u")
+    i64_rem_s = _op("i64.rem_s")
+    i64_rem_u = _op("i64.rem_u")
+    i64_and = _op("i64.and")
+    i64_or = _op("i64.or")
+    i64_xor = _op("i64.xor")
+    i64_shl = _op("i64.shl")
+    i64_shr_s = _op("i64.shr_s")
+    i64_shr_u = _op("i64.shr_u")
+    i64_rotl = _op("i64.rotl")
+    i64_rotr = _op("i64.rotr")
+
+    f32_abs = _op("f32.abs")
+    f32_neg = _op("f32.neg")
+    f32_ceil = _op("f32.ceil")
+    f32_floor = _op("f32.floor")
+    f32_trunc = _op("f32.trunc")
+    f32_nearest = _op("f32.nearest")
+    f32_sqrt = _op("f32.sqrt")
+    f32_add = _op("f32.add")
+    f32_sub = _op("f32.sub")
+    f32_mul = _op("f32.mul")
+    f32_div = _op("f32.div")
+    f32_min = _op("f32.min")
+    f32_max = _op("f32.max")
+    f32_copysign = _op("f32.copysign")
+
+    f64_abs = _op("f64.abs")
+    f64_neg = _op("f64.neg")
+    f64_ceil = _op("f64.ceil")
+    f64_floor = _op("f64.floor")
+    f64_trunc = _op("f64.trunc")
+    f64_nearest = _op("f64.nearest")
+    f64_sqrt = _op("f64.sqrt")
+    f64_add = _op("f64.add")
+    f64_sub = _op("f64.sub")
+    f64_mul = _op("f64.mul")
+    f64_div = _op("f64.div")
+    f64_min = _op("f64.min")
+    f64_max = _op("f64.max")
+    f64_copysign = _op("f64.copysign")
+
+    i32_wrap_i64 = _op("i32.wrap_i64")
+    i32_trunc_f32_s = _op("i32.trunc_f32_s")
+    i32_trunc_f32_u = _op("i32.trunc_f32_u")
+    i32_trunc_f64_s = _op("i32.trunc_f64_s")
+    i32_trunc_f64_u = _op("i32.trunc_f64_u")
+    i64_extend_i32_s = _op("i64.extend_i32_s")
+    i64_extend_i32_u = _op("i64.extend_i32_u")
+    i64_trunc_f32_s = _op("i64.trunc_f32_s")
+    i64_trunc_f32_u = _op("i64.trunc_f32_u")
+    i64_trunc_f64_s = _op("i64.trunc_f64_s")
+    i64_trunc_f64_u = _op("i64.trunc_f64_u")
+    f32_convert_i32_s = _op("f32.convert_i32_s")
+    f32_convert_i32_u = _op("f32.convert_i32_u")
+    f32_convert_i64_s = _op("f32.convert_i64_s")
+    f32_convert_i64_u = _op("f32.convert_i64_u")
+    f32_demote_f64 = _op("f32.demote_f64")
+    f64_convert_i32_s = _op("f64.convert_i32_s")
+    f64_convert_i32_u = _op("f64.convert_i32_u")
+    f64_convert_i64_s = _op("f64.convert_i64_s")
+    f64_convert_i64_u = _op("f64.convert_i64_u")
+    f64_promote_f32 = _op("f64.promote_f32")
+    i32_reinterpret_f32 = _op("i32.reinterpret_f32")
+    i64_reinterpret_f64 = _op("i64.reinterpret_f64")
+    f32_reinterpret_i32 = _op("f32.reinterpret_i32")
+    f64_reinterpret_i64 = _op("f64.reinterpret_i64")
+    i32_extend8_s = _op("i32.extend8_s")
+    i32_extend16_s = _op("i32.extend16_s")
+    i64_extend8_s = _op("i64.extend8_s")
+    i64_extend16_s = _op("i64.extend16_s")
+    i64_extend32_s = _op("i64.extend32_s")
+
+    def build(self) -> Function:
+        """Return a :class:`Function` whose body is the assembled code."""
+        if len(self._labels) != 0:
+            raise Exception(f"Function body has {len(self._labels)} unclosed block(s)")
+        return Function(
+            type=self.type,
+            local_vars=list(self.local_vars),
+            body=[Bytecode(code=bytes(self._code), fixups=list(self._fixups)), I.End()],
         )
-        return bytes(UnsignedInt(value=len(bv))) + bv
@@ -5,7 +5,7 @@
 from dataclasses import dataclass, field
 
 from wasm_gen.core import Node
-from wasm_gen.values import UnsignedInt
+from wasm_gen.values import encode_unsigned
 
 
 @dataclass
@@ -16,9 +16,9 @@ class GlobalType(Node):
 
     def __bytes__(self) -> bytes:
         if self.mutable:
-            return self.type + bytes(UnsignedInt(value=1))
+            return self.type + encode_unsigned(1)
         else:
-            return self.type + bytes(UnsignedInt(value=0))
+            return self.type + encode_unsigned(0)
 
 
 @dataclass
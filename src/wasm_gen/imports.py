@@ -8,7 +8,8 @@ from wasm_gen.core import Node
 from wasm_gen.function import BaseFunction
 from wasm_gen.globals import BaseGlobal
 from wasm_gen.memory import BaseMemory
-from wasm_gen.values import Name, UnsignedInt
+from wasm_gen.table import BaseTable
+from wasm_gen.values import Name, encode_unsigned
 
 func = b"\x00"
 table = b"\x01"
@@ -26,7 +27,9 @@ class Import(Node):
     def __bytes__(self) -> bytes:
         desc = None
         if isinstance(self.node, BaseFunction):
-            desc = func + bytes(UnsignedInt(value=self.node.type._index))
+            desc = func + encode_unsigned(self.node.type._index)
+        elif isinstance(self.node, BaseTable):
+            desc = table + bytes(self.node.type)
         elif isinstance(self.node, BaseMemory):
             desc = mem + bytes(self.node.type)
         elif isinstance(self.node, BaseGlobal):
@@ -2,873 +2,579 @@
 #
 # SPDX-License-Identifier: MIT
 
-from dataclasses import dataclass
-
-from wasm_gen.core import Node
-from wasm_gen.function import BaseFunction
+"""
+Instruction classes.
+
+One frozen dataclass is generated for every row of
+:data:`wasm_gen.opcodes.OPCODES`; its name is the CamelCase version of the
+text format name (``i32.load8_s`` becomes ``I32Load8S``) and its fields are
+the immediates of the instruction. The types of the generated classes are
+described in ``instructions.pyi``, regenerate it with ``just gen-stubs``
+after changing the table.
+"""
+
+import re
+import struct
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from dataclasses import dataclass, field, make_dataclass, replace
+from operator import attrgetter
+from typing import Any, ClassVar, Self, cast
+
+from wasm_gen import opcodes as op
+from wasm_gen.core import BaseData, Node, UnsupportedFeature
+from wasm_gen.function import BaseFunction, Bytecode
 from wasm_gen.globals import BaseGlobal
-from wasm_gen.values import SignedInt, UnsignedInt
-
-
-@dataclass
+from wasm_gen.opcodes import OPCODES, Opcode
+from wasm_gen.values import (
+    TypeIndex,
+    read_blocktype,
+    read_signed,
+    read_unsigned,
+    write_blocktype,
+    write_signed,
+    write_unsigned,
+)
+
+Writer = Callable[[bytearray, Any], None]
+# Decodes an immediate at a position and returns it with the next position
+Reader = Callable[[bytes | memoryview, int], tuple[Any, int]]
+
+# Default value of immediates that must be given
+REQUIRED: Any = object()
+
+
+@dataclass(frozen=True, slots=True)
+class Immediate:
+    """A field of a generated instruction class."""
+
+    name: str
+    type: Any
+    # Annotation written in the stub file
+    stub_type: str
+    writer: Writer
+    reader: Reader
+    default: Any = REQUIRED
+    # The field holds a node whose index is only known once the module
+    # indexes have been computed.
+    ref: bool = False
+
+
+@dataclass(frozen=True, slots=True)
 class Instruction(Node):
-    def __bytes__(self) -> bytes:
-        raise NotImplementedError
-
-
-@dataclass
-class Unreachable(Instruction):
-    def __bytes__(self) -> bytes:
-        return b"\x00"
-
-
-@dataclass
-class Nop(Instruction):
-    def __bytes__(self) -> bytes:
-        return b"\x01"
-
-
-@dataclass
-class BlockInstruction(Instruction):
-    block_type: int = 0x40
-
-
-@dataclass
-class Block(BlockInstruction):
-    def __bytes__(self) -> bytes:
-        return b"\x02" + bytes(UnsignedInt(value=self.block_type))
-
-
-@dataclass
-class Loop(BlockInstruction):
-    def __bytes__(self) -> bytes:
-        return b"\x03" + bytes(UnsignedInt(value=self.block_type))
-
-
-@dataclass
-class If(BlockInstruction):
-    def __bytes__(self) -> bytes:
-        return b"\x04" + bytes(UnsignedInt(value=self.block_type))
-
-
-@dataclass
-class Else(Instruction):
-    def __bytes__(self) -> bytes:
-        return b"\x05"
-
-
-@dataclass
-class End(Instruction):
-    def __bytes__(self) -> bytes:
-        return b"\x0b"
-
-
-@dataclass
-class Br(Instruction):
-
-    label: int
-
-    def __bytes__(self) -> bytes:
-        return b"\x0c" + bytes(UnsignedInt(value=self.label))
-
-
-@dataclass
-class BrIf(Instruction):
-
-    label: int
-
-    def __bytes__(self) -> bytes:
-        return b"\x0d" + bytes(UnsignedInt(value=self.label))
-
-
-@dataclass
-class BrTable(Instruction):
-    def __bytes__(self) -> bytes:
-        return b"\x0e"
-
-
-class Return(Instruction):
-    def __bytes__(self) -> bytes:
-        return b"\x0f"
-
-
-@dataclass
-class Call(Instruction):
-
-    function: BaseFunction
-
-    def __bytes__(self) -> bytes:
-        return b"\x10" + bytes(UnsignedInt(value=self.function._index))
-
-
-@dataclass
-class CallIndirect(Instruction):
-
-    typeidx: int
-    tableidx: int
-
-    def __bytes__(self) -> bytes:
-        return (
-            b"\x11"
-            + bytes(UnsignedInt(value=self.typeidx))
-            + bytes(UnsignedInt(value=self.tableidx))
-        )
-
-
-@dataclass
-class Drop(Instruction):
-    def __bytes__(self) -> bytes:
-        return b"\x1a"
-
-
-@dataclass
-class Select(Instruction):
-    def __bytes__(self) -> bytes:
-        return b"\x1b"
-
-
-@dataclass
-class LocalGet(Instruction):
-
-    localidx: int
-
-    def __bytes__(self) -> bytes:
-        return b"\x20" + bytes(UnsignedInt(value=self.localidx))
-
-
-@dataclass
-class LocalSet(Instruction):
-
-    localidx: int
-
-    def __bytes__(self) -> bytes:
-        return b"\x21" + bytes(UnsignedInt(value=self.localidx))
-
-
-@dataclass
-class LocalTee(Instruction):
-
-    localidx: int
-
-    def __bytes__(self) -> bytes:
-        return b"\x22" + bytes(UnsignedInt(value=self.localidx))
-
-
-@dataclass
-class GlobalGet(Instruction):
-
-    global_: BaseGlobal
-
-    def __bytes__(self) -> bytes:
-        return b"\x23" + bytes(UnsignedInt(value=self.global_._index))
-
-
-@dataclass
-class GlobalSet(Instruction):
-
-    global_: BaseGlobal
-
-    def __bytes__(self) -> bytes:
-        return b"\x24" + bytes(UnsignedInt(value=self.global_._index))
-
-
-@dataclass
-class TableGet(Instruction):
-
-    tableidx: int
-
-    def __bytes__(self) -> bytes:
-        return b"\x25" + bytes(UnsignedInt(value=self.tableidx))
-
-
-@dataclass
-class TableSet(Instruction):
-
-    tableidx: int
-
-    def __bytes__(self) -> bytes:
-        return b"\x26" + bytes(UnsignedInt(value=self.tableidx))
-
-
-@dataclass
-class I32(Instruction):
-
-    align: int = 2
-    offset: int = 0
-
-    def __bytes__(self) -> bytes:
-        raise NotImplementedError
-
-
-@dataclass
-class I32Load(I32):
-    def __bytes__(self) -> bytes:
-        return (
-            b"\x28"
-            + bytes(UnsignedInt(value=self.align))
-            + bytes(UnsignedInt(value=self.offset))
-        )
-
-
-@dataclass
-class I32Load8S(I32):
-    def __bytes__(self) -> bytes:
-        return (
-            b"\x2c"
-            + bytes(UnsignedInt(value=self.align))
-            + bytes(UnsignedInt(value=self.offset))
-        )
-
-
-@dataclass
-class I32Load8U(I32):
-    def __bytes__(self) -> bytes:
-        return (
-            b"\x2d"
-            + bytes(UnsignedInt(value=self.align))
-            + bytes(UnsignedInt(value=self.offset))
-        )
-
-
-@dataclass
-class I32Load16S(I32):
-    def __bytes__(self) -> bytes:
-        return (
-            b"\x2e"
-            + bytes(UnsignedInt(value=self.align))
-            + bytes(UnsignedInt(value=self.offset))
-        )
-
-
-@dataclass
-class I32Load16U(I32):
-    def __bytes__(self) -> bytes:
-        return (
-            b"\x2f"
-            + bytes(UnsignedInt(value=self.align))
-            + bytes(UnsignedInt(value=self.offset))
-        )
-
-
-@dataclass
-class I32Store(I32):
-    def __bytes__(self) -> bytes:
-        return (
-            b"\x36"
-            + bytes(UnsignedInt(value=self.align))
-            + bytes(UnsignedInt(value=self.offset))
-        )
-
-
-@dataclass
-class I32Store8(I32):
-    def __bytes__(self) -> bytes:
-        return (
-            b"\x3a"
-            + bytes(UnsignedInt(value=self.align))
-            + bytes(UnsignedInt(value=self.offset))
-        )
-
-
-@dataclass
-class I32Store16(I32):
-    def __bytes__(self) -> bytes:
-        return (
-            b"\x3b"
-            + bytes(UnsignedInt(value=self.align))
-            + bytes(UnsignedInt(value=self.offset))
-        )
-
-
-@dataclass
-class I32Const(Instruction):
-
-    value: int
-
-    def __bytes__(self) -> bytes:
-        return b"\x41" + bytes(SignedInt(value=self.value))
-
-
-@dataclass
-class I32Eqz(Instruction):
-    def __bytes__(self) -> bytes:
-        return b"\x45"
-
-
-@dataclass
-class I32Eq(Instruction):
-    def __bytes__(self) -> bytes:
-        return b"\x46"
-
-
-@dataclass
-class I32Ne(Instruction):
-    def __bytes__(self) -> bytes:
-        return b"\x47"
-
-
-@dataclass
-class I32LtS(Instruction):
-    def __bytes__(self) -> bytes:
-        return b"\x48"
-
-
-@dataclass
-class I32LtU(Instruction):
-    def __bytes__(self) -> bytes:
-        return b"\x49"
-
-
-@dataclass
-class I32GtS(Instruction):
-    def __bytes__(self) -> bytes:
-        return b"\x4a"
-
-
-@dataclass
-class I32GtU(Instruction):
-    def __bytes__(self) -> bytes:
-        return b"\x4b"
-
-
-@dataclass
-class I32LeS(Instruction):
-    def __bytes__(self) -> bytes:
-        return b"\x4c"
-
-
-@dataclass
-class I32LeU(Instruction):
-    def __bytes__(self) -> bytes:
-        return b"\x4d"
-
-
-@dataclass
-class I32GeS(Instruction):
-    def __bytes__(self) -> bytes:
-        return b"\x4e"
-
-
-@dataclass
-class I32GeU(Instruction):
-    def __bytes__(self) -> bytes:
-        return b"\x4f"
-
-
-@dataclass
-class I32Clz(Instruction):
-    def __bytes__(self) -> bytes:
-        return b"\x67"
-
-
-@dataclass
-class I32Ctz(Instruction):
-    def __bytes__(self) -> bytes:
-        return b"\x68"
-
-
-@dataclass
-class I32Popcnt(Instruction):
-    def __bytes__(self) -> bytes:
-        return b"\x69"
-
-
-@dataclass
-class I32Add(Instruction):
-    def __bytes__(self) -> bytes:
-        return b"\x6a"
-
-
-@dataclass
-class I32Sub(Instruction):
-    def __bytes__(self) -> bytes:
-        return b"\x6b"
-
-
-@dataclass
-class I32Mul(Instruction):
-    def __bytes__(self) -> bytes:
-        return b"\x6c"
+    info: ClassVar[Opcode]
+    # Encoded prefix and opcode
+    opcode: ClassVar[bytes]
+    immediates: ClassVar[tuple[Immediate, ...]]
 
-
-@dataclass
-class I32DivS(Instruction):
-    def __bytes__(self) -> bytes:
-        return b"\x6d"
-
-
-@dataclass
-class I32DivU(Instruction):
-    def __bytes__(self) -> bytes:
-        return b"\x6e"
-
-
-@dataclass
-class I32RemS(Instruction):
-    def __bytes__(self) -> bytes:
-        return b"\x6f"
-
-
-@dataclass
-class I32RemU(Instruction):
-    def __bytes__(self) -> bytes:
-        return b"\x70"
-
-
-@dataclass
-class I32And(Instruction):
-    def __bytes__(self) -> bytes:
-        return b"\x71"
-
-
-@dataclass
-class I32Or(Instruction):
-    def __bytes__(self) -> bytes:
-        return b"\x72"
-
-
-@dataclass
-class I32Xor(Instruction):
-    def __bytes__(self) -> bytes:
-        return b"\x73"
-
-
-@dataclass
-class I32Shl(Instruction):
-    def __bytes__(self) -> bytes:
-        return b"\x74"
-
-
-@dataclass
-class I32ShrS(Instruction):
-    def __bytes__(self) -> bytes:
-        return b"\x75"
-
-
-@dataclass
-class I32ShrU(Instruction):
-    def __bytes__(self) -> bytes:
-        return b"\x76"
-
-
-@dataclass
-class I32Rotl(Instruction):
-    def __bytes__(self) -> bytes:
-        return b"\x77"
-
-
-@dataclass
-class I32Rotr(Instruction):
-    def __bytes__(self) -> bytes:
-        return b"\x78"
-
-
-@dataclass
-class I32WrapI64(Instruction):
-    def __bytes__(self) -> bytes:
-        return b"\xa7"
-
-
-@dataclass
-class I32TruncF32S(Instruction):
-    def __bytes__(self) -> bytes:
-        return b"\xa8"
-
-
-@dataclass
-class I32TruncF32U(Instruction):
-    def __bytes__(self) -> bytes:
-        return b"\xa9"
-
-
-@dataclass
-class I32TruncF64S(Instruction):
-    def __bytes__(self) -> bytes:
-        return b"\xaa"
-
-
-@dataclass
-class I32TruncF64U(Instruction):
-    def __bytes__(self) -> bytes:
-        return b"\xab"
-
-
-@dataclass
-class I32ReinterpretF32(Instruction):
-    def __bytes__(self) -> bytes:
-        return b"\xbc"
-
-
-@dataclass
-class I32Extend8S(Instruction):
-    def __bytes__(self) -> bytes:
-        return b"\xc0"
-
-
-@dataclass
-class I32Extend16S(Instruction):
-    def __bytes__(self) -> bytes:
-        return b"\xc1"
-
-
-@dataclass
-class I64(Instruction):
-
-    align: int
-    offset: int
-
-    def __bytes__(self) -> bytes:
-        raise NotImplementedError
-
-
-@dataclass
-class I64Load(I64):
-    def __bytes__(self) -> bytes:
-        return (
-            b"\x29"
-            + bytes(UnsignedInt(value=self.align))
-            + bytes(UnsignedInt(value=self.offset))
-        )
-
-
-@dataclass
-class I64Load8S(I64):
-    def __bytes__(self) -> bytes:
-        return (
-            b"\x30"
-            + bytes(UnsignedInt(value=self.align))
-            + bytes(UnsignedInt(value=self.offset))
-        )
-
-
-@dataclass
-class I64Load8U(I64):
-    def __bytes__(self) -> bytes:
-        return (
-            b"\x31"
-            + bytes(UnsignedInt(value=self.align))
-            + bytes(UnsignedInt(value=self.offset))
-        )
-
-
-@dataclass
-class I64Load16S(I64):
-    def __bytes__(self) -> bytes:
-        return (
-            b"\x32"
-            + bytes(UnsignedInt(value=self.align))
-            + bytes(UnsignedInt(value=self.offset))
-        )
-
-
-@dataclass
-class I64Load16U(I64):
-    def __bytes__(self) -> bytes:
-        return (
-            b"\x33"
-            + bytes(UnsignedInt(value=self.align))
-            + bytes(UnsignedInt(value=self.offset))
-        )
-
-
-@dataclass
-class I64Load32S(I64):
-    def __bytes__(self) -> bytes:
-        return (
-            b"\x34"
-            + bytes(UnsignedInt(value=self.align))
-            + bytes(UnsignedInt(value=self.offset))
-        )
-
-
-@dataclass
-class I64Load32U(I64):
-    def __bytes__(self) -> bytes:
-        return (
-            b"\x35"
-            + bytes(UnsignedInt(value=self.align))
-            + bytes(UnsignedInt(value=self.offset))
-        )
-
-
-@dataclass
-class I64Store(I64):
-    def __bytes__(self) -> bytes:
-        return (
-            b"\x37"
-            + bytes(UnsignedInt(value=self.align))
-            + bytes(UnsignedInt(value=self.offset))
-        )
-
-
-@dataclass
-class I64Store8(I64):
     def __bytes__(self) -> bytes:
-        return (
-            b"\x3c"
-            + bytes(UnsignedInt(value=self.align))
-            + bytes(UnsignedInt(value=self.offset))
-        )
+        buf = bytearray()
+        encode_body((self,), buf)
+        return bytes(buf)
 
 
-@dataclass
-class I64Store16(I64):
-    def __bytes__(self) -> bytes:
-        return (
-            b"\x3d"
-            + bytes(UnsignedInt(value=self.align))
-            + bytes(UnsignedInt(value=self.offset))
-        )
-
-
-@dataclass
-class I64Store32(I64):
-    def __bytes__(self) -> bytes:
-        return (
-            b"\x3e"
-            + bytes(UnsignedInt(value=self.align))
-            + bytes(UnsignedInt(value=self.offset))
-        )
-
-
-@dataclass
-class I64Const(Instruction):
-
-    value: int
-
-    def __bytes__(self) -> bytes:
-        return b"\x42" + bytes(SignedInt(value=self.value))
-
-
-@dataclass
-class I64Eqz(Instruction):
-    def __bytes__(self) -> bytes:
-        return b"\x50"
-
-
-@dataclass
-class I64Eq(Instruction):
-    def __bytes__(self) -> bytes:
-        return b"\x51"
-
-
-@dataclass
-class I64Ne(Instruction):
-    def __bytes__(self) -> bytes:
-        return b"\x52"
-
-
-@dataclass
-class I64LtS(Instruction):
-    def __bytes__(self) -> bytes:
-        return b"\x53"
-
-
-@dataclass
-class I64LtU(Instruction):
-    def __bytes__(self) -> bytes:
-        return b"\x54"
-
-
-@dataclass
-class I64GtS(Instruction):
-    def __bytes__(self) -> bytes:
-        return b"\x55"
-
-
-@dataclass
-class I64GtU(Instruction):
-    def __bytes__(self) -> bytes:
-        return b"\x56"
-
-
-@dataclass
-class I64LeS(Instruction):
-    def __bytes__(self) -> bytes:
-        return b"\x57"
-
-
-@dataclass
-class I64LeU(Instruction):
-    def __bytes__(self) -> bytes:
-        return b"\x58"
-
-
-@dataclass
-class I64GeS(Instruction):
-    def __bytes__(self) -> bytes:
-        return b"\x59"
-
-
-@dataclass
-class I64GeU(Instruction):
-    def __bytes__(self) -> bytes:
-        return b"\x5a"
-
-
-@dataclass
-class I64Clz(Instruction):
-    def __bytes__(self) -> bytes:
-        return b"\x79"
+@dataclass(frozen=True, slots=True)
+class SimpleInstruction(Instruction):
+    """An instruction without immediates.
 
+    Such instructions carry no state, so each class has a single shared
+    instance (``I.End() is I.End()``) and its encoding is precomputed.
+    """
 
-@dataclass
-class I64Ctz(Instruction):
-    def __bytes__(self) -> bytes:
-        return b"\x7a"
-
-
-@dataclass
-class I64Popcnt(Instruction):
-    def __bytes__(self) -> bytes:
-        return b"\x7b"
-
-
-@dataclass
-class I64Add(Instruction):
-    def __bytes__(self) -> bytes:
-        return b"\x7c"
-
-
-@dataclass
-class I64Sub(Instruction):
-    def __bytes__(self) -> bytes:
-        return b"\x7d"
+    _instance: ClassVar["SimpleInstruction"]
 
+    def __new__(cls) -> Self:
+        instance = cls.__dict__.get("_instance")
+        if instance is None:
+            instance = object.__new__(cls)
+            cls._instance = instance
+        return cast(Self, instance)
 
-@dataclass
-class I64Mul(Instruction):
     def __bytes__(self) -> bytes:
-        return b"\x7e"
-
+        return self.opcode
 
-@dataclass
-class I64DivS(Instruction):
-    def __bytes__(self) -> bytes:
-        return b"\x7f"
 
-
-@dataclass
-class I64DivU(Instruction):
-    def __bytes__(self) -> bytes:
-        return b"\x80"
-
-
-@dataclass
-class I64RemS(Instruction):
-    def __bytes__(self) -> bytes:
-        return b"\x81"
-
-
-@dataclass
-class I64RemU(Instruction):
-    def __bytes__(self) -> bytes:
-        return b"\x82"
-
-
-@dataclass
-class I64And(Instruction):
-    def __bytes__(self) -> bytes:
-        return b"\x83"
-
-
-@dataclass
-class I64Or(Instruction):
-    def __bytes__(self) -> bytes:
-        return b"\x84"
-
-
-@dataclass
-class I64Xor(Instruction):
-    def __bytes__(self) -> bytes:
-        return b"\x85"
+@dataclass(frozen=True, slots=True)
+class BlockInstruction(Instruction):
+    """``block``, ``loop`` and ``if``."""
 
 
-@dataclass
-class I64Shl(Instruction):
-    def __bytes__(self) -> bytes:
-        return b"\x86"
+@dataclass(frozen=True, slots=True)
+class MemoryInstruction(Instruction):
+    """Loads and stores, with ``align`` and ``offset`` immediates."""
 
 
-@dataclass
-class I64ShrS(Instruction):
-    def __bytes__(self) -> bytes:
-        return b"\x87"
+@dataclass(frozen=True, slots=True)
+class I32(MemoryInstruction):
+    pass
 
 
-@dataclass
-class I64ShrU(Instruction):
-    def __bytes__(self) -> bytes:
-        return b"\x88"
+@dataclass(frozen=True, slots=True)
+class I64(MemoryInstruction):
+    pass
 
 
-@dataclass
-class I64Rotl(Instruction):
-    def __bytes__(self) -> bytes:
-        return b"\x89"
+def _write_index(buf: bytearray, node: Any) -> None:
+    write_unsigned(buf, node._index)
 
 
-@dataclass
-class I64Rotr(Instruction):
-    def __bytes__(self) -> bytes:
-        return b"\x8a"
+def _write_labels(buf: bytearray, labels: Sequence[int]) -> None:
+    write_unsigned(buf, len(labels))
+    for label in labels:
+        write_unsigned(buf, label)
 
 
-@dataclass
-class I64ExtendI32S(Instruction):
-    def __bytes__(self) -> bytes:
-        return b"\xac"
+def _read_labels(data: bytes | memoryview, pos: int) -> tuple[tuple[int, ...], int]:
+    n, pos = read_unsigned(data, pos)
+    labels = []
+    for _ in range(n):
+        label, pos = read_unsigned(data, pos)
+        labels.append(label)
+    return tuple(labels), pos
 
 
-@dataclass
-class I64ExtendI32U(Instruction):
-    def __bytes__(self) -> bytes:
-        return b"\xad"
+def _write_f32(buf: bytearray, value: float) -> None:
+    buf += struct.pack("<f", value)
 
 
-@dataclass
-class I64TruncF32S(Instruction):
-    def __bytes__(self) -> bytes:
-        return b"\xae"
+def _read_f32(data: bytes | memoryview, pos: int) -> tuple[float, int]:
+    return struct.unpack_from("<f", data, pos)[0], pos + 4
 
 
-@dataclass
-class I64TruncF32U(Instruction):
-    def __bytes__(self) -> bytes:
-        return b"\xaf"
+def _write_f64(buf: bytearray, value: float) -> None:
+    buf += struct.pack("<d", value)
 
 
-@dataclass
-class I64TruncF64S(Instruction):
-    def __bytes__(self) -> bytes:
-        return b"\xb0"
+def _read_f64(data: bytes | memoryview, pos: int) -> tuple[float, int]:
+    return struct.unpack_from("<d", data, pos)[0], pos + 8
 
 
-@dataclass
-class I64TruncF64U(Instruction):
-    def __bytes__(self) -> bytes:
-        return b"\xb1"
+def _write_lane(buf: bytearray, lane: int) -> None:
+    buf.append(lane)
 
 
-@dataclass
-class I64ReinterpretF64(Instruction):
-    def __bytes__(self) -> bytes:
-        return b"\xbd"
+def _read_lane(data: bytes | memoryview, pos: int) -> tuple[int, int]:
+    return data[pos], pos + 1
 
 
-@dataclass
-class I64Extend8S(Instruction):
-    def __bytes__(self) -> bytes:
-        return b"\xc0"
+def _write_v128(buf: bytearray, value: bytes) -> None:
+    if len(value) != 16:
+        raise Exception(f"A v128 constant has 16 bytes, not {len(value)}")
+    buf += value
 
 
-@dataclass
-class I64Extend16S(Instruction):
-    def __bytes__(self) -> bytes:
-        return b"\xc1"
+def _read_v128(data: bytes | memoryview, pos: int) -> tuple[bytes, int]:
+    return bytes(data[pos : pos + 16]), pos + 16
 
 
-@dataclass
-class I64Extend32S(Instruction):
-    def __bytes__(self) -> bytes:
-        return b"\xc2"
+def _write_shuffle(buf: bytearray, lanes: Sequence[int]) -> None:
+    if len(lanes) != 16:
+        raise Exception(f"A shuffle has 16 lane indices, not {len(lanes)}")
+    buf += bytes(lanes)
+
+
+def _read_shuffle(data: bytes | memoryview, pos: int) -> tuple[tuple[int, ...], int]:
+    return tuple(data[pos : pos + 16]), pos + 16
+
+
+def _write_reftype(buf: bytearray, ref_type: bytes) -> None:
+    buf += ref_type
+
+
+def _read_reftype(data: bytes | memoryview, pos: int) -> tuple[bytes, int]:
+    return bytes(data[pos : pos + 1]), pos + 1
+
+
+def _write_valtypes(buf: bytearray, types: Sequence[bytes]) -> None:
+    write_unsigned(buf, len(types))
+    for t in types:
+        buf += t
+
+
+def _read_valtypes(data: bytes | memoryview, pos: int) -> tuple[tuple[bytes, ...], int]:
+    n, pos = read_unsigned(data, pos)
+    return tuple(bytes(data[i : i + 1]) for i in range(pos, pos + n)), pos + n
+
+
+def _immediates(spec: str, info: Opcode) -> list[Immediate]:
+    name, _, kind = spec.rpartition(":")
+    u = (write_unsigned, read_unsigned)
+    if kind == op.BLOCKTYPE:
+        return [
+            Immediate(
+                name or "block_type",
+                int | TypeIndex,
+                "int | TypeIndex",
+                write_blocktype,
+                read_blocktype,
+                0x40,
+            )
+        ]
+    if kind == op.LABEL:
+        return [Immediate(name or "label", int, "int", *u)]
+    if kind == op.LABELS:
+        return [
+            Immediate(
+                name or "targets",
+                Sequence[int],
+                "Sequence[int]",
+                _write_labels,
+                _read_labels,
+                (),
+            ),
+            Immediate("default", int, "int", *u, 0),
+        ]
+    if kind == op.FUNC:
+        return [
+            Immediate(
+                name or "function",
+                BaseFunction,
+                "BaseFunction",
+                _write_index,
+                read_unsigned,
+                ref=True,
+            )
+        ]
+    if kind == op.TYPE:
+        return [Immediate(name or "typeidx", int, "int", *u)]
+    if kind == op.TABLE:
+        return [Immediate(name or "tableidx", int, "int", *u, 0)]
+    if kind == op.LOCAL:
+        return [Immediate(name or "localidx", int, "int", *u)]
+    if kind == op.GLOBAL:
+        return [
+            Immediate(
+                name or "global_",
+                BaseGlobal,
+                "BaseGlobal",
+                _write_index,
+                read_unsigned,
+                ref=True,
+            )
+        ]
+    if kind == op.MEMARG:
+        return [
+            Immediate("align", int, "int", *u, info.align),
+            Immediate("offset", int, "int", *u, 0),
+        ]
+    if kind == op.MEMIDX:
+        return [Immediate(name or "memidx", int, "int", *u, 0)]
+    if kind in (op.I32, op.I64):
+        return [Immediate(name or "value", int, "int", write_signed, read_signed)]
+    if kind == op.F32:
+        return [Immediate(name or "value", float, "float", _write_f32, _read_f32)]
+    if kind == op.F64:
+        return [Immediate(name or "value", float, "float", _write_f64, _read_f64)]
+    if kind == op.V128:
+        return [Immediate(name or "value", bytes, "bytes", _write_v128, _read_v128)]
+    if kind == op.SHUFFLE:
+        return [
+            Immediate(
+                name or "lanes",
+                Sequence[int],
+                "Sequence[int]",
+                _write_shuffle,
+                _read_shuffle,
+            )
+        ]
+    if kind == op.DATA:
+        return [
+            Immediate(
+                name or "data",
+                BaseData,
+                "BaseData",
+                _write_index,
+                read_unsigned,
+                ref=True,
+            )
+        ]
+    if kind == op.ELEM:
+        return [Immediate(name or "elemidx", int, "int", *u)]
+    if kind == op.LANE:
+        return [Immediate(name or "lane", int, "int", _write_lane, _read_lane)]
+    if kind == op.REFTYPE:
+        return [
+            Immediate(name or "ref_type", bytes, "bytes", _write_reftype, _read_reftype)
+        ]
+    if kind == op.VALTYPES:
+        return [
+            Immediate(
+                name or "types",
+                Sequence[bytes],
+                "Sequence[bytes]",
+                _write_valtypes,
+                _read_valtypes,
+            )
+        ]
+    raise ValueError(f"Unknown immediate kind {kind!r} in {info.name}")
+
+
+def _encoder(code: bytes, immediates: tuple[Immediate, ...]) -> Writer:
+    if len(immediates) == 1:
+        get = attrgetter(immediates[0].name)
+        write = immediates[0].writer
+
+        def encode_one(buf: bytearray, instruction: Any) -> None:
+            buf += code
+            write(buf, get(instruction))
+
+        return encode_one
+
+    writers = tuple((attrgetter(i.name), i.writer) for i in immediates)
+
+    def encode(buf: bytearray, instruction: Any) -> None:
+        buf += code
+        for get, write in writers:
+            write(buf, get(instruction))
+
+    return encode
+
+
+def class_name(name: str) -> str:
+    """Return the class name of an instruction from its text format name."""
+    return "".join(part.capitalize() for part in re.split(r"[._]", name))
+
+
+def _base(info: Opcode) -> type[Instruction]:
+    if len(info.immediates) == 0:
+        return SimpleInstruction
+    if info.immediates == (op.BLOCKTYPE,):
+        return BlockInstruction
+    if op.MEMARG in info.immediates:
+        if info.name.startswith("i32."):
+            return I32
+        if info.name.startswith("i64."):
+            return I64
+        return MemoryInstruction
+    return Instruction
+
+
+# Encoders indexed by instruction class. Instructions without immediates are
+# encoded by their precomputed opcode.
+_ENCODERS: dict[type, bytes | Writer] = {}
+# Getters of the immediates that reference nodes, for the classes that have
+# any.
+_REFS: dict[type, tuple[Callable[[Any], Any], ...]] = {}
+# Instruction classes indexed by opcode, or by (prefix, opcode) for prefixed
+# opcodes.
+_DECODERS: dict[int | tuple[int, int], type[Instruction]] = {}
+
+
+def _define(info: Opcode) -> type[Instruction]:
+    code = info.encoding()
+
+    immediates = tuple(i for spec in info.immediates for i in _immediates(spec, info))
+    fields: list[tuple[str, Any, Any]] = []
+    has_default = False
+    for i in immediates:
+        if i.default is not REQUIRED:
+            has_default = True
+            fields.append((i.name, i.type, field(default=i.default)))
+        else:
+            # Required immediates that follow optional ones (e.g. a lane
+            # index after a memarg) are keyword-only.
+            fields.append((i.name, i.type, field(kw_only=has_default)))
+
+    cls = make_dataclass(
+        class_name(info.name),
+        fields,
+        bases=(_base(info),),
+        namespace={
+            "__doc__": f"``{info.name}``",
+            "info": info,
+            "opcode": code,
+            "immediates": immediates,
+        },
+        frozen=True,
+        slots=True,
+    )
+    cls.__module__ = __name__
+    _ENCODERS[cls] = code if len(immediates) == 0 else _encoder(code, immediates)
+    if any(i.ref for i in immediates):
+        _REFS[cls] = tuple(attrgetter(i.name) for i in immediates if i.ref)
+    key = info.opcode if info.prefix is None else (info.prefix, info.opcode)
+    _DECODERS[key] = cast(type[Instruction], cls)
+    return cast(type[Instruction], cls)
+
+
+for _info in OPCODES:
+    _cls = _define(_info)
+    globals()[_cls.__name__] = _cls
+
+_PREFIXES = frozenset(info.prefix for info in OPCODES if info.prefix is not None)
+_END = _DECODERS[0x0B]
+
+
+def encode_body(body: Iterable[Node], buf: bytearray) -> None:
+    """Append the encoding of a sequence of instructions to ``buf``.
+
+    Generated instructions are encoded through a single lookup in the
+    encoder table; any other node is encoded with ``bytes()``.
+    """
+    encoders = _ENCODERS
+    for instruction in body:
+        encoder = encoders.get(instruction.__class__)
+        if encoder is None:
+            buf += bytes(instruction)
+        elif isinstance(encoder, bytes):
+            buf += encoder
+        else:
+            encoder(buf, instruction)
+
+
+def encode_body_indexed(
+    body: Iterable[Node], buf: bytearray, index: Callable[[Any], int]
+) -> None:
+    """Append the encoding of a sequence of instructions to ``buf`` like
+    :func:`encode_body`, writing ``index(node)`` as the index of each
+    referenced node instead of its ``_index``."""
+    encoders = _ENCODERS
+    refs = _REFS
+    for instruction in body:
+        cls = instruction.__class__
+        if cls in refs:
+            buf += cast(Instruction, instruction).opcode
+            for i in cast(Instruction, instruction).immediates:
+                value = getattr(instruction, i.name)
+                if i.ref:
+                    write_unsigned(buf, index(value))
+                else:
+                    i.writer(buf, value)
+            continue
+        encoder = encoders.get(cls)
+        if encoder is None:
+            if isinstance(instruction, Bytecode):
+                code, pos = instruction.code, 0
+                for offset, node in instruction.fixups:
+                    buf += code[pos:offset]
+                    write_unsigned(buf, index(node))
+                    pos = offset
+                buf += code[pos:]
+            else:
+                buf += bytes(instruction)
+        elif isinstance(encoder, bytes):
+            buf += encoder
+        else:
+            encoder(buf, instruction)
+
+
+def decode_body(
+    data: bytes | memoryview,
+    pos: int,
+    end: int | None,
+    resolve: Callable[[Immediate, int], Any],
+) -> tuple[list[Node], int]:
+    """Decode the instructions of ``data`` from ``pos``.
+
+    Decoding stops at ``end`` or, when ``end`` is None, after the ``end``
+    instruction that closes the expression. The indices of referenced nodes
+    are turned into nodes by ``resolve``. Return the instructions and the
+    position that follows them.
+    """
+    decoders = _DECODERS
+    prefixes = _PREFIXES
+    body: list[Node] = []
+    depth = 0
+    while end is None or pos < end:
+        start = pos
+        key: int | tuple[int, int] = data[pos]
+        pos += 1
+        if key in prefixes:
+            opcode, pos = read_unsigned(data, pos)
+            key = (data[start], opcode)
+        cls = decoders.get(key)
+        if cls is None:
+            raise UnsupportedFeature(f"Unknown opcode {bytes(data[start:pos]).hex()}")
+        if len(cls.immediates) == 0:
+            instruction: Node = cls()
+        else:
+            values = {}
+            for i in cls.immediates:
+                value, pos = i.reader(data, pos)
+                values[i.name] = resolve(i, value) if i.ref else value
+            instruction = cls(**values)
+        body.append(instruction)
+        if isinstance(instruction, BlockInstruction):
+            depth += 1
+        elif cls is _END:
+            if end is None and depth == 0:
+                break
+            depth -= 1
+    return body, pos
+
+
+def iter_refs(body: Iterable[Node]) -> Iterator[Any]:
+    """Yield the nodes (functions, globals, ...) referenced by the
+    instructions of ``body``, in order and with repetitions."""
+    refs = _REFS
+    for instruction in body:
+        getters = refs.get(instruction.__class__)
+        if getters is not None:
+            for get in getters:
+                yield get(instruction)
+        elif isinstance(instruction, Bytecode):
+            for _, node in instruction.fixups:
+                yield node
+
+
+def _placeholder(node: Any) -> Any:
+    if isinstance(node, BaseFunction):
+        return BaseFunction(type=node.type, _index=node._index)
+    if isinstance(node, BaseGlobal):
+        return BaseGlobal(type=node.type, _index=node._index)
+    if isinstance(node, BaseData):
+        return BaseData(_index=node._index)
+    return node
+
+
+def detach_refs(body: Iterable[Node]) -> list[Node]:
+    """Return a copy of ``body`` in which the referenced functions, globals
+    and data segments are replaced by bare nodes that only carry their type
+    and index.
+
+    The copy encodes like ``body`` but can be pickled without dragging along
+    the bodies of every function reachable through calls.
+    """
+    refs = _REFS
+    detached: list[Node] = []
+    for instruction in body:
+        if instruction.__class__ in refs:
+            changes = {
+                i.name: _placeholder(getattr(instruction, i.name))
+                for i in cast(Instruction, instruction).immediates
+                if i.ref
+            }
+            instruction = replace(cast(Any, instruction), **changes)
+        elif isinstance(instruction, Bytecode):
+            instruction = Bytecode(
+                instruction.code,
+                [(offset, _placeholder(n)) for offset, n in instruction.fixups],
+            )
+        detached.append(instruction)
+    return detached
+
+
+def encode_instruction(
+    buf: bytearray, instruction: Node, fixups: list[tuple[int, Any]]
+) -> None:
+    """Append the encoding of ``instruction`` to ``buf``, leaving out the
+    indices of referenced nodes.
+
+    Instead of being written, each referenced node is appended to ``fixups``
+    together with the offset in ``buf`` at which its index belongs.
+    """
+    immediates: tuple[Immediate, ...] = getattr(instruction, "immediates", ())
+    if not any(i.ref for i in immediates):
+        encode_body((instruction,), buf)
+        return
+    buf += cast(Instruction, instruction).opcode
+    for i in immediates:
+        value = getattr(instruction, i.name)
+        if i.ref:
+            fixups.append((len(buf), value))
+        else:
+            i.writer(buf, value)
+
+
+def instruction_classes() -> list[type[Instruction]]:
+    """Return the generated instruction classes, in table order."""
+    return [cast(type[Instruction], c) for c in _ENCODERS]
@@ -0,0 +1,1542 @@
+# SPDX-FileCopyrightText: 2026 Jacques Supcik <jacques.supcik@hefr.ch>
+#
+# SPDX-License-Identifier: MIT
+
+# Generated by `python -m wasm_gen._stubgen`, do not edit.
+
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from dataclasses import KW_ONLY, dataclass
+from typing import Any, ClassVar, Self
+
+from wasm_gen.core import BaseData, Node
+from wasm_gen.function import BaseFunction
+from wasm_gen.globals import BaseGlobal
+from wasm_gen.opcodes import Opcode
+from wasm_gen.values import TypeIndex
+
+Writer = Callable[[bytearray, Any], None]
+Reader = Callable[[bytes | memoryview, int], tuple[Any, int]]
+REQUIRED: Any
+
+@dataclass(frozen=True, slots=True)
+class Immediate:
+    name: str
+    type: Any
+    stub_type: str
+    writer: Writer
+    reader: Reader
+    default: Any = ...
+    ref: bool = ...
+
+@dataclass(frozen=True, slots=True)
+class Instruction(Node):
+    info: ClassVar[Opcode]
+    opcode: ClassVar[bytes]
+    immediates: ClassVar[tuple[Immediate, ...]]
+    def __bytes__(self) -> bytes: ...
+
+@dataclass(frozen=True, slots=True)
+class SimpleInstruction(Instruction):
+    def __new__(cls) -> Self: ...
+
+@dataclass(frozen=True, slots=True)
+class BlockInstruction(Instruction): ...
+
+@dataclass(frozen=True, slots=True)
+class MemoryInstruction(Instruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I32(MemoryInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I64(MemoryInstruction): ...
+
+def class_name(name: str) -> str: ...
+def encode_body(body: Iterable[Node], buf: bytearray) -> None: ...
+def encode_body_indexed(
+    body: Iterable[Node], buf: bytearray, index: Callable[[Any], int]
+) -> None: ...
+def decode_body(
+    data: bytes | memoryview,
+    pos: int,
+    end: int | None,
+    resolve: Callable[[Immediate, int], Any],
+) -> tuple[list[Node], int]: ...
+def iter_refs(body: Iterable[Node]) -> Iterator[Any]: ...
+def detach_refs(body: Iterable[Node]) -> list[Node]: ...
+def encode_instruction(
+    buf: bytearray, instruction: Node, fixups: list[tuple[int, Any]]
+) -> None: ...
+def instruction_classes() -> list[type[Instruction]]: ...
+@dataclass(frozen=True, slots=True)
+class Unreachable(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class Nop(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class Block(BlockInstruction):
+    block_type: int | TypeIndex = ...
+
+@dataclass(frozen=True, slots=True)
+class Loop(BlockInstruction):
+    block_type: int | TypeIndex = ...
+
+@dataclass(frozen=True, slots=True)
+class If(BlockInstruction):
+    block_type: int | TypeIndex = ...
+
+@dataclass(frozen=True, slots=True)
+class Else(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class End(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class Br(Instruction):
+    label: int
+
+@dataclass(frozen=True, slots=True)
+class BrIf(Instruction):
+    label: int
+
+@dataclass(frozen=True, slots=True)
+class BrTable(Instruction):
+    targets: Sequence[int] = ...
+    default: int = ...
+
+@dataclass(frozen=True, slots=True)
+class Return(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class Call(Instruction):
+    function: BaseFunction
+
+@dataclass(frozen=True, slots=True)
+class CallIndirect(Instruction):
+    typeidx: int
+    tableidx: int = ...
+
+@dataclass(frozen=True, slots=True)
+class Drop(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class Select(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class SelectT(Instruction):
+    types: Sequence[bytes]
+
+@dataclass(frozen=True, slots=True)
+class LocalGet(Instruction):
+    localidx: int
+
+@dataclass(frozen=True, slots=True)
+class LocalSet(Instruction):
+    localidx: int
+
+@dataclass(frozen=True, slots=True)
+class LocalTee(Instruction):
+    localidx: int
+
+@dataclass(frozen=True, slots=True)
+class GlobalGet(Instruction):
+    global_: BaseGlobal
+
+@dataclass(frozen=True, slots=True)
+class GlobalSet(Instruction):
+    global_: BaseGlobal
+
+@dataclass(frozen=True, slots=True)
+class TableGet(Instruction):
+    tableidx: int = ...
+
+@dataclass(frozen=True, slots=True)
+class TableSet(Instruction):
+    tableidx: int = ...
+
+@dataclass(frozen=True, slots=True)
+class RefNull(Instruction):
+    ref_type: bytes
+
+@dataclass(frozen=True, slots=True)
+class RefIsNull(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class RefFunc(Instruction):
+    function: BaseFunction
+
+@dataclass(frozen=True, slots=True)
+class I32Load(I32):
+    align: int = ...
+    offset: int = ...
+
+@dataclass(frozen=True, slots=True)
+class I64Load(I64):
+    align: int = ...
+    offset: int = ...
+
+@dataclass(frozen=True, slots=True)
+class F32Load(MemoryInstruction):
+    align: int = ...
+    offset: int = ...
+
+@dataclass(frozen=True, slots=True)
+class F64Load(MemoryInstruction):
+    align: int = ...
+    offset: int = ...
+
+@dataclass(frozen=True, slots=True)
+class I32Load8S(I32):
+    align: int = ...
+    offset: int = ...
+
+@dataclass(frozen=True, slots=True)
+class I32Load8U(I32):
+    align: int = ...
+    offset: int = ...
+
+@dataclass(frozen=True, slots=True)
+class I32Load16S(I32):
+    align: int = ...
+    offset: int = ...
+
+@dataclass(frozen=True, slots=True)
+class I32Load16U(I32):
+    align: int = ...
+    offset: int = ...
+
+@dataclass(frozen=True, slots=True)
+class I64Load8S(I64):
+    align: int = ...
+    offset: int = ...
+
+@dataclass(frozen=True, slots=True)
+class I64Load8U(I64):
+    align: int = ...
+    offset: int = ...
+
+@dataclass(frozen=True, slots=True)
+class I64Load16S(I64):
+    align: int = ...
+    offset: int = ...
+
+@dataclass(frozen=True, slots=True)
+class I64Load16U(I64):
+    align: int = ...
+    offset: int = ...
+
+@dataclass(frozen=True, slots=True)
+class I64Load32S(I64):
+    align: int = ...
+    offset: int = ...
+
+@dataclass(frozen=True, slots=True)
+class I64Load32U(I64):
+    align: int = ...
+    offset: int = ...
+
+@dataclass(frozen=True, slots=True)
+class I32Store(I32):
+    align: int = ...
+    offset: int = ...
+
+@dataclass(frozen=True, slots=True)
+class I64Store(I64):
+    align: int = ...
+    offset: int = ...
+
+@dataclass(frozen=True, slots=True)
+class F32Store(MemoryInstruction):
+    align: int = ...
+    offset: int = ...
+
+@dataclass(frozen=True, slots=True)
+class F64Store(MemoryInstruction):
+    align: int = ...
+    offset: int = ...
+
+@dataclass(frozen=True, slots=True)
+class I32Store8(I32):
+    align: int = ...
+    offset: int = ...
+
+@dataclass(frozen=True, slots=True)
+class I32Store16(I32):
+    align: int = ...
+    offset: int = ...
+
+@dataclass(frozen=True, slots=True)
+class I64Store8(I64):
+    align: int = ...
+    offset: int = ...
+
+@dataclass(frozen=True, slots=True)
+class I64Store16(I64):
+    align: int = ...
+    offset: int = ...
+
+@dataclass(frozen=True, slots=True)
+class I64Store32(I64):
+    align: int = ...
+    offset: int = ...
+
+@dataclass(frozen=True, slots=True)
+class MemorySize(Instruction):
+    memidx: int = ...
+
+@dataclass(frozen=True, slots=True)
+class MemoryGrow(Instruction):
+    memidx: int = ...
+
+@dataclass(frozen=True, slots=True)
+class I32Const(Instruction):
+    value: int
+
+@dataclass(frozen=True, slots=True)
+class I64Const(Instruction):
+    value: int
+
+@dataclass(frozen=True, slots=True)
+class F32Const(Instruction):
+    value: float
+
+@dataclass(frozen=True, slots=True)
+class F64Const(Instruction):
+    value: float
+
+@dataclass(frozen=True, slots=True)
+class I32Eqz(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I32Eq(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I32Ne(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I32LtS(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I32LtU(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I32GtS(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I32GtU(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I32LeS(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I32LeU(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I32GeS(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I32GeU(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I64Eqz(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I64Eq(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I64Ne(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I64LtS(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I64LtU(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I64GtS(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I64GtU(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I64LeS(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I64LeU(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I64GeS(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I64GeU(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F32Eq(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F32Ne(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F32Lt(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F32Gt(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F32Le(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F32Ge(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F64Eq(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F64Ne(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F64Lt(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F64Gt(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F64Le(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F64Ge(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I32Clz(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I32Ctz(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I32Popcnt(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I32Add(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I32Sub(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I32Mul(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I32DivS(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I32DivU(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I32RemS(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I32RemU(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I32And(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I32Or(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I32Xor(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I32Shl(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I32ShrS(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I32ShrU(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I32Rotl(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I32Rotr(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I64Clz(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I64Ctz(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I64Popcnt(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I64Add(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I64Sub(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I64Mul(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I64DivS(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I64DivU(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I64RemS(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I64RemU(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I64And(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I64Or(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I64Xor(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I64Shl(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I64ShrS(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I64ShrU(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I64Rotl(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I64Rotr(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F32Abs(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F32Neg(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F32Ceil(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F32Floor(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F32Trunc(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F32Nearest(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F32Sqrt(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F32Add(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F32Sub(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F32Mul(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F32Div(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F32Min(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F32Max(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F32Copysign(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F64Abs(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F64Neg(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F64Ceil(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F64Floor(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F64Trunc(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F64Nearest(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F64Sqrt(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F64Add(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F64Sub(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F64Mul(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F64Div(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F64Min(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F64Max(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F64Copysign(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I32WrapI64(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I32TruncF32S(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I32TruncF32U(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I32TruncF64S(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I32TruncF64U(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I64ExtendI32S(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I64ExtendI32U(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I64TruncF32S(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I64TruncF32U(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I64TruncF64S(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I64TruncF64U(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F32ConvertI32S(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F32ConvertI32U(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F32ConvertI64S(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F32ConvertI64U(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F32DemoteF64(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F64ConvertI32S(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F64ConvertI32U(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F64ConvertI64S(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F64ConvertI64U(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F64PromoteF32(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I32ReinterpretF32(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I64ReinterpretF64(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F32ReinterpretI32(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F64ReinterpretI64(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I32Extend8S(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I32Extend16S(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I64Extend8S(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I64Extend16S(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I64Extend32S(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I32TruncSatF32S(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I32TruncSatF32U(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I32TruncSatF64S(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I32TruncSatF64U(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I64TruncSatF32S(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I64TruncSatF32U(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I64TruncSatF64S(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I64TruncSatF64U(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class MemoryInit(Instruction):
+    data: BaseData
+    memidx: int = ...
+
+@dataclass(frozen=True, slots=True)
+class DataDrop(Instruction):
+    data: BaseData
+
+@dataclass(frozen=True, slots=True)
+class MemoryCopy(Instruction):
+    dst: int = ...
+    src: int = ...
+
+@dataclass(frozen=True, slots=True)
+class MemoryFill(Instruction):
+    memidx: int = ...
+
+@dataclass(frozen=True, slots=True)
+class TableInit(Instruction):
+    elemidx: int
+    tableidx: int = ...
+
+@dataclass(frozen=True, slots=True)
+class ElemDrop(Instruction):
+    elemidx: int
+
+@dataclass(frozen=True, slots=True)
+class TableCopy(Instruction):
+    dst: int = ...
+    src: int = ...
+
+@dataclass(frozen=True, slots=True)
+class TableGrow(Instruction):
+    tableidx: int = ...
+
+@dataclass(frozen=True, slots=True)
+class TableSize(Instruction):
+    tableidx: int = ...
+
+@dataclass(frozen=True, slots=True)
+class TableFill(Instruction):
+    tableidx: int = ...
+
+@dataclass(frozen=True, slots=True)
+class V128Load(MemoryInstruction):
+    align: int = ...
+    offset: int = ...
+
+@dataclass(frozen=True, slots=True)
+class V128Load8x8S(MemoryInstruction):
+    align: int = ...
+    offset: int = ...
+
+@dataclass(frozen=True, slots=True)
+class V128Load8x8U(MemoryInstruction):
+    align: int = ...
+    offset: int = ...
+
+@dataclass(frozen=True, slots=True)
+class V128Load16x4S(MemoryInstruction):
+    align: int = ...
+    offset: int = ...
+
+@dataclass(frozen=True, slots=True)
+class V128Load16x4U(MemoryInstruction):
+    align: int = ...
+    offset: int = ...
+
+@dataclass(frozen=True, slots=True)
+class V128Load32x2S(MemoryInstruction):
+    align: int = ...
+    offset: int = ...
+
+@dataclass(frozen=True, slots=True)
+class V128Load32x2U(MemoryInstruction):
+    align: int = ...
+    offset: int = ...
+
+@dataclass(frozen=True, slots=True)
+class V128Load8Splat(MemoryInstruction):
+    align: int = ...
+    offset: int = ...
+
+@dataclass(frozen=True, slots=True)
+class V128Load16Splat(MemoryInstruction):
+    align: int = ...
+    offset: int = ...
+
+@dataclass(frozen=True, slots=True)
+class V128Load32Splat(MemoryInstruction):
+    align: int = ...
+    offset: int = ...
+
+@dataclass(frozen=True, slots=True)
+class V128Load64Splat(MemoryInstruction):
+    align: int = ...
+    offset: int = ...
+
+@dataclass(frozen=True, slots=True)
+class V128Store(MemoryInstruction):
+    align: int = ...
+    offset: int = ...
+
+@dataclass(frozen=True, slots=True)
+class V128Const(Instruction):
+    value: bytes
+
+@dataclass(frozen=True, slots=True)
+class I8x16Shuffle(Instruction):
+    lanes: Sequence[int]
+
+@dataclass(frozen=True, slots=True)
+class I8x16Swizzle(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I8x16Splat(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I16x8Splat(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I32x4Splat(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I64x2Splat(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F32x4Splat(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F64x2Splat(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I8x16ExtractLaneS(Instruction):
+    lane: int
+
+@dataclass(frozen=True, slots=True)
+class I8x16ExtractLaneU(Instruction):
+    lane: int
+
+@dataclass(frozen=True, slots=True)
+class I8x16ReplaceLane(Instruction):
+    lane: int
+
+@dataclass(frozen=True, slots=True)
+class I16x8ExtractLaneS(Instruction):
+    lane: int
+
+@dataclass(frozen=True, slots=True)
+class I16x8ExtractLaneU(Instruction):
+    lane: int
+
+@dataclass(frozen=True, slots=True)
+class I16x8ReplaceLane(Instruction):
+    lane: int
+
+@dataclass(frozen=True, slots=True)
+class I32x4ExtractLane(Instruction):
+    lane: int
+
+@dataclass(frozen=True, slots=True)
+class I32x4ReplaceLane(Instruction):
+    lane: int
+
+@dataclass(frozen=True, slots=True)
+class I64x2ExtractLane(Instruction):
+    lane: int
+
+@dataclass(frozen=True, slots=True)
+class I64x2ReplaceLane(Instruction):
+    lane: int
+
+@dataclass(frozen=True, slots=True)
+class F32x4ExtractLane(Instruction):
+    lane: int
+
+@dataclass(frozen=True, slots=True)
+class F32x4ReplaceLane(Instruction):
+    lane: int
+
+@dataclass(frozen=True, slots=True)
+class F64x2ExtractLane(Instruction):
+    lane: int
+
+@dataclass(frozen=True, slots=True)
+class F64x2ReplaceLane(Instruction):
+    lane: int
+
+@dataclass(frozen=True, slots=True)
+class I8x16Eq(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I8x16Ne(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I8x16LtS(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I8x16LtU(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I8x16GtS(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I8x16GtU(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I8x16LeS(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I8x16LeU(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I8x16GeS(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I8x16GeU(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I16x8Eq(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I16x8Ne(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I16x8LtS(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I16x8LtU(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I16x8GtS(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I16x8GtU(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I16x8LeS(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I16x8LeU(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I16x8GeS(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I16x8GeU(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I32x4Eq(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I32x4Ne(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I32x4LtS(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I32x4LtU(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I32x4GtS(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I32x4GtU(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I32x4LeS(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I32x4LeU(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I32x4GeS(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I32x4GeU(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F32x4Eq(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F32x4Ne(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F32x4Lt(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F32x4Gt(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F32x4Le(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F32x4Ge(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F64x2Eq(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F64x2Ne(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F64x2Lt(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F64x2Gt(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F64x2Le(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F64x2Ge(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class V128Not(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class V128And(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class V128Andnot(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class V128Or(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class V128Xor(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class V128Bitselect(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class V128AnyTrue(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class V128Load8Lane(MemoryInstruction):
+    align: int = ...
+    offset: int = ...
+    _: KW_ONLY
+    lane: int
+
+@dataclass(frozen=True, slots=True)
+class V128Load16Lane(MemoryInstruction):
+    align: int = ...
+    offset: int = ...
+    _: KW_ONLY
+    lane: int
+
+@dataclass(frozen=True, slots=True)
+class V128Load32Lane(MemoryInstruction):
+    align: int = ...
+    offset: int = ...
+    _: KW_ONLY
+    lane: int
+
+@dataclass(frozen=True, slots=True)
+class V128Load64Lane(MemoryInstruction):
+    align: int = ...
+    offset: int = ...
+    _: KW_ONLY
+    lane: int
+
+@dataclass(frozen=True, slots=True)
+class V128Store8Lane(MemoryInstruction):
+    align: int = ...
+    offset: int = ...
+    _: KW_ONLY
+    lane: int
+
+@dataclass(frozen=True, slots=True)
+class V128Store16Lane(MemoryInstruction):
+    align: int = ...
+    offset: int = ...
+    _: KW_ONLY
+    lane: int
+
+@dataclass(frozen=True, slots=True)
+class V128Store32Lane(MemoryInstruction):
+    align: int = ...
+    offset: int = ...
+    _: KW_ONLY
+    lane: int
+
+@dataclass(frozen=True, slots=True)
+class V128Store64Lane(MemoryInstruction):
+    align: int = ...
+    offset: int = ...
+    _: KW_ONLY
+    lane: int
+
+@dataclass(frozen=True, slots=True)
+class V128Load32Zero(MemoryInstruction):
+    align: int = ...
+    offset: int = ...
+
+@dataclass(frozen=True, slots=True)
+class V128Load64Zero(MemoryInstruction):
+    align: int = ...
+    offset: int = ...
+
+@dataclass(frozen=True, slots=True)
+class F32x4DemoteF64x2Zero(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F64x2PromoteLowF32x4(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I8x16Abs(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I8x16Neg(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I8x16Popcnt(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I8x16AllTrue(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I8x16Bitmask(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I8x16NarrowI16x8S(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I8x16NarrowI16x8U(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F32x4Ceil(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F32x4Floor(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F32x4Trunc(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F32x4Nearest(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I8x16Shl(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I8x16ShrS(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I8x16ShrU(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I8x16Add(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I8x16AddSatS(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I8x16AddSatU(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I8x16Sub(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I8x16SubSatS(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I8x16SubSatU(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F64x2Ceil(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F64x2Floor(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I8x16MinS(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I8x16MinU(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I8x16MaxS(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I8x16MaxU(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F64x2Trunc(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I8x16AvgrU(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I16x8ExtaddPairwiseI8x16S(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I16x8ExtaddPairwiseI8x16U(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I32x4ExtaddPairwiseI16x8S(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I32x4ExtaddPairwiseI16x8U(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I16x8Abs(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I16x8Neg(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I16x8Q15mulrSatS(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I16x8AllTrue(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I16x8Bitmask(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I16x8NarrowI32x4S(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I16x8NarrowI32x4U(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I16x8ExtendLowI8x16S(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I16x8ExtendHighI8x16S(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I16x8ExtendLowI8x16U(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I16x8ExtendHighI8x16U(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I16x8Shl(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I16x8ShrS(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I16x8ShrU(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I16x8Add(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I16x8AddSatS(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I16x8AddSatU(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I16x8Sub(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I16x8SubSatS(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I16x8SubSatU(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F64x2Nearest(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I16x8Mul(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I16x8MinS(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I16x8MinU(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I16x8MaxS(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I16x8MaxU(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I16x8AvgrU(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I16x8ExtmulLowI8x16S(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I16x8ExtmulHighI8x16S(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I16x8ExtmulLowI8x16U(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I16x8ExtmulHighI8x16U(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I32x4Abs(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I32x4Neg(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I32x4AllTrue(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I32x4Bitmask(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I32x4ExtendLowI16x8S(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I32x4ExtendHighI16x8S(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I32x4ExtendLowI16x8U(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I32x4ExtendHighI16x8U(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I32x4Shl(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I32x4ShrS(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I32x4ShrU(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I32x4Add(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I32x4Sub(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I32x4Mul(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I32x4MinS(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I32x4MinU(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I32x4MaxS(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I32x4MaxU(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I32x4DotI16x8S(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I32x4ExtmulLowI16x8S(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I32x4ExtmulHighI16x8S(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I32x4ExtmulLowI16x8U(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I32x4ExtmulHighI16x8U(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I64x2Abs(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I64x2Neg(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I64x2AllTrue(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I64x2Bitmask(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I64x2ExtendLowI32x4S(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I64x2ExtendHighI32x4S(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I64x2ExtendLowI32x4U(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I64x2ExtendHighI32x4U(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I64x2Shl(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I64x2ShrS(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I64x2ShrU(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I64x2Add(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I64x2Sub(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I64x2Mul(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I64x2Eq(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I64x2Ne(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I64x2LtS(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I64x2GtS(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I64x2LeS(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I64x2GeS(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I64x2ExtmulLowI32x4S(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I64x2ExtmulHighI32x4S(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I64x2ExtmulLowI32x4U(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I64x2ExtmulHighI32x4U(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F32x4Abs(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F32x4Neg(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F32x4Sqrt(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F32x4Add(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F32x4Sub(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F32x4Mul(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F32x4Div(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F32x4Min(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F32x4Max(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F32x4Pmin(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F32x4Pmax(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F64x2Abs(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F64x2Neg(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F64x2Sqrt(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F64x2Add(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F64x2Sub(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F64x2Mul(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F64x2Div(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F64x2Min(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F64x2Max(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F64x2Pmin(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F64x2Pmax(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I32x4TruncSatF32x4S(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I32x4TruncSatF32x4U(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F32x4ConvertI32x4S(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F32x4ConvertI32x4U(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I32x4TruncSatF64x2SZero(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class I32x4TruncSatF64x2UZero(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F64x2ConvertLowI32x4S(SimpleInstruction): ...
+
+@dataclass(frozen=True, slots=True)
+class F64x2ConvertLowI32x4U(SimpleInstruction): ...
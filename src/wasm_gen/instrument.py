@@ -0,0 +1,183 @@
+# SPDX-FileCopyrightText: 2026 Jacques Supcik <jacques.supcik@hefr.ch>
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Opt-in instrumentation of the serialization of modules.
+
+Within :func:`instrument`, every phase of the serialization (computing the
+indexes, building each section and, optionally, encoding each function)
+is reported to a hook::
+
+    report = TableReporter()
+    with instrument(report):
+        data = bytes(module)
+    report.print()
+
+When :mod:`tracemalloc` is tracing, the peak of the memory allocated by each
+phase is reported as well.
+"""
+
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass
+class Phase:
+    """A phase of the serialization.
+
+    ``net_blocks`` is the number of memory blocks allocated by the
+    interpreter during the phase minus the number of blocks it freed, so
+    a phase that frees what it allocates reports 0 however much it
+    allocated. ``peak_bytes`` is the peak of the memory traced by
+    :mod:`tracemalloc` during the phase, above the memory traced when the
+    phase started, or None if tracemalloc was not tracing. ``size`` is the
+    number of bytes emitted by the phase, if it emits any.
+    """
+
+    name: str
+    index: int | None = None
+    seconds: float = 0.0
+    net_blocks: int = 0
+    peak_bytes: int | None = None
+    size: int | None = None
+
+    def label(self) -> str:
+        return self.name if self.index is None else f"{self.name} {self.index}"
+
+
+Hook = Callable[[Phase], None]
+
+_hook: ContextVar[Hook | None] = ContextVar("wasm_gen_hook", default=None)
+_functions: ContextVar[bool] = ContextVar("wasm_gen_functions", default=False)
+# Peak of the traced memory seen by each phase in progress, outermost first.
+# tracemalloc has a single peak, which each phase resets.
+_peaks: ContextVar[list[int]] = ContextVar("wasm_gen_peaks")
+
+
+@contextmanager
+def instrument(hook: Hook, functions: bool = False) -> Iterator[None]:
+    """Report the phases of the serializations done in the context to
+    ``hook``, including the encoding of each function if ``functions`` is
+    true. Functions encoded by worker processes are not reported."""
+    hook_token = _hook.set(hook)
+    functions_token = _functions.set(functions)
+    peaks_token = _peaks.set([])
+    try:
+        yield
+    finally:
+        _peaks.reset(peaks_token)
+        _functions.reset(functions_token)
+        _hook.reset(hook_token)
+
+
+def functions_instrumented() -> bool:
+    return _hook.get() is not None and _functions.get()
+
+
+@contextmanager
+def phase(name: str, index: int | None = None) -> Iterator[Phase | None]:
+    """Measure the enclosed code as a phase, which is None when nothing is
+    instrumented. The code may set the ``size`` of the phase."""
+    hook = _hook.get()
+    if hook is None:
+        yield None
+        return
+    p = Phase(name=name, index=index)
+    peaks = _peaks.get()
+    traced: int | None = None
+    if tracemalloc.is_tracing():
+        traced, peak = tracemalloc.get_traced_memory()
+        peaks[:] = [max(q, peak) for q in peaks]
+        peaks.append(traced)
+        tracemalloc.reset_peak()
+    blocks = sys.getallocatedblocks()
+    start = time.perf_counter()
+    try:
+        yield p
+    finally:
+        p.seconds = time.perf_counter() - start
+        p.net_blocks = sys.getallocatedblocks() - blocks
+        if traced is not None:
+            seen = peaks.pop()
+            if tracemalloc.is_tracing():
+                _, peak = tracemalloc.get_traced_memory()
+                p.peak_bytes = max(seen, peak) - traced
+                peaks[:] = [max(q, peak) for q in peaks]
+                tracemalloc.reset_peak()
+    hook(p)
+
+
+# The reporters import loguru and rich when they are used, so that they do
+# not slow down the import of wasm_gen.
+
+
+@dataclass
+class LogReporter:
+    """Log each phase with loguru."""
+
+    level: str = "DEBUG"
+
+    def __call__(self, p: Phase) -> None:
+        from loguru import logger
+
+        size = "" if p.size is None else f", {p.size} bytes"
+        peak = "" if p.peak_bytes is None else f", {p.peak_bytes} bytes peak"
+        logger.log(
+            self.level,
+            "{}: {:.3f} ms, {} net blocks{}{}",
+            p.label(),
+            p.seconds * 1e3,
+            p.net_blocks,
+            peak,
+            size,
+        )
+
+
+@dataclass
+class TableReporter:
+    """Collect the phases and render them as a rich table."""
+
+    phases: list[Phase] = field(default_factory=list)
+
+    def __call__(self, p: Phase) -> None:
+        self.phases.append(p)
+
+    def table(self) -> Any:
+        from rich.table import Table
+
+        def optional(value: int | None) -> str:
+            return "" if value is None else str(value)
+
+        table = Table("phase", "time (ms)", "net blocks", "peak bytes", "bytes")
+        for p in self.phases:
+            table.add_row(
+                p.label(),
+                f"{p.seconds * 1e3:.3f}",
+                str(p.net_blocks),
+                optional(p.peak_bytes),
+                optional(p.size),
+            )
+        # Functions are part of the code section
+        top = [p for p in self.phases if p.name != "function"]
+        peaks = [p.peak_bytes for p in top if p.peak_bytes is not None]
+        table.add_section()
+        table.add_row(
+            "total",
+            f"{sum(p.seconds for p in top) * 1e3:.3f}",
+            str(sum(p.net_blocks for p in top)),
+            optional(max(peaks, default=None)),
+            str(sum(p.size or 0 for p in top)),
+        )
+        return table
+
+    def print(self) -> None:
+        from rich.console import Console
+
+        Console().print(self.table())
@@ -5,7 +5,7 @@
 from dataclasses import dataclass
 
 from wasm_gen.core import Node
-from wasm_gen.values import UnsignedInt
+from wasm_gen.values import encode_unsigned
 
 
 @dataclass
@@ -15,12 +15,12 @@ class MemoryType(Node):
 
     def __bytes__(self) -> bytes:
         if self.max_pages is None:
-            return b"\x00" + bytes(UnsignedInt(value=self.min_pages))
+            return b"\x00" + encode_unsigned(self.min_pages)
         else:
             return (
                 b"\x01"
-                + bytes(UnsignedInt(value=self.min_pages))
-                + bytes(UnsignedInt(value=self.max_pages))
+                + encode_unsigned(self.min_pages)
+                + encode_unsigned(self.max_pages)
             )
 
 
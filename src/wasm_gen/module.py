@@ -2,31 +2,109 @@
 #
 # SPDX-License-Identifier: MIT
 
-import pickle
+import multiprocessing
+import operator
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import partial
+from typing import Any, BinaryIO, ClassVar
 
-from wasm_gen.core import Node
-from wasm_gen.data import ActiveData
+from wasm_gen import instructions as I  # noqa
+from wasm_gen.core import BaseData, Node
+from wasm_gen.data import ActiveData, Data, PassiveData
 from wasm_gen.exports import Export
-from wasm_gen.function import BaseFunction, Function, FunctionType
+from wasm_gen.function import BaseFunction, Function, FunctionType, TypeTable
 from wasm_gen.globals import BaseGlobal, Global
 from wasm_gen.imports import Import
+from wasm_gen.instrument import functions_instrumented, phase
 from wasm_gen.memory import BaseMemory, Memory
-from wasm_gen.values import UnsignedInt, Vector
+from wasm_gen.table import BaseTable, Table
+from wasm_gen.values import Name, Vector, encode_unsigned
+
+# Number of functions encoded by each task submitted to an executor
+EXECUTOR_CHUNK_SIZE = 256
+
+# Functions of the module being encoded by a worker process of
+# :meth:`Module.code_section`.
+_worker_funcs: list[Function] = []
+
+
+def _init_worker(funcs: list[Function]) -> None:
+    global _worker_funcs
+    _worker_funcs = funcs
+
+
+def _encode_functions(funcs: Sequence[Function | bytes]) -> bytes:
+    # Bytes are code entries that are already encoded
+    return b"".join(
+        c for f in funcs for c in ([f] if isinstance(f, bytes) else f.chunks())
+    )
+
+
+def _detached(f: Function) -> Function | bytes:
+    from wasm_gen.reader import LazyFunction
+
+    if isinstance(f, LazyFunction) and (raw := f.raw_chunks()) is not None:
+        # Sending the body would decode it, its original bytes are valid
+        return b"".join(raw)
+    return Function(
+        type=f.type,
+        local_vars=f.local_vars,
+        local_types=f.local_types,
+        body=I.detach_refs(f.body),
+        _index=f._index,
+    )
+
+
+def _encode_range(bounds: tuple[int, int]) -> bytes:
+    start, stop = bounds
+    return _encode_functions(_worker_funcs[start:stop])
+
+
+def _ranges(n: int, parts: int) -> list[tuple[int, int]]:
+    size = max(1, -(-n // parts))
+    return [(i, min(i + size, n)) for i in range(0, n, size)]
 
 
 @dataclass
 class Section(Node):
 
     section_id: int
-    body: bytes
+    # The body is kept as a list of buffers so that large sections (e.g. the
+    # code section) never have to be concatenated before being written out.
+    body: Sequence[bytes | memoryview]
+
+    def size(self) -> int:
+        return sum(len(b) for b in self.body)
+
+    def chunks(self) -> list[bytes | memoryview]:
+        """Return the section (id, size, body) as a list of buffers."""
+        return [
+            bytes([self.section_id]),
+            encode_unsigned(self.size()),
+            *self.body,
+        ]
 
     def __bytes__(self) -> bytes:
-        return (
-            bytes(bytes([self.section_id]))
-            + bytes(UnsignedInt(value=len(self.body)))
-            + self.body
-        )
+        return b"".join(self.chunks())
+
+
+@dataclass
+class CustomSection(Node):
+    """A custom section, written after the section with id ``after`` (or
+    after the header when ``after`` is 0) or at the end of the module when
+    ``after`` is None."""
+
+    name: str
+    content: bytes | memoryview
+    after: int | None = None
+
+    def section(self) -> Section:
+        return Section(section_id=0, body=[bytes(Name(value=self.name)), self.content])
+
+    def __bytes__(self) -> bytes:
+        return bytes(self.section())
 
 
 @dataclass
@@ -37,30 +115,49 @@ class Module(Node):
     funcs: list[Function] = field(default_factory=list)
     memories: list[Memory] = field(default_factory=list)
     globals_: list[Global] = field(default_factory=list)
-    data: list[bytes | ActiveData] = field(default_factory=list)
+    data: list[bytes | ActiveData | PassiveData] = field(default_factory=list)
+    # Whether to write the data count section, which is needed when
+    # instructions refer to data segments (False then raises ValueError when
+    # encoding such a module); None to find it out.
+    data_count: bool | None = None
+    # Table shared with other modules, see TypeTable
+    type_table: TypeTable | None = None
+    tables: list[Table] = field(default_factory=list)
+    custom_sections: list[CustomSection] = field(default_factory=list)
 
     _types: list[FunctionType] = field(default_factory=list)
+    # Incremented every time the indexes of a module are computed
+    _index_epoch: ClassVar[int] = 0
+
+    @classmethod
+    def from_bytes(cls, data: Any) -> "Module":
+        """Decode a binary module.
+
+        ``data`` may be any object that supports the buffer protocol. Use
+        :class:`~wasm_gen.reader.ModuleReader` to decode only some of the
+        sections.
+        """
+        from wasm_gen.reader import ModuleReader
+
+        return ModuleReader(data).module()
 
     def compute_indexes(self) -> None:
-        types = {}
-        type_index = 0
+        Module._index_epoch += 1
+        types = self.type_table if self.type_table is not None else TypeTable()
         function_index = 0
+        table_index = 0
         memory_index = 0
         global_index = 0
-        self._types = []
 
         for i in self.imports:
             if isinstance(i.node, BaseFunction):
                 f = i.node
-                t = f.type
-                type_sig = pickle.dumps((t.params, t.results))
-                if type_sig not in types:
-                    self._types.append(t)
-                    types[type_sig] = type_index
-                    type_index += 1
-                t._index = types[type_sig]
+                types.add(f.type)
                 f._index = function_index
                 function_index += 1
+            elif isinstance(i.node, BaseTable):
+                i.node._index = table_index
+                table_index += 1
             elif isinstance(i.node, BaseMemory):
                 m = i.node
                 m._index = memory_index
@@ -71,16 +168,14 @@ class Module(Node):
                 global_index += 1
 
         for f in self.funcs:
-            t = f.type
-            type_sig = pickle.dumps((t.params, t.results))
-            if type_sig not in types:
-                self._types.append(t)
-                types[type_sig] = type_index
-                type_index += 1
-            t._index = types[type_sig]
+            types.add(f.type)
             f._index = function_index
             function_index += 1
 
+        for t in self.tables:
+            t._index = table_index
+            table_index += 1
+
         for m in self.memories:
             m._index = memory_index
             memory_index += 1
@@ -89,71 +184,132 @@ class Module(Node):
             g._index = global_index
             global_index += 1
 
+        for data_index, d in enumerate(self.data):
+            if isinstance(d, Data):
+                d._index = data_index
+
+        # A shared table may still grow with the types of other modules
+        self._types = list(types.types)
+
     def type_section(self) -> Section:
-        return Section(
-            section_id=1,
-            body=bytes(
-                Vector(
-                    values=[bytes(t) for t in self._types],
-                )
-            ),
-        )
+        return Section(section_id=1, body=Vector(values=self._types).chunks())
 
     def import_section(self) -> Section:
-        return Section(
-            section_id=2,
-            body=bytes(
-                Vector(
-                    values=[bytes(i) for i in self.imports],
-                )
-            ),
-        )
+        return Section(section_id=2, body=Vector(values=self.imports).chunks())
 
     def function_section(self) -> Section:
         return Section(
             section_id=3,
-            body=bytes(
-                Vector(
-                    values=[
-                        bytes(UnsignedInt(value=f.type._index)) for f in self.funcs
-                    ],
-                )
-            ),
+            body=Vector(
+                values=[encode_unsigned(f.type._index) for f in self.funcs],
+            ).chunks(),
         )
 
+    def table_section(self) -> Section | None:
+        if len(self.tables) == 0:
+            return None
+        return Section(section_id=4, body=Vector(values=self.tables).chunks())
+
     def memory_section(self) -> Section | None:
         if len(self.memories) == 0:
             return None
-        mv = bytes(Vector(values=[bytes(i) for i in self.memories]))
-        return Section(section_id=5, body=mv)
+        return Section(section_id=5, body=Vector(values=self.memories).chunks())
 
     def global_section(self) -> Section | None:
         if len(self.globals_) == 0:
             return None
-        gv = bytes(Vector(values=[bytes(i) for i in self.globals_]))
-        return Section(section_id=6, body=gv)
+        return Section(section_id=6, body=Vector(values=self.globals_).chunks())
 
     def export_section(self) -> Section:
-        return Section(
-            section_id=7,
-            body=bytes(
-                Vector(
-                    values=[bytes(e) for e in self.exports],
+        return Section(section_id=7, body=Vector(values=self.exports).chunks())
+
+    def refers_to_data(self) -> bool:
+        """Tell if an instruction of the module refers to a data segment."""
+        from wasm_gen.reader import DATA_COUNT_SECTION, LazyFunction
+
+        for f in self.funcs:
+            if isinstance(f, LazyFunction) and f.raw_code() is not None:
+                # A body that was not decoded yet can only refer to data
+                # segments if its binary has a data count section.
+                if f.reader is not None and DATA_COUNT_SECTION in f.reader.sections:
+                    return True
+            elif any(isinstance(n, BaseData) for n in I.iter_refs(f.body)):
+                return True
+        return False
+
+    def data_count_section(self) -> Section | None:
+        if self.data_count is False:
+            if self.refers_to_data():
+                raise ValueError(
+                    "The data count section is required by the instructions "
+                    "that refer to data segments"
                 )
-            ),
-        )
+            return None
+        if len(self.data) == 0:
+            return None
+        if self.data_count is None and not self.refers_to_data():
+            return None
+        return Section(section_id=12, body=[encode_unsigned(len(self.data))])
 
-    def code_section(self) -> Section:
-        return Section(
-            section_id=10, body=bytes(Vector(values=[bytes(f) for f in self.funcs]))
-        )
+    def code_section(
+        self, workers: int | None = None, executor: Executor | None = None
+    ) -> Section:
+        """Build the code section.
+
+        With ``workers`` greater than one, the functions are encoded in that
+        many processes; with an ``executor``, they are encoded by its
+        workers. In both cases the functions are split into contiguous
+        chunks whose encodings are reassembled in order, so the section is
+        identical to the one built serially. :meth:`compute_indexes` must
+        have been called.
+        """
+        body = [encode_unsigned(len(self.funcs))]
+        if executor is not None:
+            funcs: Sequence[Function | bytes] = self.funcs
+            if not isinstance(executor, ThreadPoolExecutor):
+                # The functions are probably pickled to reach the workers
+                funcs = [_detached(f) for f in self.funcs]
+            chunks = [
+                funcs[i : i + EXECUTOR_CHUNK_SIZE]
+                for i in range(0, len(funcs), EXECUTOR_CHUNK_SIZE)
+            ]
+            body.extend(executor.map(_encode_functions, chunks))
+        elif workers is not None and workers > 1 and len(self.funcs) > 1:
+            # With fork, the workers inherit the functions (and their
+            # resolved indexes) instead of receiving them pickled.
+            methods = multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context("fork" if "fork" in methods else None)
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=context,
+                initializer=_init_worker,
+                initargs=(self.funcs,),
+            ) as pool:
+                body.extend(
+                    pool.map(_encode_range, _ranges(len(self.funcs), 4 * workers))
+                )
+        elif functions_instrumented():
+            for f in self.funcs:
+                with phase("function", f._index) as p:
+                    encoded = f.chunks()
+                    if p is not None:
+                        p.size = sum(len(c) for c in encoded)
+                body.extend(encoded)
+        else:
+            for f in self.funcs:
+                body.extend(f.chunks())
+        return Section(section_id=10, body=body)
 
     def data_section(self) -> Section | None:
         if len(self.data) == 0:
             return None
-
-        dv = bytes(Vector(values=[bytes(i) for i in self.data]))
-        return Section(section_id=11, body=dv)
+        body: list[bytes | memoryview] = [encode_unsigned(len(self.data))]
+        for d in self.data:
+            if isinstance(d, Data):
+                body.extend(d.chunks())
+            else:
+                body.append(d)
+        return Section(section_id=11, body=body)
 
     def magic(self) -> bytes:
         return b"\0asm"
@@ -161,6 +317,13 @@ class Module(Node):
     def write_version(self) -> bytes:
         return self.version.to_bytes(4, "little")
 
+    def header(self) -> list[bytes]:
+        with phase("header") as p:
+            header = [self.magic(), self.write_version()]
+            if p is not None:
+                p.size = sum(len(c) for c in header)
+        return header
+
     def add_import(self, import_: Import) -> None:
         self.imports.append(import_)
 
@@ -176,20 +339,88 @@ class Module(Node):
     def add_data(self, data: bytes) -> None:
         self.data.append(data)
 
+    def sections(
+        self, workers: int | None = None, executor: Executor | None = None
+    ) -> Iterator[Section]:
+        """Yield the sections of the module in binary order.
+
+        Sections are built one at a time, so a consumer that writes each
+        section out before asking for the next one only ever holds a single
+        section in memory. ``workers`` and ``executor`` are passed to
+        :meth:`code_section`. :meth:`compute_indexes` must have been called.
+        """
+        builders: list[tuple[str, int, Callable[[], Section | None]]] = [
+            ("type", 1, self.type_section),
+            ("import", 2, self.import_section),
+            ("function", 3, self.function_section),
+            ("table", 4, self.table_section),
+            ("memory", 5, self.memory_section),
+            ("global", 6, self.global_section),
+            ("export", 7, self.export_section),
+            ("data count", 12, self.data_count_section),
+            ("code", 10, partial(self.code_section, workers, executor)),
+            ("data", 11, self.data_section),
+        ]
+        ids = {0, *(section_id for _, section_id, _ in builders)}
+        yield from self._custom_sections(lambda after: after == 0)
+        for name, section_id, build in builders:
+            with phase(f"{name} section") as p:
+                s = build()
+                if p is not None and s is not None:
+                    p.size = sum(len(c) for c in s.chunks())
+            if s is not None:
+                yield s
+            yield from self._custom_sections(partial(operator.eq, section_id))
+        # At the end, or after a section that the module does not write
+        yield from self._custom_sections(lambda after: after not in ids)
+
+    def _custom_sections(
+        self, placed_after: Callable[[int | None], bool]
+    ) -> Iterator[Section]:
+        for custom in self.custom_sections:
+            if placed_after(custom.after):
+                with phase("custom section") as p:
+                    s = custom.section()
+                    if p is not None:
+                        p.size = sum(len(c) for c in s.chunks())
+                yield s
+
+    def iter_chunks(
+        self, workers: int | None = None, executor: Executor | None = None
+    ) -> Iterator[bytes | memoryview]:
+        """Yield the binary module as a sequence of buffers.
+
+        The concatenation of the yielded buffers is the module. They are
+        meant to be handed as-is to ``writelines`` or ``os.writev``. See
+        :meth:`code_section` for ``workers`` and ``executor``.
+        """
+        with phase("compute_indexes"):
+            self.compute_indexes()
+        yield from self.header()
+        for section in self.sections(workers, executor):
+            yield from section.chunks()
+
+    def to_bytes(
+        self, workers: int | None = None, executor: Executor | None = None
+    ) -> bytes:
+        """Return the binary module, encoding the functions in parallel
+        with ``workers`` processes or with ``executor``."""
+        return b"".join(self.iter_chunks(workers, executor))
+
+    def write_to(
+        self,
+        stream: BinaryIO,
+        workers: int | None = None,
+        executor: Executor | None = None,
+    ) -> int:
+        """Write the binary module to ``stream`` and return the number of
+        bytes written. See :meth:`code_section` for ``workers`` and
+        ``executor``."""
+        written = 0
+        for chunk in self.iter_chunks(workers, executor):
+            stream.write(chunk)
+            written += len(chunk)
+        return written
+
     def __bytes__(self) -> bytes:
-        self.compute_indexes()
-        res = b""
-        res += self.magic()
-        res += self.write_version()
-        res += bytes(self.type_section())  # 1
-        res += bytes(self.import_section())  # 2
-        res += bytes(self.function_section())  # 3
-        if (s := self.memory_section()) is not None:
-            res += bytes(s)  # 5
-        if (s := self.global_section()) is not None:
-            res += bytes(s)  # 6
-        res += bytes(self.export_section())  # 7
-        res += bytes(self.code_section())  # 10
-        if (s := self.data_section()) is not None:
-            res += bytes(s)  # 11
-        return res
+        return b"".join(self.iter_chunks())
@@ -0,0 +1,583 @@
+# SPDX-FileCopyrightText: 2026 Jacques Supcik <jacques.supcik@hefr.ch>
+#
+# SPDX-License-Identifier: MIT
+
+"""
+The WebAssembly instruction set as data.
+
+Every row of :data:`OPCODES` describes one instruction: its text format
+name, its prefix byte (``None`` for single byte opcodes), its opcode, the
+kinds of its immediates and its stack effect. The instruction classes of
+:mod:`wasm_gen.instructions` and their encoders are generated from this
+table, so adding an instruction family is a matter of adding rows.
+
+Immediate kinds are listed in binary order. A kind may be prefixed with a
+field name (``"dst:table"``) when the default field name of the kind would
+be ambiguous.
+"""
+
+from dataclasses import dataclass
+
+from wasm_gen.values import encode_unsigned
+
+# Immediate kinds
+BLOCKTYPE = "blocktype"  # block_type: int | TypeIndex = 0x40
+LABEL = "label"  # label: int
+LABELS = "labels"  # targets: Sequence[int] = (), default: int = 0
+FUNC = "func"  # function: BaseFunction
+TYPE = "type"  # typeidx: int
+TABLE = "table"  # tableidx: int = 0
+LOCAL = "local"  # localidx: int
+GLOBAL = "global"  # global_: BaseGlobal
+MEMARG = "memarg"  # align: int = <natural alignment>, offset: int = 0
+MEMIDX = "memidx"  # memidx: int = 0
+I32 = "i32"  # value: int
+I64 = "i64"  # value: int
+F32 = "f32"  # value: float
+F64 = "f64"  # value: float
+V128 = "v128"  # value: bytes (16 bytes, little endian)
+SHUFFLE = "shuffle"  # lanes: Sequence[int] (16 lane indices)
+LANE = "lane"  # lane: int
+DATA = "data"  # data: BaseData
+ELEM = "elem"  # elemidx: int
+REFTYPE = "reftype"  # ref_type: bytes
+VALTYPES = "valtypes"  # types: Sequence[bytes]
+
+# Prefix of the saturating truncations and of the bulk memory and table
+# instructions
+MISC = 0xFC
+# Prefix of the vector instructions
+SIMD = 0xFD
+
+
+@dataclass(frozen=True, slots=True)
+class Opcode:
+    name: str
+    prefix: int | None
+    opcode: int
+    immediates: tuple[str, ...] = ()
+    # "params -> results", e.g. "i32 i32 -> i32", or None when the effect
+    # depends on the immediates or on the context (calls, locals, ...).
+    stack: str | None = "->"
+    # Natural alignment (log2 of the access size) of memory instructions.
+    align: int = 0
+
+    def encoding(self) -> bytes:
+        """Return the encoded prefix and opcode.
+
+        Prefixed opcodes are LEB128 encoded, the others are a single byte.
+        """
+        if self.prefix is None:
+            return bytes([self.opcode])
+        return bytes([self.prefix]) + encode_unsigned(self.opcode)
+
+    @property
+    def stack_effect(self) -> tuple[tuple[str, ...], tuple[str, ...]] | None:
+        """Return the stack effect as ``(params, results)`` tuples."""
+        if self.stack is None:
+            return None
+        params, results = self.stack.split("->")
+        return tuple(params.split()), tuple(results.split())
+
+
+def _mem(name: str, opcode: int, align: int, stack: str) -> Opcode:
+    return Opcode(name, None, opcode, (MEMARG,), stack, align)
+
+
+def _simd(
+    name: str,
+    opcode: int,
+    stack: str = "v128 v128 -> v128",
+    immediates: tuple[str, ...] = (),
+) -> Opcode:
+    return Opcode(name, SIMD, opcode, immediates, stack)
+
+
+def _simd_mem(
+    name: str, opcode: int, align: int, stack: str, lane: bool = False
+) -> Opcode:
+    immediates = (MEMARG, LANE) if lane else (MEMARG,)
+    return Opcode(name, SIMD, opcode, immediates, stack, align)
+
+
+# fmt: off
+OPCODES: tuple[Opcode, ...] = (
+    # Control instructions
+    Opcode("unreachable", None, 0x00, (), None),
+    Opcode("nop", None, 0x01),
+    Opcode("block", None, 0x02, (BLOCKTYPE,), None),
+    Opcode("loop", None, 0x03, (BLOCKTYPE,), None),
+    Opcode("if", None, 0x04, (BLOCKTYPE,), None),
+    Opcode("else", None, 0x05, (), None),
+    Opcode("end", None, 0x0B, (), None),
+    Opcode("br", None, 0x0C, (LABEL,), None),
+    Opcode("br_if", None, 0x0D, (LABEL,), None),
+    Opcode("br_table", None, 0x0E, (LABELS,), None),
+    Opcode("return", None, 0x0F, (), None),
+    Opcode("call", None, 0x10, (FUNC,), None),
+    Opcode("call_indirect", None, 0x11, (TYPE, TABLE), None),
+    # Parametric instructions
+    Opcode("drop", None, 0x1A, (), None),
+    Opcode("select", None, 0x1B, (), None),
+    # select with a type annotation, which ``select`` is in the text format
+    Opcode("select_t", None, 0x1C, (VALTYPES,), None),
+    # Variable instructions
+    Opcode("local.get", None, 0x20, (LOCAL,), None),
+    Opcode("local.set", None, 0x21, (LOCAL,), None),
+    Opcode("local.tee", None, 0x22, (LOCAL,), None),
+    Opcode("global.get", None, 0x23, (GLOBAL,), None),
+    Opcode("global.set", None, 0x24, (GLOBAL,), None),
+    # Table instructions
+    Opcode("table.get", None, 0x25, (TABLE,), None),
+    Opcode("table.set", None, 0x26, (TABLE,), None),
+    # Reference instructions
+    Opcode("ref.null", None, 0xD0, (REFTYPE,), None),
+    Opcode("ref.is_null", None, 0xD1, (), None),
+    Opcode("ref.func", None, 0xD2, (FUNC,), "-> funcref"),
+    # Memory instructions
+    _mem("i32.load", 0x28, 2, "i32 -> i32"),
+    _mem("i64.load", 0x29, 3, "i32 -> i64"),
+    _mem("f32.load", 0x2A, 2, "i32 -> f32"),
+    _mem("f64.load", 0x2B, 3, "i32 -> f64"),
+    _mem("i32.load8_s", 0x2C, 0, "i32 -> i32"),
+    _mem("i32.load8_u", 0x2D, 0, "i32 -> i32"),
+    _mem("i32.load16_s", 0x2E, 1, "i32 -> i32"),
+    _mem("i32.load16_u", 0x2F, 1, "i32 -> i32"),
+    _mem("i64.load8_s", 0x30, 0, "i32 -> i64"),
+    _mem("i64.load8_u", 0x31, 0, "i32 -> i64"),
+    _mem("i64.load16_s", 0x32, 1, "i32 -> i64"),
+    _mem("i64.load16_u", 0x33, 1, "i32 -> i64"),
+    _mem("i64.load32_s", 0x34, 2, "i32 -> i64"),
+    _mem("i64.load32_u", 0x35, 2, "i32 -> i64"),
+    _mem("i32.store", 0x36, 2, "i32 i32 ->"),
+    _mem("i64.store", 0x37, 3, "i32 i64 ->"),
+    _mem("f32.store", 0x38, 2, "i32 f32 ->"),
+    _mem("f64.store", 0x39, 3, "i32 f64 ->"),
+    _mem("i32.store8", 0x3A, 0, "i32 i32 ->"),
+    _mem("i32.store16", 0x3B, 1, "i32 i32 ->"),
+    _mem("i64.store8", 0x3C, 0, "i32 i64 ->"),
+    _mem("i64.store16", 0x3D, 1, "i32 i64 ->"),
+    _mem("i64.store32", 0x3E, 2, "i32 i64 ->"),
+    Opcode("memory.size", None, 0x3F, (MEMIDX,), "-> i32"),
+    Opcode("memory.grow", None, 0x40, (MEMIDX,), "i32 -> i32"),
+    # Numeric instructions
+    Opcode("i32.const", None, 0x41, (I32,), "-> i32"),
+    Opcode("i64.const", None, 0x42, (I64,), "-> i64"),
+    Opcode("f32.const", None, 0x43, (F32,), "-> f32"),
+    Opcode("f64.const", None, 0x44, (F64,), "-> f64"),
+
+    Opcode("i32.eqz", None, 0x45, (), "i32 -> i32"),
+    Opcode("i32.eq", None, 0x46, (), "i32 i32 -> i32"),
+    Opcode("i32.ne", None, 0x47, (), "i32 i32 -> i32"),
+    Opcode("i32.lt_s", None, 0x48, (), "i32 i32 -> i32"),
+    Opcode("i32.lt_u", None, 0x49, (), "i32 i32 -> i32"),
+    Opcode("i32.gt_s", None, 0x4A, (), "i32 i32 -> i32"),
+    Opcode("i32.gt_u", None, 0x4B, (), "i32 i32 -> i32"),
+    Opcode("i32.le_s", None, 0x4C, (), "i32 i32 -> i32"),
+    Opcode("i32.le_u", None, 0x4D, (), "i32 i32 -> i32"),
+    Opcode("i32.ge_s", None, 0x4E, (), "i32 i32 -> i32"),
+    Opcode("i32.ge_u", None, 0x4F, (), "i32 i32 -> i32"),
+
+    Opcode("i64.eqz", None, 0x50, (), "i64 -> i32"),
+    Opcode("i64.eq", None, 0x51, (), "i64 i64 -> i32"),
+    Opcode("i64.ne", None, 0x52, (), "i64 i64 -> i32"),
+    Opcode("i64.lt_s", None, 0x53, (), "i64 i64 -> i32"),
+    Opcode("i64.lt_u", None, 0x54, (), "i64 i64 -> i32"),
+    Opcode("i64.gt_s", None, 0x55, (), "i64 i64 -> i32"),
+    Opcode("i64.gt_u", None, 0x56, (), "i64 i64 -> i32"),
+    Opcode("i64.le_s", None, 0x57, (), "i64 i64 -> i32"),
+    Opcode("i64.le_u", None, 0x58, (), "i64 i64 -> i32"),
+    Opcode("i64.ge_s", None, 0x59, (), "i64 i64 -> i32"),
+    Opcode("i64.ge_u", None, 0x5A, (), "i64 i64 -> i32"),
+
+    Opcode("f32.eq", None, 0x5B, (), "f32 f32 -> i32"),
+    Opcode("f32.ne", None, 0x5C, (), "f32 f32 -> i32"),
+    Opcode("f32.lt", None, 0x5D, (), "f32 f32 -> i32"),
+    Opcode("f32.gt", None, 0x5E, (), "f32 f32 -> i32"),
+    Opcode("f32.le", None, 0x5F, (), "f32 f32 -> i32"),
+    Opcode("f32.ge", None, 0x60, (), "f32 f32 -> i32"),
+
+    Opcode("f64.eq", None, 0x61, (), "f64 f64 -> i32"),
+    Opcode("f64.ne", None, 0x62, (), "f64 f64 -> i32"),
+    Opcode("f64.lt", None, 0x63, (), "f64 f64 -> i32"),
+    Opcode("f64.gt", None, 0x64, (), "f64 f64 -> i32"),
+    Opcode("f64.le", None, 0x65, (), "f64 f64 -> i32"),
+    Opcode("f64.ge", None, 0x66, (), "f64 f64 -> i32"),
+
+    Opcode("i32.clz", None, 0x67, (), "i32 -> i32"),
+    Opcode("i32.ctz", None, 0x68, (), "i32 -> i32"),
+    Opcode("i32.popcnt", None, 0x69, (), "i32 -> i32"),
+    Opcode("i32.add", None, 0x6A, (), "i32 i32 -> i32"),
+    Opcode("i32.sub", None, 0x6B, (), "i32 i32 -> i32"),
+    Opcode("i32.mul", None, 0x6C, (), "i32 i32 -> i32"),
+    Opcode("i32.div_s", None, 0x6D, (), "i32 i32 -> i32"),
+    Opcode("i32.div_u", None, 0x6E, (), "i32 i32 -> i32"),
+    Opcode("i32.rem_s", None, 0x6F, (), "i32 i32 -> i32"),
+    Opcode("i32.rem_u", None, 0x70, (), "i32 i32 -> i32"),
+    Opcode("i32.and", None, 0x71, (), "i32 i32 -> i32"),
+    Opcode("i32.or", None, 0x72, (), "i32 i32 -> i32"),
+    Opcode("i32.xor", None, 0x73, (), "i32 i32 -> i32"),
+    Opcode("i32.shl", None, 0x74, (), "i32 i32 -> i32"),
+    Opcode("i32.shr_s", None, 0x75, (), "i32 i32 -> i32"),
+    Opcode("i32.shr_u", None, 0x76, (), "i32 i32 -> i32"),
+    Opcode("i32.rotl", None, 0x77, (), "i32 i32 -> i32"),
+    Opcode("i32.rotr", None, 0x78, (), "i32 i32 -> i32"),
+
+    Opcode("i64.clz", None, 0x79, (), "i64 -> i64"),
+    Opcode("i64.ctz", None, 0x7A, (), "i64 -> i64"),
+    Opcode("i64.popcnt", None, 0x7B, (), "i64 -> i64"),
+    Opcode("i64.add", None, 0x7C, (), "i64 i64 -> i64"),
+    Opcode("i64.sub", None, 0x7D, (), "i64 i64 -> i64"),
+    Opcode("i64.mul", None, 0x7E, (), "i64 i64 -> i64"),
+    Opcode("i64.div_s", None, 0x7F, (), "i64 i64 -> i64"),
+    Opcode("i64.div_u", None, 0x80, (), "i64 i64 -> i64"),
+    Opcode("i64.rem_s", None, 0x81, (), "i64 i64 -> i64"),
+    Opcode("i64.rem_u", None, 0x82, (), "i64 i64 -> i64"),
+    Opcode("i64.and", None, 0x83, (), "i64 i64 -> i64"),
+    Opcode("i64.or", None, 0x84, (), "i64 i64 -> i64"),
+    Opcode("i64.xor", None, 0x85, (), "i64 i64 -> i64"),
+    Opcode("i64.shl", None, 0x86, (), "i64 i64 -> i64"),
+    Opcode("i64.shr_s", None, 0x87, (), "i64 i64 -> i64"),
+    Opcode("i64.shr_u", None, 0x88, (), "i64 i64 -> i64"),
+    Opcode("i64.rotl", None, 0x89, (), "i64 i64 -> i64"),
+    Opcode("i64.rotr", None, 0x8A, (), "i64 i64 -> i64"),
+
+    Opcode("f32.abs", None, 0x8B, (), "f32 -> f32"),
+    Opcode("f32.neg", None, 0x8C, (), "f32 -> f32"),
+    Opcode("f32.ceil", None, 0x8D, (), "f32 -> f32"),
+    Opcode("f32.floor", None, 0x8E, (), "f32 -> f32"),
+    Opcode("f32.trunc", None, 0x8F, (), "f32 -> f32"),
+    Opcode("f32.nearest", None, 0x90, (), "f32 -> f32"),
+    Opcode("f32.sqrt", None, 0x91, (), "f32 -> f32"),
+    Opcode("f32.add", None, 0x92, (), "f32 f32 -> f32"),
+    Opcode("f32.sub", None, 0x93, (), "f32 f32 -> f32"),
+    Opcode("f32.mul", None, 0x94, (), "f32 f32 -> f32"),
+    Opcode("f32.div", None, 0x95, (), "f32 f32 -> f32"),
+    Opcode("f32.min", None, 0x96, (), "f32 f32 -> f32"),
+    Opcode("f32.max", None, 0x97, (), "f32 f32 -> f32"),
+    Opcode("f32.copysign", None, 0x98, (), "f32 f32 -> f32"),
+
+    Opcode("f64.abs", None, 0x99, (), "f64 -> f64"),
+    Opcode("f64.neg", None, 0x9A, (), "f64 -> f64"),
+    Opcode("f64.ceil", None, 0x9B, (), "f64 -> f64"),
+    Opcode("f64.floor", None, 0x9C, (), "f64 -> f64"),
+    Opcode("f64.trunc", None, 0x9D, (), "f64 -> f64"),
+    Opcode("f64.nearest", None, 0x9E, (), "f64 -> f64"),
+    Opcode("f64.sqrt", None, 0x9F, (), "f64 -> f64"),
+    Opcode("f64.add", None, 0xA0, (), "f64 f64 -> f64"),
+    Opcode("f64.sub", None, 0xA1, (), "f64 f64 -> f64"),
+    Opcode("f64.mul", None, 0xA2, (), "f64 f64 -> f64"),
+    Opcode("f64.div", None, 0xA3, (), "f64 f64 -> f64"),
+    Opcode("f64.min", None, 0xA4, (), "f64 f64 -> f64"),
+    Opcode("f64.max", None, 0xA5, (), "f64 f64 -> f64"),
+    Opcode("f64.copysign", None, 0xA6, (), "f64 f64 -> f64"),
+
+    Opcode("i32.wrap_i64", None, 0xA7, (), "i64 -> i32"),
+    Opcode("i32.trunc_f32_s", None, 0xA8, (), "f32 -> i32"),
+    Opcode("i32.trunc_f32_u", None, 0xA9, (), "f32 -> i32"),
+    Opcode("i32.trunc_f64_s", None, 0xAA, (), "f64 -> i32"),
+    Opcode("i32.trunc_f64_u", None, 0xAB, (), "f64 -> i32"),
+    Opcode("i64.extend_i32_s", None, 0xAC, (), "i32 -> i64"),
+    Opcode("i64.extend_i32_u", None, 0xAD, (), "i32 -> i64"),
+    Opcode("i64.trunc_f32_s", None, 0xAE, (), "f32 -> i64"),
+    Opcode("i64.trunc_f32_u", None, 0xAF, (), "f32 -> i64"),
+    Opcode("i64.trunc_f64_s", None, 0xB0, (), "f64 -> i64"),
+    Opcode("i64.trunc_f64_u", None, 0xB1, (), "f64 -> i64"),
+    Opcode("f32.convert_i32_s", None, 0xB2, (), "i32 -> f32"),
+    Opcode("f32.convert_i32_u", None, 0xB3, (), "i32 -> f32"),
+    Opcode("f32.convert_i64_s", None, 0xB4, (), "i64 -> f32"),
+    Opcode("f32.convert_i64_u", None, 0xB5, (), "i64 -> f32"),
+    Opcode("f32.demote_f64", None, 0xB6, (), "f64 -> f32"),
+    Opcode("f64.convert_i32_s", None, 0xB7, (), "i32 -> f64"),
+    Opcode("f64.convert_i32_u", None, 0xB8, (), "i32 -> f64"),
+    Opcode("f64.convert_i64_s", None, 0xB9, (), "i64 -> f64"),
+    Opcode("f64.convert_i64_u", None, 0xBA, (), "i64 -> f64"),
+    Opcode("f64.promote_f32", None, 0xBB, (), "f32 -> f64"),
+    Opcode("i32.reinterpret_f32", None, 0xBC, (), "f32 -> i32"),
+    Opcode("i64.reinterpret_f64", None, 0xBD, (), "f64 -> i64"),
+    Opcode("f32.reinterpret_i32", None, 0xBE, (), "i32 -> f32"),
+    Opcode("f64.reinterpret_i64", None, 0xBF, (), "i64 -> f64"),
+
+    Opcode("i32.extend8_s", None, 0xC0, (), "i32 -> i32"),
+    Opcode("i32.extend16_s", None, 0xC1, (), "i32 -> i32"),
+    Opcode("i64.extend8_s", None, 0xC2, (), "i64 -> i64"),
+    Opcode("i64.extend16_s", None, 0xC3, (), "i64 -> i64"),
+    Opcode("i64.extend32_s", None, 0xC4, (), "i64 -> i64"),
+
+    Opcode("i32.trunc_sat_f32_s", MISC, 0x00, (), "f32 -> i32"),
+    Opcode("i32.trunc_sat_f32_u", MISC, 0x01, (), "f32 -> i32"),
+    Opcode("i32.trunc_sat_f64_s", MISC, 0x02, (), "f64 -> i32"),
+    Opcode("i32.trunc_sat_f64_u", MISC, 0x03, (), "f64 -> i32"),
+    Opcode("i64.trunc_sat_f32_s", MISC, 0x04, (), "f32 -> i64"),
+    Opcode("i64.trunc_sat_f32_u", MISC, 0x05, (), "f32 -> i64"),
+    Opcode("i64.trunc_sat_f64_s", MISC, 0x06, (), "f64 -> i64"),
+    Opcode("i64.trunc_sat_f64_u", MISC, 0x07, (), "f64 -> i64"),
+
+    # Bulk memory and table instructions
+    Opcode("memory.init", MISC, 0x08, (DATA, MEMIDX), "i32 i32 i32 ->"),
+    Opcode("data.drop", MISC, 0x09, (DATA,)),
+    Opcode("memory.copy", MISC, 0x0A, ("dst:memidx", "src:memidx"), "i32 i32 i32 ->"),
+    Opcode("memory.fill", MISC, 0x0B, (MEMIDX,), "i32 i32 i32 ->"),
+    Opcode("table.init", MISC, 0x0C, (ELEM, TABLE), "i32 i32 i32 ->"),
+    Opcode("elem.drop", MISC, 0x0D, (ELEM,)),
+    Opcode("table.copy", MISC, 0x0E, ("dst:table", "src:table"), "i32 i32 i32 ->"),
+    Opcode("table.grow", MISC, 0x0F, (TABLE,), None),
+    Opcode("table.size", MISC, 0x10, (TABLE,), "-> i32"),
+    Opcode("table.fill", MISC, 0x11, (TABLE,), None),
+
+    # Vector instructions
+    _simd_mem("v128.load", 0x00, 4, "i32 -> v128"),
+    _simd_mem("v128.load8x8_s", 0x01, 3, "i32 -> v128"),
+    _simd_mem("v128.load8x8_u", 0x02, 3, "i32 -> v128"),
+    _simd_mem("v128.load16x4_s", 0x03, 3, "i32 -> v128"),
+    _simd_mem("v128.load16x4_u", 0x04, 3, "i32 -> v128"),
+    _simd_mem("v128.load32x2_s", 0x05, 3, "i32 -> v128"),
+    _simd_mem("v128.load32x2_u", 0x06, 3, "i32 -> v128"),
+    _simd_mem("v128.load8_splat", 0x07, 0, "i32 -> v128"),
+    _simd_mem("v128.load16_splat", 0x08, 1, "i32 -> v128"),
+    _simd_mem("v128.load32_splat", 0x09, 2, "i32 -> v128"),
+    _simd_mem("v128.load64_splat", 0x0A, 3, "i32 -> v128"),
+    _simd_mem("v128.store", 0x0B, 4, "i32 v128 ->"),
+
+    _simd("v128.const", 0x0C, "-> v128", (V128,)),
+    _simd("i8x16.shuffle", 0x0D, "v128 v128 -> v128", (SHUFFLE,)),
+
+    _simd("i8x16.swizzle", 0x0E),
+    _simd("i8x16.splat", 0x0F, "i32 -> v128"),
+    _simd("i16x8.splat", 0x10, "i32 -> v128"),
+    _simd("i32x4.splat", 0x11, "i32 -> v128"),
+    _simd("i64x2.splat", 0x12, "i64 -> v128"),
+    _simd("f32x4.splat", 0x13, "f32 -> v128"),
+    _simd("f64x2.splat", 0x14, "f64 -> v128"),
+
+    _simd("i8x16.extract_lane_s", 0x15, "v128 -> i32", (LANE,)),
+    _simd("i8x16.extract_lane_u", 0x16, "v128 -> i32", (LANE,)),
+    _simd("i8x16.replace_lane", 0x17, "v128 i32 -> v128", (LANE,)),
+    _simd("i16x8.extract_lane_s", 0x18, "v128 -> i32", (LANE,)),
+    _simd("i16x8.extract_lane_u", 0x19, "v128 -> i32", (LANE,)),
+    _simd("i16x8.replace_lane", 0x1A, "v128 i32 -> v128", (LANE,)),
+    _simd("i32x4.extract_lane", 0x1B, "v128 -> i32", (LANE,)),
+    _simd("i32x4.replace_lane", 0x1C, "v128 i32 -> v128", (LANE,)),
+    _simd("i64x2.extract_lane", 0x1D, "v128 -> i64", (LANE,)),
+    _simd("i64x2.replace_lane", 0x1E, "v128 i64 -> v128", (LANE,)),
+    _simd("f32x4.extract_lane", 0x1F, "v128 -> f32", (LANE,)),
+    _simd("f32x4.replace_lane", 0x20, "v128 f32 -> v128", (LANE,)),
+    _simd("f64x2.extract_lane", 0x21, "v128 -> f64", (LANE,)),
+    _simd("f64x2.replace_lane", 0x22, "v128 f64 -> v128", (LANE,)),
+
+    _simd("i8x16.eq", 0x23),
+    _simd("i8x16.ne", 0x24),
+    _simd("i8x16.lt_s", 0x25),
+    _simd("i8x16.lt_u", 0x26),
+    _simd("i8x16.gt_s", 0x27),
+    _simd("i8x16.gt_u", 0x28),
+    _simd("i8x16.le_s", 0x29),
+    _simd("i8x16.le_u", 0x2A),
+    _simd("i8x16.ge_s", 0x2B),
+    _simd("i8x16.ge_u", 0x2C),
+    _simd("i16x8.eq", 0x2D),
+    _simd("i16x8.ne", 0x2E),
+    _simd("i16x8.lt_s", 0x2F),
+    _simd("i16x8.lt_u", 0x30),
+    _simd("i16x8.gt_s", 0x31),
+    _simd("i16x8.gt_u", 0x32),
+    _simd("i16x8.le_s", 0x33),
+    _simd("i16x8.le_u", 0x34),
+    _simd("i16x8.ge_s", 0x35),
+    _simd("i16x8.ge_u", 0x36),
+    _simd("i32x4.eq", 0x37),
+    _simd("i32x4.ne", 0x38),
+    _simd("i32x4.lt_s", 0x39),
+    _simd("i32x4.lt_u", 0x3A),
+    _simd("i32x4.gt_s", 0x3B),
+    _simd("i32x4.gt_u", 0x3C),
+    _simd("i32x4.le_s", 0x3D),
+    _simd("i32x4.le_u", 0x3E),
+    _simd("i32x4.ge_s", 0x3F),
+    _simd("i32x4.ge_u", 0x40),
+    _simd("f32x4.eq", 0x41),
+    _simd("f32x4.ne", 0x42),
+    _simd("f32x4.lt", 0x43),
+    _simd("f32x4.gt", 0x44),
+    _simd("f32x4.le", 0x45),
+    _simd("f32x4.ge", 0x46),
+    _simd("f64x2.eq", 0x47),
+    _simd("f64x2.ne", 0x48),
+    _simd("f64x2.lt", 0x49),
+    _simd("f64x2.gt", 0x4A),
+    _simd("f64x2.le", 0x4B),
+    _simd("f64x2.ge", 0x4C),
+
+    _simd("v128.not", 0x4D, "v128 -> v128"),
+    _simd("v128.and", 0x4E),
+    _simd("v128.andnot", 0x4F),
+    _simd("v128.or", 0x50),
+    _simd("v128.xor", 0x51),
+    _simd("v128.bitselect", 0x52, "v128 v128 v128 -> v128"),
+    _simd("v128.any_true", 0x53, "v128 -> i32"),
+
+    _simd_mem("v128.load8_lane", 0x54, 0, "i32 v128 -> v128", lane=True),
+    _simd_mem("v128.load16_lane", 0x55, 1, "i32 v128 -> v128", lane=True),
+    _simd_mem("v128.load32_lane", 0x56, 2, "i32 v128 -> v128", lane=True),
+    _simd_mem("v128.load64_lane", 0x57, 3, "i32 v128 -> v128", lane=True),
+    _simd_mem("v128.store8_lane", 0x58, 0, "i32 v128 ->", lane=True),
+    _simd_mem("v128.store16_lane", 0x59, 1, "i32 v128 ->", lane=True),
+    _simd_mem("v128.store32_lane", 0x5A, 2, "i32 v128 ->", lane=True),
+    _simd_mem("v128.store64_lane", 0x5B, 3, "i32 v128 ->", lane=True),
+
+    _simd_mem("v128.load32_zero", 0x5C, 2, "i32 -> v128"),
+    _simd_mem("v128.load64_zero", 0x5D, 3, "i32 -> v128"),
+
+    _simd("f32x4.demote_f64x2_zero", 0x5E, "v128 -> v128"),
+    _simd("f64x2.promote_low_f32x4", 0x5F, "v128 -> v128"),
+
+    _simd("i8x16.abs", 0x60, "v128 -> v128"),
+    _simd("i8x16.neg", 0x61, "v128 -> v128"),
+    _simd("i8x16.popcnt", 0x62, "v128 -> v128"),
+    _simd("i8x16.all_true", 0x63, "v128 -> i32"),
+    _simd("i8x16.bitmask", 0x64, "v128 -> i32"),
+    _simd("i8x16.narrow_i16x8_s", 0x65),
+    _simd("i8x16.narrow_i16x8_u", 0x66),
+    _simd("f32x4.ceil", 0x67, "v128 -> v128"),
+    _simd("f32x4.floor", 0x68, "v128 -> v128"),
+    _simd("f32x4.trunc", 0x69, "v128 -> v128"),
+    _simd("f32x4.nearest", 0x6A, "v128 -> v128"),
+    _simd("i8x16.shl", 0x6B, "v128 i32 -> v128"),
+    _simd("i8x16.shr_s", 0x6C, "v128 i32 -> v128"),
+    _simd("i8x16.shr_u", 0x6D, "v128 i32 -> v128"),
+    _simd("i8x16.add", 0x6E),
+    _simd("i8x16.add_sat_s", 0x6F),
+    _simd("i8x16.add_sat_u", 0x70),
+    _simd("i8x16.sub", 0x71),
+    _simd("i8x16.sub_sat_s", 0x72),
+    _simd("i8x16.sub_sat_u", 0x73),
+    _simd("f64x2.ceil", 0x74, "v128 -> v128"),
+    _simd("f64x2.floor", 0x75, "v128 -> v128"),
+    _simd("i8x16.min_s", 0x76),
+    _simd("i8x16.min_u", 0x77),
+    _simd("i8x16.max_s", 0x78),
+    _simd("i8x16.max_u", 0x79),
+    _simd("f64x2.trunc", 0x7A, "v128 -> v128"),
+    _simd("i8x16.avgr_u", 0x7B),
+    _simd("i16x8.extadd_pairwise_i8x16_s", 0x7C, "v128 -> v128"),
+    _simd("i16x8.extadd_pairwise_i8x16_u", 0x7D, "v128 -> v128"),
+    _simd("i32x4.extadd_pairwise_i16x8_s", 0x7E, "v128 -> v128"),
+    _simd("i32x4.extadd_pairwise_i16x8_u", 0x7F, "v128 -> v128"),
+
+    _simd("i16x8.abs", 0x80, "v128 -> v128"),
+    _simd("i16x8.neg", 0x81, "v128 -> v128"),
+    _simd("i16x8.q15mulr_sat_s", 0x82),
+    _simd("i16x8.all_true", 0x83, "v128 -> i32"),
+    _simd("i16x8.bitmask", 0x84, "v128 -> i32"),
+    _simd("i16x8.narrow_i32x4_s", 0x85),
+    _simd("i16x8.narrow_i32x4_u", 0x86),
+    _simd("i16x8.extend_low_i8x16_s", 0x87, "v128 -> v128"),
+    _simd("i16x8.extend_high_i8x16_s", 0x88, "v128 -> v128"),
+    _simd("i16x8.extend_low_i8x16_u", 0x89, "v128 -> v128"),
+    _simd("i16x8.extend_high_i8x16_u", 0x8A, "v128 -> v128"),
+    _simd("i16x8.shl", 0x8B, "v128 i32 -> v128"),
+    _simd("i16x8.shr_s", 0x8C, "v128 i32 -> v128"),
+    _simd("i16x8.shr_u", 0x8D, "v128 i32 -> v128"),
+    _simd("i16x8.add", 0x8E),
+    _simd("i16x8.add_sat_s", 0x8F),
+    _simd("i16x8.add_sat_u", 0x90),
+    _simd("i16x8.sub", 0x91),
+    _simd("i16x8.sub_sat_s", 0x92),
+    _simd("i16x8.sub_sat_u", 0x93),
+    _simd("f64x2.nearest", 0x94, "v128 -> v128"),
+    _simd("i16x8.mul", 0x95),
+    _simd("i16x8.min_s", 0x96),
+    _simd("i16x8.min_u", 0x97),
+    _simd("i16x8.max_s", 0x98),
+    _simd("i16x8.max_u", 0x99),
+    _simd("i16x8.avgr_u", 0x9B),
+    _simd("i16x8.extmul_low_i8x16_s", 0x9C),
+    _simd("i16x8.extmul_high_i8x16_s", 0x9D),
+    _simd("i16x8.extmul_low_i8x16_u", 0x9E),
+    _simd("i16x8.extmul_high_i8x16_u", 0x9F),
+
+    _simd("i32x4.abs", 0xA0, "v128 -> v128"),
+    _simd("i32x4.neg", 0xA1, "v128 -> v128"),
+    _simd("i32x4.all_true", 0xA3, "v128 -> i32"),
+    _simd("i32x4.bitmask", 0xA4, "v128 -> i32"),
+    _simd("i32x4.extend_low_i16x8_s", 0xA7, "v128 -> v128"),
+    _simd("i32x4.extend_high_i16x8_s", 0xA8, "v128 -> v128"),
+    _simd("i32x4.extend_low_i16x8_u", 0xA9, "v128 -> v128"),
+    _simd("i32x4.extend_high_i16x8_u", 0xAA, "v128 -> v128"),
+    _simd("i32x4.shl", 0xAB, "v128 i32 -> v128"),
+    _simd("i32x4.shr_s", 0xAC, "v128 i32 -> v128"),
+    _simd("i32x4.shr_u", 0xAD, "v128 i32 -> v128"),
+    _simd("i32x4.add", 0xAE),
+    _simd("i32x4.sub", 0xB1),
+    _simd("i32x4.mul", 0xB5),
+    _simd("i32x4.min_s", 0xB6),
+    _simd("i32x4.min_u", 0xB7),
+    _simd("i32x4.max_s", 0xB8),
+    _simd("i32x4.max_u", 0xB9),
+    _simd("i32x4.dot_i16x8_s", 0xBA),
+    _simd("i32x4.extmul_low_i16x8_s", 0xBC),
+    _simd("i32x4.extmul_high_i16x8_s", 0xBD),
+    _simd("i32x4.extmul_low_i16x8_u", 0xBE),
+    _simd("i32x4.extmul_high_i16x8_u", 0xBF),
+
+    _simd("i64x2.abs", 0xC0, "v128 -> v128"),
+    _simd("i64x2.neg", 0xC1, "v128 -> v128"),
+    _simd("i64x2.all_true", 0xC3, "v128 -> i32"),
+    _simd("i64x2.bitmask", 0xC4, "v128 -> i32"),
+    _simd("i64x2.extend_low_i32x4_s", 0xC7, "v128 -> v128"),
+    _simd("i64x2.extend_high_i32x4_s", 0xC8, "v128 -> v128"),
+    _simd("i64x2.extend_low_i32x4_u", 0xC9, "v128 -> v128"),
+    _simd("i64x2.extend_high_i32x4_u", 0xCA, "v128 -> v128"),
+    _simd("i64x2.shl", 0xCB, "v128 i32 -> v128"),
+    _simd("i64x2.shr_s", 0xCC, "v128 i32 -> v128"),
+    _simd("i64x2.shr_u", 0xCD, "v128 i32 -> v128"),
+    _simd("i64x2.add", 0xCE),
+    _simd("i64x2.sub", 0xD1),
+    _simd("i64x2.mul", 0xD5),
+    _simd("i64x2.eq", 0xD6),
+    _simd("i64x2.ne", 0xD7),
+    _simd("i64x2.lt_s", 0xD8),
+    _simd("i64x2.gt_s", 0xD9),
+    _simd("i64x2.le_s", 0xDA),
+    _simd("i64x2.ge_s", 0xDB),
+    _simd("i64x2.extmul_low_i32x4_s", 0xDC),
+    _simd("i64x2.extmul_high_i32x4_s", 0xDD),
+    _simd("i64x2.extmul_low_i32x4_u", 0xDE),
+    _simd("i64x2.extmul_high_i32x4_u", 0xDF),
+
+    _simd("f32x4.abs", 0xE0, "v128 -> v128"),
+    _simd("f32x4.neg", 0xE1, "v128 -> v128"),
+    _simd("f32x4.sqrt", 0xE3, "v128 -> v128"),
+    _simd("f32x4.add", 0xE4),
+    _simd("f32x4.sub", 0xE5),
+    _simd("f32x4.mul", 0xE6),
+    _simd("f32x4.div", 0xE7),
+    _simd("f32x4.min", 0xE8),
+    _simd("f32x4.max", 0xE9),
+    _simd("f32x4.pmin", 0xEA),
+    _simd("f32x4.pmax", 0xEB),
+
+    _simd("f64x2.abs", 0xEC, "v128 -> v128"),
+    _simd("f64x2.neg", 0xED, "v128 -> v128"),
+    _simd("f64x2.sqrt", 0xEF, "v128 -> v128"),
+    _simd("f64x2.add", 0xF0),
+    _simd("f64x2.sub", 0xF1),
+    _simd("f64x2.mul", 0xF2),
+    _simd("f64x2.div", 0xF3),
+    _simd("f64x2.min", 0xF4),
+    _simd("f64x2.max", 0xF5),
+    _simd("f64x2.pmin", 0xF6),
+    _simd("f64x2.pmax", 0xF7),
+
+    _simd("i32x4.trunc_sat_f32x4_s", 0xF8, "v128 -> v128"),
+    _simd("i32x4.trunc_sat_f32x4_u", 0xF9, "v128 -> v128"),
+    _simd("f32x4.convert_i32x4_s", 0xFA, "v128 -> v128"),
+    _simd("f32x4.convert_i32x4_u", 0xFB, "v128 -> v128"),
+    _simd("i32x4.trunc_sat_f64x2_s_zero", 0xFC, "v128 -> v128"),
+    _simd("i32x4.trunc_sat_f64x2_u_zero", 0xFD, "v128 -> v128"),
+    _simd("f64x2.convert_low_i32x4_s", 0xFE, "v128 -> v128"),
+    _simd("f64x2.convert_low_i32x4_u", 0xFF, "v128 -> v128"),
+)
+# fmt: on
+
+OPCODES_BY_NAME: dict[str, Opcode] = {o.name: o for o in OPCODES}
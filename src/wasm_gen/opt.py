@@ -0,0 +1,524 @@
+# SPDX-FileCopyrightText: 2026 Jacques Supcik <jacques.supcik@hefr.ch>
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Optimization passes.
+
+The passes modify functions and modules in place and return the number of
+changes they made.
+"""
+
+import operator
+import re
+from collections.abc import Callable, Iterator
+from typing import cast
+
+from wasm_gen import instructions as I  # noqa
+from wasm_gen.core import Node
+from wasm_gen.data import ActiveData, Data, PassiveData
+from wasm_gen.function import BaseFunction, Bytecode, Function, _remap_locals
+from wasm_gen.globals import BaseGlobal, Global
+from wasm_gen.memory import BaseMemory
+from wasm_gen.module import Module
+from wasm_gen.values import encode_signed, encode_unsigned, read_unsigned
+
+# A rule looks at the last instructions of the rewritten body and returns
+# their replacement, or None when it does not apply.
+Rule = Callable[[list[Node]], list[Node] | None]
+
+
+def _wrap(value: int, bits: int) -> int:
+    """Wrap ``value`` to a signed integer of ``bits`` bits."""
+    value &= (1 << bits) - 1
+    if value >= 1 << (bits - 1):
+        value -= 1 << bits
+    return value
+
+
+def _shr_u(bits: int) -> Callable[[int, int], int]:
+    def shr_u(a: int, b: int) -> int:
+        return (a & ((1 << bits) - 1)) >> (b % bits)
+
+    return shr_u
+
+
+def _shr_s(bits: int) -> Callable[[int, int], int]:
+    def shr_s(a: int, b: int) -> int:
+        return _wrap(a, bits) >> (b % bits)
+
+    return shr_s
+
+
+# Binary operators that can be folded, with their width
+_FOLD: dict[type, tuple[int, Callable[[int, int], int]]] = {
+    I.I32Add: (32, operator.add),
+    I.I32Sub: (32, operator.sub),
+    I.I32Mul: (32, operator.mul),
+    I.I32And: (32, operator.and_),
+    I.I32Or: (32, operator.or_),
+    I.I32Xor: (32, operator.xor),
+    I.I32Shl: (32, lambda a, b: a << (b % 32)),
+    I.I32ShrS: (32, _shr_s(32)),
+    I.I32ShrU: (32, _shr_u(32)),
+    I.I64Add: (64, operator.add),
+    I.I64Sub: (64, operator.sub),
+    I.I64Mul: (64, operator.mul),
+    I.I64And: (64, operator.and_),
+    I.I64Or: (64, operator.or_),
+    I.I64Xor: (64, operator.xor),
+    I.I64Shl: (64, lambda a, b: a << (b % 64)),
+    I.I64ShrS: (64, _shr_s(64)),
+    I.I64ShrU: (64, _shr_u(64)),
+}
+
+# Binary operators with their width and the right operand for which they
+# return the left one
+_IDENTITY: dict[type, tuple[int, int]] = {
+    **{op: (32, 0) for op in (I.I32Add, I.I32Sub, I.I32Or, I.I32Xor)},
+    **{op: (32, 0) for op in (I.I32Shl, I.I32ShrS, I.I32ShrU)},
+    **{op: (32, 1) for op in (I.I32Mul, I.I32DivS, I.I32DivU)},
+    I.I32And: (32, -1),
+    **{op: (64, 0) for op in (I.I64Add, I.I64Sub, I.I64Or, I.I64Xor)},
+    **{op: (64, 0) for op in (I.I64Shl, I.I64ShrS, I.I64ShrU)},
+    **{op: (64, 1) for op in (I.I64Mul, I.I64DivS, I.I64DivU)},
+    I.I64And: (64, -1),
+}
+
+
+def _const(bits: int) -> type[I.I32Const] | type[I.I64Const]:
+    return I.I32Const if bits == 32 else I.I64Const
+
+
+def _set_get_to_tee(window: list[Node]) -> list[Node] | None:
+    # local.set x; local.get x -> local.tee x
+    s, g = window
+    if (
+        isinstance(s, I.LocalSet)
+        and isinstance(g, I.LocalGet)
+        and s.localidx == g.localidx
+    ):
+        return [I.LocalTee(localidx=s.localidx)]
+    return None
+
+
+def _remove_identity(window: list[Node]) -> list[Node] | None:
+    # i32.const 0; i32.add -> (nothing)
+    c, op = window
+    identity = _IDENTITY.get(op.__class__)
+    if identity is None:
+        return None
+    bits, value = identity
+    if c.__class__ is _const(bits) and c.value == value:
+        return []
+    return None
+
+
+def _fold_constants(window: list[Node]) -> list[Node] | None:
+    # i32.const a; i32.const b; i32.mul -> i32.const a*b
+    a, b, op = window
+    fold = _FOLD.get(op.__class__)
+    if fold is None:
+        return None
+    bits, f = fold
+    const = _const(bits)
+    if a.__class__ is not const or b.__class__ is not const:
+        return None
+    value = f(a.value, b.value)
+    return [const(value=_wrap(value, bits))]
+
+
+def _collapse_double_eqz(window: list[Node]) -> list[Node] | None:
+    # i32.eqz; i32.eqz; br_if l -> br_if l (same for if)
+    a, b, branch = window
+    if (
+        isinstance(a, I.I32Eqz)
+        and isinstance(b, I.I32Eqz)
+        and isinstance(branch, I.BrIf | I.If)
+    ):
+        return [branch]
+    return None
+
+
+# Rules with the number of instructions they look at
+RULES: list[tuple[int, Rule]] = [
+    (2, _set_get_to_tee),
+    (2, _remove_identity),
+    (3, _fold_constants),
+    (3, _collapse_double_eqz),
+]
+
+
+def peephole(function: Function, rules: list[tuple[int, Rule]] = RULES) -> int:
+    """Apply the peephole ``rules`` to the body of ``function``.
+
+    Instructions are moved one by one to the rewritten body, and after each
+    move the rules are matched against its last instructions until none
+    applies, so that a rewrite can enable another one
+    (``i32.const 1; i32.const 2; i32.add; i32.const 3; i32.add`` becomes
+    ``i32.const 6``). Every rule shortens the body. Return the number of
+    rewrites.
+    """
+    out: list[Node] = []
+    count = 0
+    for instruction in function.body:
+        out.append(instruction)
+        matched = True
+        while matched:
+            matched = False
+            for n, rule in rules:
+                if len(out) < n:
+                    continue
+                replacement = rule(out[-n:])
+                if replacement is not None:
+                    del out[-n:]
+                    out.extend(replacement)
+                    count += 1
+                    matched = True
+                    break
+    if count > 0:
+        function.body[:] = out
+    return count
+
+
+def tree_shake(module: Module) -> int:
+    """Remove the functions, function imports and globals that the module
+    does not use.
+
+    Everything that is reachable from the exports and from the constant
+    expressions of the data segments, through calls and global accesses,
+    is kept. Memories and memory imports are always kept. Return the number
+    of removed nodes.
+    """
+    reachable: set[int] = set()
+    pending: list[Node] = [e.node for e in module.exports]
+    for segment in module.data:
+        if isinstance(segment, ActiveData):
+            pending.extend(I.iter_refs(segment.expr))
+    while len(pending) > 0:
+        node = pending.pop()
+        if id(node) in reachable:
+            continue
+        reachable.add(id(node))
+        if isinstance(node, Function):
+            pending.extend(I.iter_refs(node.body))
+        elif isinstance(node, Global):
+            pending.extend(I.iter_refs(node.expr))
+
+    def used(node: Node) -> bool:
+        return id(node) in reachable or not isinstance(node, BaseFunction | BaseGlobal)
+
+    count = len(module.imports) + len(module.funcs) + len(module.globals_)
+    module.imports = [i for i in module.imports if used(i.node)]
+    module.funcs = [f for f in module.funcs if used(f)]
+    module.globals_ = [g for g in module.globals_ if used(g)]
+    return count - len(module.imports) - len(module.funcs) - len(module.globals_)
+
+
+def _successors(body: list[Node]) -> list[list[int]]:
+    """Return the indexes of the instructions that may run after each
+    instruction of a structured body. A branch to a block goes to its
+    ``end``, a branch to a loop goes to the ``loop`` instruction."""
+    n = len(body)
+    ends: dict[int, int] = {}
+    elses: dict[int, int] = {}
+    stack: list[int] = []
+    for i, instruction in enumerate(body):
+        if isinstance(instruction, I.BlockInstruction):
+            stack.append(i)
+        elif isinstance(instruction, I.Else):
+            elses[stack[-1]] = i
+        elif isinstance(instruction, I.End) and len(stack) > 0:
+            ends[stack.pop()] = i
+
+    def target(label: int) -> list[int]:
+        if label >= len(stack):
+            # Branch out of the function
+            return []
+        start = stack[-1 - label]
+        return [start] if isinstance(body[start], I.Loop) else [ends[start]]
+
+    successors: list[list[int]] = []
+    for i, instruction in enumerate(body):
+        following = [i + 1] if i + 1 < n else []
+        if isinstance(instruction, I.If):
+            stack.append(i)
+            alternative = elses[i] + 1 if i in elses else ends[i]
+            successors.append(following + [alternative])
+        elif isinstance(instruction, I.BlockInstruction):
+            stack.append(i)
+            successors.append(following)
+        elif isinstance(instruction, I.Else):
+            successors.append([ends[stack[-1]]])
+        elif isinstance(instruction, I.End):
+            if len(stack) == 0:
+                successors.append([])
+            else:
+                stack.pop()
+                successors.append(following)
+        elif isinstance(instruction, I.Br):
+            successors.append(target(instruction.label))
+        elif isinstance(instruction, I.BrIf):
+            successors.append(following + target(instruction.label))
+        elif isinstance(instruction, I.BrTable):
+            labels = [*instruction.targets, instruction.default]
+            successors.append([s for label in labels for s in target(label)])
+        elif isinstance(instruction, I.Return | I.Unreachable):
+            successors.append([])
+        else:
+            successors.append(following)
+    return successors
+
+
+def _bits(mask: int) -> Iterator[int]:
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+def coalesce_locals(function: Function) -> int:
+    """Merge the locals of ``function`` that are never live at the same time
+    and renumber them by decreasing number of uses.
+
+    Liveness is computed over the structured control flow of the body. Two
+    locals of the same type share an index unless one of them is assigned
+    while the other is live. The parameters keep their indexes. The locals
+    are sorted by decreasing number of uses, so that the most used locals get
+    the shortest indexes; among the locals whose indexes have the same
+    encoded size, they are grouped by type to keep the declarations short.
+    The locals end up in ``local_types``. Bodies with encoded
+    bytecode are left as they are. Return the number of locals removed.
+    """
+    body = list(function.body)
+    if any(isinstance(n, Bytecode) for n in body):
+        return 0
+    params = len(function.type.params)
+    types = [*function.type.params]
+    for entry in function.local_vars:
+        count, pos = read_unsigned(entry, 0)
+        types.extend([entry[pos:]] * count)
+    types.extend(function.local_types)
+
+    n = len(body)
+    uses = [0] * n
+    defs = [0] * n
+    frequency = [0] * len(types)
+    for i, instruction in enumerate(body):
+        if isinstance(instruction, I.LocalGet):
+            uses[i] = 1 << instruction.localidx
+            frequency[instruction.localidx] += 1
+        elif isinstance(instruction, I.LocalSet | I.LocalTee):
+            defs[i] = 1 << instruction.localidx
+            frequency[instruction.localidx] += 1
+
+    # Backward dataflow: a local is live if it may be read before it is
+    # written again.
+    successors = _successors(body)
+    live_in = [0] * n
+    live_out = [0] * n
+    changed = True
+    while changed:
+        changed = False
+        for i in reversed(range(n)):
+            out = 0
+            for s in successors[i]:
+                out |= live_in[s]
+            live = uses[i] | (out & ~defs[i])
+            if out != live_out[i] or live != live_in[i]:
+                live_out[i] = out
+                live_in[i] = live
+                changed = True
+
+    interference = [0] * len(types)
+    for i in range(n):
+        if defs[i]:
+            d = defs[i].bit_length() - 1
+            others = live_out[i] & ~defs[i]
+            interference[d] |= others
+            for other in _bits(others):
+                interference[other] |= defs[i]
+
+    # Greedy coloring, most used locals first. Unused locals are dropped.
+    slots: list[tuple[bytes, list[int]]] = []
+    masks: list[int] = []
+    for local in sorted(range(params, len(types)), key=lambda x: -frequency[x]):
+        if frequency[local] == 0:
+            continue
+        for k, (t, members) in enumerate(slots):
+            if t == types[local] and masks[k] & interference[local] == 0:
+                members.append(local)
+                masks[k] |= 1 << local
+                break
+        else:
+            slots.append((types[local], [local]))
+            masks.append(1 << local)
+
+    def weight(members: list[int]) -> int:
+        return sum(frequency[m] for m in members)
+
+    # The size of an index only depends on its LEB128 length, so the slots
+    # can be grouped by type within the indexes of each length.
+    ranked = sorted(slots, key=lambda s: -weight(s[1]))
+    regions: dict[int, list[tuple[bytes, list[int]]]] = {}
+    for k, slot in enumerate(ranked):
+        regions.setdefault(len(encode_unsigned(params + k)), []).append(slot)
+    remap: dict[int, int] = {}
+    local_types: list[bytes] = []
+    for region in regions.values():
+        # The type of the most used slot first
+        order: dict[bytes, int] = {}
+        for t, _ in region:
+            order.setdefault(t, len(order))
+        for t, members in sorted(region, key=lambda s: order[s[0]]):
+            for local in members:
+                remap[local] = params + len(local_types)
+            local_types.append(t)
+
+    removed = len(types) - params - len(local_types)
+    function.local_vars = []
+    function.local_types = local_types
+    renumbered = _remap_locals(body, remap)
+    if renumbered != body:
+        function.body[:] = renumbered
+    return removed
+
+
+def _constant_offset(segment: ActiveData) -> int | None:
+    expr = [e for e in segment.expr if not isinstance(e, I.End)]
+    if len(expr) == 1 and isinstance(expr[0], I.I32Const):
+        return expr[0].value & 0xFFFFFFFF
+    return None
+
+
+def _segment_size(offset: int, length: int) -> int:
+    # Flag, i32.const, offset, end, length and content
+    return (
+        3
+        + len(encode_signed(_wrap(offset, 32)))
+        + len(encode_unsigned(length))
+        + length
+    )
+
+
+def _data_size(segments: list[bytes | ActiveData | PassiveData]) -> int:
+    return sum(
+        sum(len(c) for c in s.chunks()) if isinstance(s, Data) else len(s)
+        for s in segments
+    )
+
+
+def optimize_data(module: Module) -> int:
+    """Rewrite the active data segments of ``module`` into fewer, smaller
+    segments and return the number of bytes saved.
+
+    The segments of a memory are laid out as the memory image they
+    produce. In a memory defined by the module, which starts zeroed, runs
+    of zeros are left out and segments are merged whenever the zeros in
+    between cost less than a segment header. Only touching or overlapping
+    segments are merged in an imported memory.
+
+    Data segment indices change, so modules with passive segments, with
+    already encoded ones or whose code refers to segments are left as they
+    are, and so are memories whose segments do not all have a constant
+    offset.
+    """
+    if not all(isinstance(d, ActiveData) for d in module.data):
+        return 0
+    if module.refers_to_data():
+        return 0
+    segments = [cast(ActiveData, d) for d in module.data]
+    imported = sum(isinstance(i.node, BaseMemory) for i in module.imports)
+
+    by_memory: dict[int, list[tuple[int, ActiveData]]] = {}
+    for segment in segments:
+        by_memory.setdefault(segment.memory, []).append(
+            (_constant_offset(segment) or 0, segment)
+        )
+    result: list[bytes | ActiveData | PassiveData] = []
+    for memory, group in by_memory.items():
+        if any(_constant_offset(s) is None for _, s in group):
+            result.extend(s for _, s in group)
+            continue
+        result.extend(_layout(memory, group, zeroed=memory >= imported))
+
+    saved = _data_size(cast(list[bytes | ActiveData | PassiveData], segments))
+    saved -= _data_size(result)
+    if saved <= 0:
+        return 0
+    module.data = result
+    return saved
+
+
+def _layout(
+    memory: int, group: list[tuple[int, ActiveData]], zeroed: bool
+) -> list[ActiveData]:
+    # Images of the runs of touching or overlapping segments, in which the
+    # later segments overwrite the earlier ones.
+    order = sorted(range(len(group)), key=lambda k: group[k][0])
+    clusters: list[tuple[int, list[int]]] = []
+    end = -1
+    for k in order:
+        offset, segment = group[k]
+        if len(clusters) > 0 and offset <= end:
+            clusters[-1][1].append(k)
+        else:
+            clusters.append((offset, [k]))
+            end = offset
+        end = max(end, offset + len(segment.content()))
+    images: list[tuple[int, memoryview]] = []
+    for start, members in clusters:
+        if len(members) == 1:
+            images.append((start, group[members[0]][1].content()))
+            continue
+        size = max(group[k][0] + len(group[k][1].content()) for k in members) - start
+        composed = bytearray(size)
+        for k in sorted(members):
+            offset, segment = group[k]
+            data = segment.content()
+            composed[offset - start : offset - start + len(data)] = data
+        images.append((start, memoryview(composed)))
+
+    # Pieces to write, as (start, end, image index)
+    pieces: list[tuple[int, int, int]] = []
+    for n, (start, view) in enumerate(images):
+        if not zeroed:
+            pieces.append((start, start + len(view), n))
+            continue
+        for match in re.finditer(rb"[^\x00]+", view):
+            pieces.append((start + match.start(), start + match.end(), n))
+
+    merged: list[list[int]] = []
+    for start, end, n in pieces:
+        if len(merged) > 0:
+            first, last = merged[-1][0], merged[-1][1]
+            together = _segment_size(first, end - first)
+            apart = _segment_size(first, last - first) + _segment_size(
+                start, end - start
+            )
+            if start == last or (zeroed and together <= apart):
+                merged[-1][1] = end
+                merged[-1].append(n)
+                continue
+        merged.append([start, end, n])
+
+    result = []
+    for start, end, *members in merged:
+        base, view = images[members[0]]
+        if all(n == members[0] for n in members):
+            content: bytes | memoryview = view[start - base : end - base]
+        else:
+            buffer = bytearray(end - start)
+            for n in dict.fromkeys(members):
+                base, view = images[n]
+                lo, hi = max(start, base), min(end, base + len(view))
+                buffer[lo - start : hi - start] = view[lo - base : hi - base]
+            content = bytes(buffer)
+        result.append(
+            ActiveData(
+                source=content,
+                memory=memory,
+                expr=[I.I32Const(value=_wrap(start, 32))],
+            )
+        )
+    return result
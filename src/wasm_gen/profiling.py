@@ -0,0 +1,176 @@
+# SPDX-FileCopyrightText: 2026 Jacques Supcik <jacques.supcik@hefr.ch>
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Profiling counters.
+
+:func:`add_counters` makes every function of a module count how many times
+it is called, and optionally how many times each of its loops iterates.
+The counters are 64-bit integers, kept in mutable globals or in an array
+in memory 0. The module exports ``__profile_dump``, a function that takes
+the number of a counter and returns its value, or 0 for a number out of
+range. :class:`ProfileLayout` tells which function and loop each counter
+belongs to; it is also embedded as JSON in the ``wasm_gen.profile`` custom
+section of the module.
+"""
+
+import json
+from dataclasses import asdict, dataclass, field
+
+from wasm_gen import instructions as I  # noqa
+from wasm_gen.core import Node
+from wasm_gen.exports import Export
+from wasm_gen.function import BaseFunction, Function, FunctionType
+from wasm_gen.globals import Global, GlobalType
+from wasm_gen.memory import BaseMemory
+from wasm_gen.module import CustomSection, Module
+from wasm_gen.type import i32_t, i64_t
+
+DUMP = "__profile_dump"
+# Name of the custom section holding the layout
+SECTION = "wasm_gen.profile"
+
+
+@dataclass
+class ProfileCounter:
+    """A counter, of the entries in the function with index ``function``
+    when ``loop`` is None, and otherwise of the iterations of its loop
+    number ``loop`` (in the order of the ``loop`` instructions)."""
+
+    function: int
+    name: str | None
+    loop: int | None = None
+
+
+@dataclass
+class ProfileLayout:
+    """The counters, by number. ``base`` is the address of the counter
+    array in memory 0, or None when the counters are globals."""
+
+    counters: list[ProfileCounter] = field(default_factory=list)
+    base: int | None = None
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self))
+
+    @classmethod
+    def from_json(cls, data: str | bytes) -> "ProfileLayout":
+        layout = json.loads(data)
+        counters = [ProfileCounter(**c) for c in layout["counters"]]
+        return cls(counters=counters, base=layout["base"])
+
+
+def _increment(counter: int, base: int | None, globals_: list[Global]) -> list[Node]:
+    if base is None:
+        g = Global(
+            type=GlobalType(type=i64_t, mutable=True),
+            expr=[I.I64Const(value=0), I.End()],
+        )
+        globals_.append(g)
+        return [
+            I.GlobalGet(global_=g),
+            I.I64Const(value=1),
+            I.I64Add(),
+            I.GlobalSet(global_=g),
+        ]
+    address = base + 8 * counter
+    return [
+        I.I32Const(value=0),
+        I.I32Const(value=0),
+        I.I64Load(offset=address),
+        I.I64Const(value=1),
+        I.I64Add(),
+        I.I64Store(offset=address),
+    ]
+
+
+def _dump(layout: ProfileLayout, globals_: list[Global]) -> Function:
+    f = Function(type=FunctionType(params=[i32_t], results=[i64_t]))
+    if layout.base is not None:
+        # Numbers out of range would read past the array
+        f.body.extend(
+            [
+                I.Block(),
+                I.LocalGet(localidx=0),
+                I.I32Const(value=len(layout.counters)),
+                I.I32GeU(),
+                I.BrIf(label=0),
+                I.LocalGet(localidx=0),
+                I.I32Const(value=3),
+                I.I32Shl(),
+                I.I64Load(offset=layout.base),
+                I.Return(),
+                I.End(),
+                I.I64Const(value=0),
+                I.End(),
+            ]
+        )
+        return f
+    # A switch over the counters: br_table exits the block of the counter,
+    # or all of them for a number out of range.
+    n = len(globals_)
+    body: list[Node] = [I.Block() for _ in range(n + 1)]
+    body += [I.LocalGet(localidx=0), I.BrTable(targets=list(range(n)), default=n)]
+    for g in globals_:
+        body += [I.End(), I.GlobalGet(global_=g), I.Return()]
+    body += [I.End(), I.I64Const(value=0), I.End()]
+    f.body.extend(body)
+    return f
+
+
+def add_counters(
+    module: Module, loops: bool = False, base: int | None = None
+) -> ProfileLayout:
+    """Add profiling counters to the functions of ``module``, and return
+    their layout, which is also added to the module as a custom section.
+
+    With ``base``, the counters are stored from that address in memory 0,
+    which must not be used for anything else; otherwise each counter is a
+    mutable global. Loops hidden in :class:`~wasm_gen.function.Bytecode` are
+    not counted.
+    """
+    if any(e.name == DUMP for e in module.exports):
+        raise Exception(f"The module already exports {DUMP}")
+    if any(c.name == SECTION for c in module.custom_sections):
+        raise Exception(f"The module already has a {SECTION} section")
+    if base is not None:
+        memories = [i.node for i in module.imports if isinstance(i.node, BaseMemory)]
+        memories += module.memories
+        if len(memories) == 0:
+            raise Exception("The counters need a memory")
+        n = len(module.funcs)
+        if loops:
+            n += sum(isinstance(i, I.Loop) for f in module.funcs for i in f.body)
+        if base + 8 * n > memories[0].type.min_pages << 16:
+            raise Exception("The counters do not fit in the initial memory")
+
+    module.compute_indexes()
+    names: dict[int, str] = {}
+    for e in module.exports:
+        if isinstance(e.node, BaseFunction):
+            names.setdefault(id(e.node), e.name)
+
+    layout = ProfileLayout(base=base)
+    globals_: list[Global] = []
+    for f in module.funcs:
+        name = names.get(id(f))
+        layout.counters.append(ProfileCounter(f._index, name))
+        body = _increment(len(layout.counters) - 1, base, globals_)
+        loop = 0
+        for instruction in f.body:
+            body.append(instruction)
+            if loops and isinstance(instruction, I.Loop):
+                layout.counters.append(ProfileCounter(f._index, name, loop))
+                body += _increment(len(layout.counters) - 1, base, globals_)
+                loop += 1
+        f.body[:] = body
+
+    module.globals_ += globals_
+    dump = _dump(layout, globals_)
+    module.funcs.append(dump)
+    module.exports.append(Export(node=dump, name=DUMP))
+    module.custom_sections.append(
+        CustomSection(name=SECTION, content=layout.to_json().encode())
+    )
+    return layout
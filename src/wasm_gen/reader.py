@@ -0,0 +1,518 @@
+# SPDX-FileCopyrightText: 2026 Jacques Supcik <jacques.supcik@hefr.ch>
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Reading binary modules.
+
+:class:`ModuleReader` only scans the section headers when it is created;
+each section is decoded the first time it is accessed, into the same node
+classes that are used to build modules. The reader keeps a
+:class:`memoryview` on the binary instead of copying it, so it also works on
+an ``mmap``, which must stay open as long as the reader is used.
+
+Binaries that use a feature a :class:`~wasm_gen.Module` cannot represent
+(element and start sections, unknown opcodes, ...) raise
+:class:`~wasm_gen.core.UnsupportedFeature` when the part of the binary that
+uses it is decoded.
+"""
+
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Any
+
+from wasm_gen import instructions as I  # noqa
+from wasm_gen.core import BaseData, Node, UnsupportedFeature
+from wasm_gen.data import ActiveData, PassiveData
+from wasm_gen.exports import Export
+from wasm_gen.function import (
+    BaseFunction,
+    Body,
+    Function,
+    FunctionType,
+    TypeTable,
+    _EncodedBody,
+)
+from wasm_gen.globals import BaseGlobal, Global, GlobalType
+from wasm_gen.imports import Import
+from wasm_gen.memory import BaseMemory, Memory, MemoryType
+from wasm_gen.module import CustomSection, Module
+from wasm_gen.table import BaseTable, Table, TableType
+from wasm_gen.values import Vector, encode_unsigned, read_unsigned
+
+TYPE_SECTION = 1
+IMPORT_SECTION = 2
+FUNCTION_SECTION = 3
+TABLE_SECTION = 4
+MEMORY_SECTION = 5
+GLOBAL_SECTION = 6
+EXPORT_SECTION = 7
+START_SECTION = 8
+ELEMENT_SECTION = 9
+CODE_SECTION = 10
+DATA_SECTION = 11
+DATA_COUNT_SECTION = 12
+
+# Sections that cannot be represented by a Module
+_UNSUPPORTED = {
+    START_SECTION: "start",
+    ELEMENT_SECTION: "element",
+}
+
+
+def _read_name(data: memoryview, pos: int) -> tuple[str, int]:
+    n, pos = read_unsigned(data, pos)
+    return str(data[pos : pos + n], "utf-8"), pos + n
+
+
+def _read_limits(data: memoryview, pos: int) -> tuple[MemoryType, int]:
+    flags = data[pos]
+    min_pages, pos = read_unsigned(data, pos + 1)
+    if flags == 0:
+        return MemoryType(min_pages=min_pages), pos
+    max_pages, pos = read_unsigned(data, pos)
+    return MemoryType(min_pages=min_pages, max_pages=max_pages), pos
+
+
+def _read_table_type(data: memoryview, pos: int) -> tuple[TableType, int]:
+    ref_type = bytes(data[pos : pos + 1])
+    limits, pos = _read_limits(data, pos + 1)
+    table_type = TableType(
+        ref_type=ref_type, min_size=limits.min_pages, max_size=limits.max_pages
+    )
+    return table_type, pos
+
+
+def _read_global_type(data: memoryview, pos: int) -> tuple[GlobalType, int]:
+    global_type = GlobalType(
+        type=bytes(data[pos : pos + 1]), mutable=data[pos + 1] == 1
+    )
+    return global_type, pos + 2
+
+
+@dataclass
+class LazyFunction(Function):
+    """A function read from a binary module.
+
+    The body stays a slice of the code section until it is first accessed.
+    The original bytes are emitted as long as the body is not modified and
+    the functions and globals keep the indexes they have in the binary.
+    """
+
+    _code: memoryview | None = field(default=None, repr=False, compare=False)
+    _reader: "ModuleReader | None" = field(default=None, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self._code is None:
+            super().__post_init__()
+
+    @property  # type: ignore[misc]
+    def body(self) -> list[Node]:
+        if self._code is not None:
+            self._decode()
+        return self._body
+
+    @body.setter
+    def body(self, body: list[Node]) -> None:
+        self._code = None
+        self._body = body if isinstance(body, Body) else Body(body)
+
+    def _decode(self) -> None:
+        code, reader = self._code, self._reader
+        assert code is not None and reader is not None
+        self._code = None
+        body = Body(I.decode_body(code, 0, len(code), reader._resolve)[0])
+        self._body = body
+        # Seed the encoding cache with the original bytes, which stay valid
+        # as long as the body and the indexes of its references do not
+        # change.
+        refs = list({id(n): n for n in I.iter_refs(body)}.values())
+        self._encoded = _EncodedBody(
+            body=body,
+            version=body.version,
+            signature=self.type.signature(),
+            local_vars=list(self.local_vars),
+            local_types=list(self.local_types),
+            refs=refs,
+            indices=[reader._indices[id(n)] for n in refs],
+            chunks=self._raw_chunks(code),
+        )
+
+    def _raw_chunks(self, code: memoryview) -> list[bytes]:
+        # The original body does not use the declared locals, so they can be
+        # grouped without renumbering it.
+        lv = bytes(Vector(values=self._locals(())[0]))
+        return [encode_unsigned(len(lv) + len(code)), lv, bytes(code)]
+
+    def raw_code(self) -> memoryview | None:
+        """Return the body as it is in the binary, or None once it has been
+        decoded."""
+        return self._code
+
+    @property
+    def reader(self) -> "ModuleReader | None":
+        """The reader of the binary the function was read from."""
+        return self._reader
+
+    def raw_chunks(self) -> list[bytes] | None:
+        """Return the code entry copied from the binary, or None if the body
+        was decoded or the nodes it refers to changed index."""
+        if (
+            self._code is None
+            or self._reader is None
+            or not self._reader._indexes_intact()
+        ):
+            return None
+        return self._raw_chunks(self._code)
+
+    def chunks(self) -> list[bytes]:
+        raw = self.raw_chunks()
+        return raw if raw is not None else super().chunks()
+
+    def positioned_chunks(self, positions: Mapping[int, int]) -> list[bytes]:
+        if (
+            self._code is not None
+            and self._reader is not None
+            and self._reader._same_positions(positions)
+        ):
+            return self._raw_chunks(self._code)
+        return super().positioned_chunks(positions)
+
+
+class ModuleReader:
+    """A binary module whose sections are decoded on demand.
+
+    ``data`` may be any object that supports the buffer protocol
+    (``bytes``, ``memoryview``, ``mmap``, ...).
+    """
+
+    def __init__(self, data: Any) -> None:
+        self.data = memoryview(data).cast("B")
+        if bytes(self.data[:4]) != b"\0asm":
+            raise Exception("Not a WebAssembly module")
+        self.version = int.from_bytes(self.data[4:8], "little")
+        # Body of each known section, and (name, body) of the custom sections
+        self.sections: dict[int, memoryview] = {}
+        self.custom_sections: list[tuple[str, memoryview]] = []
+        # (id, start, end) of each section, header included, in binary order
+        self.layout: list[tuple[int, int, int]] = []
+        pos = 8
+        while pos < len(self.data):
+            section_id = self.data[pos]
+            offset = pos
+            size, pos = read_unsigned(self.data, pos + 1)
+            body = self.data[pos : pos + size]
+            if len(body) != size:
+                raise Exception(f"Section {section_id} is truncated")
+            if section_id == 0:
+                name, start = _read_name(body, 0)
+                self.custom_sections.append((name, body[start:]))
+            elif section_id in self.sections:
+                raise Exception(f"Duplicate section {section_id}")
+            else:
+                self.sections[section_id] = body
+            pos += size
+            self.layout.append((section_id, offset, pos))
+        self._intact_epoch = -1
+        self._intact = False
+        # The last positions given to _same_positions, and the answer
+        self._positions: tuple[Mapping[int, int], bool] | None = None
+
+    def _vector(self, section_id: int) -> tuple[memoryview, int, int]:
+        """Return the body of a section, the number of entries of its
+        vector and the position of the first entry."""
+        body = self.sections.get(section_id, memoryview(b"\0"))
+        n, pos = read_unsigned(body, 0)
+        return body, n, pos
+
+    def _resolve(self, immediate: I.Immediate, index: int) -> Any:
+        if immediate.type is BaseData:
+            return self.data_segments[index]
+        if immediate.type is BaseFunction:
+            return self.function_space[index]
+        return self.global_space[index]
+
+    @cached_property
+    def _indices(self) -> dict[int, int]:
+        """Index in the binary of the functions, globals and data segments,
+        by id."""
+        indices = {id(f): i for i, f in enumerate(self.function_space)}
+        indices.update((id(g), i) for i, g in enumerate(self.global_space))
+        indices.update((id(d), i) for i, d in enumerate(self._data_space))
+        return indices
+
+    @property
+    def _data_space(self) -> list[ActiveData | PassiveData]:
+        # Code can only refer to data segments when the binary has a data
+        # count section, so the data section is not decoded otherwise.
+        if DATA_COUNT_SECTION not in self.sections:
+            return []
+        return self.data_segments
+
+    def _indexes_intact(self) -> bool:
+        """Tell if the functions, globals and data segments still have the
+        indexes they have in the binary.
+
+        The answer only changes when indexes are computed, so it is only
+        checked once after every :meth:`~wasm_gen.Module.compute_indexes`.
+        """
+        if self._intact_epoch != Module._index_epoch:
+            self._intact_epoch = Module._index_epoch
+            self._intact = all(
+                f._index == i for i, f in enumerate(self.function_space)
+            ) and all(g._index == i for i, g in enumerate(self.global_space))
+            self._intact = self._intact and all(
+                d._index == i for i, d in enumerate(self._data_space)
+            )
+        return self._intact
+
+    def _same_positions(self, positions: Mapping[int, int]) -> bool:
+        """Tell if the functions, globals and data segments are at their
+        index in the binary in ``positions`` (see
+        :meth:`~wasm_gen.Function.positioned_chunks`)."""
+        if self._positions is None or self._positions[0] is not positions:
+            spaces: list[list[Any]] = [
+                self.function_space,
+                self.global_space,
+                self._data_space,
+            ]
+            same = all(
+                positions.get(id(node)) == i
+                for space in spaces
+                for i, node in enumerate(space)
+            )
+            self._positions = (positions, same)
+        return self._positions[1]
+
+    @cached_property
+    def types(self) -> list[FunctionType]:
+        body, n, pos = self._vector(TYPE_SECTION)
+        types = []
+        for _ in range(n):
+            if body[pos] != 0x60:
+                raise UnsupportedFeature(f"Unknown type form 0x{body[pos]:02x}")
+            valtypes = []
+            pos += 1
+            for _ in range(2):
+                count, pos = read_unsigned(body, pos)
+                valtypes.append(
+                    [bytes(body[i : i + 1]) for i in range(pos, pos + count)]
+                )
+                pos += count
+            types.append(FunctionType(params=valtypes[0], results=valtypes[1]))
+        return types
+
+    @cached_property
+    def imports(self) -> list[Import]:
+        body, n, pos = self._vector(IMPORT_SECTION)
+        imports = []
+        for _ in range(n):
+            module, pos = _read_name(body, pos)
+            name, pos = _read_name(body, pos)
+            kind = body[pos]
+            pos += 1
+            node: Node
+            if kind == 0:
+                typeidx, pos = read_unsigned(body, pos)
+                node = BaseFunction(type=self.types[typeidx])
+            elif kind == 1:
+                table_type, pos = _read_table_type(body, pos)
+                node = BaseTable(type=table_type)
+            elif kind == 2:
+                memory_type, pos = _read_limits(body, pos)
+                node = BaseMemory(type=memory_type)
+            elif kind == 3:
+                global_type, pos = _read_global_type(body, pos)
+                node = BaseGlobal(type=global_type)
+            else:
+                raise UnsupportedFeature(
+                    f"Unsupported import kind {kind} ({module}.{name})"
+                )
+            imports.append(Import(node=node, module=module, name=name))
+        return imports
+
+    @cached_property
+    def functions(self) -> list[LazyFunction]:
+        """The functions defined by the module.
+
+        Their bodies are empty until :attr:`code` is accessed.
+        """
+        body, n, pos = self._vector(FUNCTION_SECTION)
+        functions = []
+        for _ in range(n):
+            typeidx, pos = read_unsigned(body, pos)
+            functions.append(LazyFunction(type=self.types[typeidx]))
+        return functions
+
+    @cached_property
+    def tables(self) -> list[Table]:
+        body, n, pos = self._vector(TABLE_SECTION)
+        tables = []
+        for _ in range(n):
+            table_type, pos = _read_table_type(body, pos)
+            tables.append(Table(type=table_type))
+        return tables
+
+    @cached_property
+    def memories(self) -> list[Memory]:
+        body, n, pos = self._vector(MEMORY_SECTION)
+        memories = []
+        for _ in range(n):
+            memory_type, pos = _read_limits(body, pos)
+            memories.append(Memory(type=memory_type))
+        return memories
+
+    @cached_property
+    def globals_(self) -> list[Global]:
+        body, n, pos = self._vector(GLOBAL_SECTION)
+        # A constant expression may only refer to the globals before it
+        space = [i.node for i in self.imports if isinstance(i.node, BaseGlobal)]
+
+        def resolve(immediate: I.Immediate, index: int) -> Any:
+            if immediate.type is BaseFunction:
+                return self.function_space[index]
+            return space[index]
+
+        globals_ = []
+        for _ in range(n):
+            global_type, pos = _read_global_type(body, pos)
+            expr, pos = I.decode_body(body, pos, None, resolve)
+            g = Global(type=global_type, expr=expr)
+            globals_.append(g)
+            space.append(g)
+        return globals_
+
+    @cached_property
+    def function_space(self) -> list[BaseFunction]:
+        """Imported and defined functions, by index."""
+        imported = [i.node for i in self.imports if isinstance(i.node, BaseFunction)]
+        return imported + self.functions
+
+    @cached_property
+    def global_space(self) -> list[BaseGlobal]:
+        """Imported and defined globals, by index."""
+        space = [i.node for i in self.imports if isinstance(i.node, BaseGlobal)]
+        return space + self.globals_
+
+    @cached_property
+    def table_space(self) -> list[BaseTable]:
+        """Imported and defined tables, by index."""
+        imported = [i.node for i in self.imports if isinstance(i.node, BaseTable)]
+        return imported + self.tables
+
+    @cached_property
+    def memory_space(self) -> list[BaseMemory]:
+        """Imported and defined memories, by index."""
+        imported = [i.node for i in self.imports if isinstance(i.node, BaseMemory)]
+        return imported + self.memories
+
+    @cached_property
+    def exports(self) -> list[Export]:
+        """The exports, which are decoded without reading the code section."""
+        body, n, pos = self._vector(EXPORT_SECTION)
+        exports = []
+        for _ in range(n):
+            name, pos = _read_name(body, pos)
+            kind = body[pos]
+            index, pos = read_unsigned(body, pos + 1)
+            node: Node
+            if kind == 0:
+                node = self.function_space[index]
+            elif kind == 1:
+                node = self.table_space[index]
+            elif kind == 2:
+                node = self.memory_space[index]
+            elif kind == 3:
+                node = self.global_space[index]
+            else:
+                raise UnsupportedFeature(f"Unsupported export kind {kind} ({name})")
+            exports.append(Export(node=node, name=name))
+        return exports
+
+    @cached_property
+    def code(self) -> list[LazyFunction]:
+        """The functions defined by the module, with their locals and
+        bodies.
+
+        Only the locals are decoded here, each body is decoded the first
+        time it is accessed.
+        """
+        body, n, pos = self._vector(CODE_SECTION)
+        functions = self.functions
+        if n != len(functions):
+            raise Exception("Function and code sections have different lengths")
+        for f in functions:
+            size, pos = read_unsigned(body, pos)
+            end = pos + size
+            count, pos = read_unsigned(body, pos)
+            local_vars = []
+            for _ in range(count):
+                start = pos
+                _, pos = read_unsigned(body, pos)
+                pos += 1
+                local_vars.append(bytes(body[start:pos]))
+            f.local_vars = local_vars
+            f._code = body[pos:end]
+            f._reader = self
+            pos = end
+        return functions
+
+    @cached_property
+    def data_segments(self) -> list[ActiveData | PassiveData]:
+        body, n, pos = self._vector(DATA_SECTION)
+        segments: list[ActiveData | PassiveData] = []
+        for _ in range(n):
+            flags, pos = read_unsigned(body, pos)
+            memory = 0
+            if flags == 2:
+                memory, pos = read_unsigned(body, pos)
+            expr: list[Node] = []
+            if flags != 1:
+                expr, pos = I.decode_body(body, pos, None, self._resolve)
+            size, pos = read_unsigned(body, pos)
+            source = body[pos : pos + size]
+            pos += size
+            if flags == 1:
+                segments.append(PassiveData(source=source))
+            else:
+                segments.append(ActiveData(source=source, memory=memory, expr=expr))
+        return segments
+
+    def module(self) -> Module:
+        """Decode all the sections into a :class:`~wasm_gen.Module`."""
+        for section_id, name in _UNSUPPORTED.items():
+            if section_id in self.sections:
+                raise UnsupportedFeature(f"Unsupported {name} section")
+        # Keep the type section as it is, call_indirect and blocks may
+        # refer to types that no function has.
+        type_table = TypeTable()
+        for index, t in enumerate(self.types):
+            type_table.types.append(t)
+            type_table._indices.setdefault(t.signature(), index)
+        return Module(
+            version=self.version,
+            imports=list(self.imports),
+            exports=list(self.exports),
+            funcs=list(self.code),
+            memories=list(self.memories),
+            globals_=list(self.globals_),
+            data=list(self.data_segments),
+            data_count=True if DATA_COUNT_SECTION in self.sections else None,
+            type_table=type_table,
+            tables=list(self.tables),
+            custom_sections=self._custom_sections(),
+        )
+
+    def _custom_sections(self) -> list[CustomSection]:
+        # Each custom section is written back after the section it follows
+        customs = iter(self.custom_sections)
+        sections = []
+        after = 0
+        for section_id, _, _ in self.layout:
+            if section_id == 0:
+                name, content = next(customs)
+                sections.append(CustomSection(name=name, content=content, after=after))
+            else:
+                after = section_id
+        return sections
@@ -0,0 +1,163 @@
+# SPDX-FileCopyrightText: 2026 Jacques Supcik <jacques.supcik@hefr.ch>
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Breakdown of the size of a binary module.
+"""
+
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, cast
+
+from wasm_gen import instructions as I  # noqa
+from wasm_gen.core import UnsupportedFeature
+from wasm_gen.function import BaseFunction
+from wasm_gen.reader import CODE_SECTION, DATA_SECTION, ModuleReader
+from wasm_gen.values import read_unsigned
+
+SECTION_NAMES = {
+    0: "custom",
+    1: "type",
+    2: "import",
+    3: "function",
+    4: "table",
+    5: "memory",
+    6: "global",
+    7: "export",
+    8: "start",
+    9: "element",
+    10: "code",
+    11: "data",
+    12: "data count",
+}
+
+
+@dataclass
+class FunctionSize:
+    """A function defined by the module, with the size of its code (locals
+    and body)."""
+
+    index: int
+    name: str
+    size: int
+
+
+@dataclass
+class SizeReport:
+    """Sizes in bytes, with the header of each section included in the size
+    of the section. Custom sections are named ``custom:<name>``. ``calls``
+    counts the call instructions by callee, imported functions included,
+    and ``imports`` the imports by module.
+
+    The code of a function that uses an opcode that cannot be decoded is
+    left out of ``opcodes`` and ``calls``, and the function is counted under
+    ``opcodes["other"]``."""
+
+    total: int
+    sections: dict[str, int] = field(default_factory=dict)
+    functions: list[FunctionSize] = field(default_factory=list)
+    opcodes: Counter[str] = field(default_factory=Counter)
+    calls: Counter[str] = field(default_factory=Counter)
+    data: list[int] = field(default_factory=list)
+    imports: Counter[str] = field(default_factory=Counter)
+
+
+def _index(immediate: I.Immediate, index: int) -> int:
+    # Referenced nodes are left as their index
+    return index
+
+
+def _code_entries(reader: ModuleReader) -> list[memoryview]:
+    """Return the code entries (locals and body) of the code section."""
+    body = reader.sections.get(CODE_SECTION)
+    if body is None:
+        return []
+    n, pos = read_unsigned(body, 0)
+    entries = []
+    for _ in range(n):
+        size, pos = read_unsigned(body, pos)
+        entries.append(body[pos : pos + size])
+        pos += size
+    return entries
+
+
+def _data_sizes(reader: ModuleReader) -> list[int]:
+    """Return the size of the content of each data segment."""
+    body = reader.sections.get(DATA_SECTION)
+    if body is None:
+        return []
+    n, pos = read_unsigned(body, 0)
+    sizes = []
+    for _ in range(n):
+        flags, pos = read_unsigned(body, pos)
+        if flags == 2:
+            _, pos = read_unsigned(body, pos)
+        if flags != 1:
+            _, pos = I.decode_body(body, pos, None, _index)
+        size, pos = read_unsigned(body, pos)
+        sizes.append(size)
+        pos += size
+    return sizes
+
+
+def _count_opcodes(report: SizeReport, code: memoryview, names: dict[int, str]) -> None:
+    count, pos = read_unsigned(code, 0)
+    for _ in range(count):
+        _, pos = read_unsigned(code, pos)
+        pos += 1
+    try:
+        body, _ = I.decode_body(code, pos, len(code), _index)
+    except UnsupportedFeature:
+        report.opcodes["other"] += 1
+        return
+    for instruction in body:
+        if isinstance(instruction, I.Instruction):
+            report.opcodes[instruction.info.name] += 1
+        if isinstance(instruction, I.Call):
+            index = cast(int, instruction.function)
+            report.calls[names.get(index, f"func[{index}]")] += 1
+
+
+def size_report(data: Any) -> SizeReport:
+    """Return the size report of the binary module ``data``, which may be any
+    object that supports the buffer protocol.
+
+    The sizes are read from the layout of the sections, the module is not
+    decoded. Functions are named after their import or export when the
+    import and export sections can be read.
+    """
+    reader = ModuleReader(data)
+    report = SizeReport(total=len(reader.data))
+
+    customs = iter(reader.custom_sections)
+    for section_id, start, end in reader.layout:
+        name = SECTION_NAMES.get(section_id, str(section_id))
+        if section_id == 0:
+            name = f"custom:{next(customs)[0]}"
+        report.sections[name] = report.sections.get(name, 0) + end - start
+
+    names: dict[int, str] = {}
+    imported = 0
+    try:
+        space = {id(f): index for index, f in enumerate(reader.function_space)}
+        for i in reader.imports:
+            report.imports[i.module] += 1
+            if isinstance(i.node, BaseFunction):
+                names[space[id(i.node)]] = f"{i.module}.{i.name}"
+        imported = len(space) - len(reader.functions)
+        for e in reader.exports:
+            if isinstance(e.node, BaseFunction):
+                names[space[id(e.node)]] = e.name
+    except UnsupportedFeature:
+        # The functions are named by their index in the code section
+        report.imports.clear()
+        names.clear()
+
+    for index, code in enumerate(_code_entries(reader), imported):
+        name = names.get(index, f"func[{index}]")
+        report.functions.append(FunctionSize(index, name, len(code)))
+        _count_opcodes(report, code, names)
+
+    report.data = _data_sizes(reader)
+    return report
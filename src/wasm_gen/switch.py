@@ -0,0 +1,124 @@
+# SPDX-FileCopyrightText: 2026 Jacques Supcik <jacques.supcik@hefr.ch>
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Lowering of switch statements.
+
+The case values are split into clusters: runs of values that are dense
+enough become a ``br_table`` on the selector minus the first value, the
+other values are tested one by one. The clusters are then searched with a
+balanced tree of ``i32.lt_s`` comparisons, so the dispatch takes a constant
+or logarithmic number of tests instead of one per case.
+"""
+
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+
+from wasm_gen import instructions as I  # noqa
+from wasm_gen.core import Node
+
+# A run of values becomes a table when it has at least MIN_TABLE_CASES
+# values and they fill at least MIN_TABLE_DENSITY of its range.
+MIN_TABLE_CASES = 4
+MIN_TABLE_DENSITY = 0.4
+
+# Up to this number of single values are tested in sequence rather than
+# searched.
+MAX_LINEAR_CASES = 3
+
+
+@dataclass
+class _Cluster:
+    low: int
+    high: int
+    # Target of each value of the cluster, by value
+    targets: dict[int, int]
+
+
+def _clusters(targets: dict[int, int]) -> list[_Cluster]:
+    values = sorted(targets)
+    clusters = []
+    i = 0
+    while i < len(values):
+        j = i
+        while (
+            j + 1 < len(values)
+            and (j + 2 - i) / (values[j + 1] - values[i] + 1) >= MIN_TABLE_DENSITY
+        ):
+            j += 1
+        if j + 1 - i < MIN_TABLE_CASES:
+            j = i
+        run = {v: targets[v] for v in values[i : j + 1]}
+        clusters.append(_Cluster(values[i], values[j], run))
+        i = j + 1
+    return clusters
+
+
+def _dispatch(
+    selector: int, clusters: list[_Cluster], default: int, depth: int
+) -> list[Node]:
+    """Branch to the target of the selector. Targets are relative depths,
+    ``depth`` is the number of blocks opened by the dispatch itself."""
+    if len(clusters) <= MAX_LINEAR_CASES and all(c.low == c.high for c in clusters):
+        code: list[Node] = []
+        for c in clusters:
+            code += [
+                I.LocalGet(localidx=selector),
+                I.I32Const(value=c.low),
+                I.I32Eq(),
+                I.BrIf(label=c.targets[c.low] + depth),
+            ]
+        return code + [I.Br(label=default + depth)]
+    if len(clusters) == 1:
+        c = clusters[0]
+        targets = [c.targets.get(v, default) + depth for v in range(c.low, c.high + 1)]
+        code = [I.LocalGet(localidx=selector)]
+        if c.low != 0:
+            # Values below the table wrap around to large unsigned indexes
+            code += [I.I32Const(value=c.low), I.I32Sub()]
+        return code + [I.BrTable(targets=targets, default=default + depth)]
+    middle = len(clusters) // 2
+    return [
+        I.LocalGet(localidx=selector),
+        I.I32Const(value=clusters[middle].low),
+        I.I32LtS(),
+        I.If(),
+        *_dispatch(selector, clusters[:middle], default, depth + 1),
+        I.End(),
+        *_dispatch(selector, clusters[middle:], default, depth),
+    ]
+
+
+def lower_switch(
+    selector: int, cases: Mapping[int, Sequence[Node]], default: Sequence[Node] = ()
+) -> list[Node]:
+    """Return the instructions of a switch on the i32 local ``selector``.
+
+    ``cases`` maps each value to the code run for it, and ``default`` is run
+    for the other values. Values that map to the same code object share it.
+    The code of the cases and of the default must leave the stack as they
+    find it, and the code of a case does not fall through to the next one.
+    """
+    for value in cases:
+        if not -(1 << 31) <= value < 1 << 31:
+            raise Exception(f"Case value {value} is not an i32")
+    # One block per distinct code, the innermost first
+    codes: list[Sequence[Node]] = []
+    index: dict[int, int] = {}
+    targets = {}
+    for value, code in cases.items():
+        if id(code) not in index:
+            index[id(code)] = len(codes)
+            codes.append(code)
+        targets[value] = index[id(code)]
+    n = len(codes)
+
+    # block $end, block $default, block $case[n-1] ... block $case[0]
+    body: list[Node] = [I.Block() for _ in range(n + 2)]
+    body += _dispatch(selector, _clusters(targets), n, 0)
+    for i, code in enumerate(codes):
+        # Inside the blocks of the next cases, the default and the end
+        body += [I.End(), *code, I.Br(label=n - i)]
+    body += [I.End(), *default, I.End()]
+    return body
@@ -0,0 +1,39 @@
+# SPDX-FileCopyrightText: 2026 Jacques Supcik <jacques.supcik@hefr.ch>
+#
+# SPDX-License-Identifier: MIT
+
+from dataclasses import dataclass
+
+from wasm_gen.core import Node
+from wasm_gen.type import funcref_t
+from wasm_gen.values import encode_unsigned
+
+
+@dataclass
+class TableType(Node):
+    ref_type: bytes = funcref_t
+    min_size: int = 0
+    max_size: int | None = None
+
+    def __bytes__(self) -> bytes:
+        if self.max_size is None:
+            return self.ref_type + b"\x00" + encode_unsigned(self.min_size)
+        else:
+            return (
+                self.ref_type
+                + b"\x01"
+                + encode_unsigned(self.min_size)
+                + encode_unsigned(self.max_size)
+            )
+
+
+@dataclass
+class BaseTable(Node):
+    type: TableType
+    _index: int = -1
+
+
+@dataclass
+class Table(BaseTable):
+    def __bytes__(self) -> bytes:
+        return bytes(self.type)
@@ -3,56 +3,210 @@
 # SPDX-License-Identifier: MIT
 
 import struct
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass
 
 from wasm_gen.core import Node
 
 
-@dataclass
+def _write_unsigned(buf: bytearray, value: int, min_len: int) -> None:
+    if value < 0:
+        raise ValueError(f"Invalid unsigned integer {value}")
+    n = 0
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        n += 1
+        if n >= min_len and value == 0:
+            buf.append(byte)
+            return
+        buf.append(byte | 0x80)
+
+
+def _write_signed(buf: bytearray, value: int, min_len: int) -> None:
+    n = 0
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        n += 1
+        if n >= min_len and (
+            (value == 0 and (byte & 0x40) == 0) or (value == -1 and (byte & 0x40) != 0)
+        ):
+            buf.append(byte)
+            return
+        buf.append(byte | 0x80)
+
+
+def _encode(writer: Callable[[bytearray, int, int], None], value: int) -> bytes:
+    buf = bytearray()
+    writer(buf, value, 0)
+    return bytes(buf)
+
+
+# Precomputed encodings of every value that fits in two LEB128 bytes.
+_UNSIGNED_TABLE_END = 1 << 14
+_UNSIGNED_TABLE = tuple(_encode(_write_unsigned, v) for v in range(_UNSIGNED_TABLE_END))
+_SIGNED_TABLE_START = -(1 << 13)
+_SIGNED_TABLE_END = 1 << 13
+_SIGNED_TABLE = tuple(
+    _encode(_write_signed, v) for v in range(_SIGNED_TABLE_START, _SIGNED_TABLE_END)
+)
+
+
+def write_unsigned(buf: bytearray, value: int, min_len: int = 0) -> None:
+    """Append the unsigned LEB128 encoding of ``value`` to ``buf``.
+
+    The encoding is padded with continuation bytes to at least ``min_len``
+    bytes.
+    """
+    if min_len == 0 and 0 <= value < _UNSIGNED_TABLE_END:
+        buf += _UNSIGNED_TABLE[value]
+    else:
+        _write_unsigned(buf, value, min_len)
+
+
+def write_signed(buf: bytearray, value: int, min_len: int = 0) -> None:
+    """Append the signed LEB128 encoding of ``value`` to ``buf``.
+
+    The encoding is padded with continuation bytes to at least ``min_len``
+    bytes.
+    """
+    if min_len == 0 and _SIGNED_TABLE_START <= value < _SIGNED_TABLE_END:
+        buf += _SIGNED_TABLE[value - _SIGNED_TABLE_START]
+    else:
+        _write_signed(buf, value, min_len)
+
+
+def encode_unsigned(value: int, min_len: int = 0) -> bytes:
+    """Return the unsigned LEB128 encoding of ``value``."""
+    if min_len == 0 and 0 <= value < _UNSIGNED_TABLE_END:
+        return _UNSIGNED_TABLE[value]
+    buf = bytearray()
+    _write_unsigned(buf, value, min_len)
+    return bytes(buf)
+
+
+def encode_signed(value: int, min_len: int = 0) -> bytes:
+    """Return the signed LEB128 encoding of ``value``."""
+    if min_len == 0 and _SIGNED_TABLE_START <= value < _SIGNED_TABLE_END:
+        return _SIGNED_TABLE[value - _SIGNED_TABLE_START]
+    buf = bytearray()
+    _write_signed(buf, value, min_len)
+    return bytes(buf)
+
+
+def read_unsigned(data: bytes | memoryview, pos: int) -> tuple[int, int]:
+    """Decode the unsigned LEB128 integer at ``pos`` in ``data``.
+
+    Return the value and the position of the byte that follows it.
+    """
+    byte = data[pos]
+    if byte < 0x80:
+        return byte, pos + 1
+    result = byte & 0x7F
+    shift = 7
+    while True:
+        pos += 1
+        byte = data[pos]
+        result |= (byte & 0x7F) << shift
+        shift += 7
+        if byte < 0x80:
+            return result, pos + 1
+
+
+def read_signed(data: bytes | memoryview, pos: int) -> tuple[int, int]:
+    """Decode the signed LEB128 integer at ``pos`` in ``data``.
+
+    Return the value and the position of the byte that follows it.
+    """
+    result = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        shift += 7
+        if byte < 0x80:
+            if byte & 0x40:
+                result -= 1 << shift
+            return result, pos
+
+
+@dataclass(frozen=True, slots=True)
+class TypeIndex(Node):
+    """The block type of a block whose type is the function type at index
+    ``value``. The bytes 0x40 to 0x7F are the empty and the value types, so
+    the indexes 64 to 127 can only be given this way."""
+
+    value: int
+
+    def __bytes__(self) -> bytes:
+        return encode_blocktype(self)
+
+
+def write_blocktype(buf: bytearray, block_type: int | TypeIndex) -> None:
+    """Append the block type ``block_type`` to ``buf``.
+
+    An integer from 0x40 to 0x7F is the empty type (0x40) or a value type,
+    encoded as a single byte. Any other non-negative integer and
+    :class:`TypeIndex` are type indexes, encoded as a signed LEB128 integer.
+    """
+    if isinstance(block_type, TypeIndex):
+        index = block_type.value
+    elif 0x40 <= block_type < 0x80:
+        buf.append(block_type)
+        return
+    else:
+        index = block_type
+    if index < 0:
+        raise ValueError(f"Invalid block type index {index}")
+    write_signed(buf, index)
+
+
+def encode_blocktype(block_type: int | TypeIndex) -> bytes:
+    """Return the encoding of the block type ``block_type``."""
+    buf = bytearray()
+    write_blocktype(buf, block_type)
+    return bytes(buf)
+
+
+def read_blocktype(data: bytes | memoryview, pos: int) -> tuple[int | TypeIndex, int]:
+    """Decode the block type at ``pos`` in ``data``.
+
+    Return the empty or value type as an integer, or the type index as a
+    :class:`TypeIndex`, and the position of the byte that follows it.
+    """
+    if 0x40 <= data[pos] < 0x80:
+        return data[pos], pos + 1
+    index, pos = read_signed(data, pos)
+    return TypeIndex(value=index), pos
+
+
+@dataclass(frozen=True, slots=True)
 class UnsignedInt(Node):
 
     value: int
 
     def to_bytes(self, min_len: int = 0) -> bytes:
-        res = b""
-        value = self.value
-        while True:
-            byte = value & 0x7F
-            value >>= 7
-            if (len(res) + 1 >= min_len) and (value == 0):
-                res += byte.to_bytes(1, "little")
-                return res
-            res += (byte | 0x80).to_bytes(1, "little")
+        return encode_unsigned(self.value, min_len)
 
     def __bytes__(self) -> bytes:
-        return self.to_bytes()
+        return encode_unsigned(self.value)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SignedInt(Node):
 
     value: int
 
     def to_bytes(self, min_len: int = 0) -> bytes:
-        res = b""
-        value = self.value
-        while True:
-            byte = value & 0x7F
-            value >>= 7
-            if (len(res) + 1 >= min_len) and (
-                (value == 0 and (byte & 0x40) == 0)
-                or (value == -1 and (byte & 0x40) != 0)
-            ):
-                res += byte.to_bytes(1, "little")
-                return res
-            res += (byte | 0x80).to_bytes(1, "little")
+        return encode_signed(self.value, min_len)
 
     def __bytes__(self) -> bytes:
-        return self.to_bytes()
+        return encode_signed(self.value)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FloatingPoint(Node):
 
     value: float
@@ -67,23 +221,26 @@ class FloatingPoint(Node):
             raise ValueError(f"Invalid size {self.size} for FloatingPoint")
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Name(Node):
 
     value: str
 
     def __bytes__(self) -> bytes:
         value = self.value.encode("utf-8")
-        return bytes(UnsignedInt(value=len(value))) + value
+        return encode_unsigned(len(value)) + value
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Vector(Node):
 
     values: Sequence[Node | bytes]
 
-    def __bytes__(self) -> bytes:
-        res = bytes(UnsignedInt(value=len(self.values)))
-        for value in self.values:
-            res += bytes(value)
+    def chunks(self) -> list[bytes]:
+        """Return the encoded vector as a list of buffers (length prefix first)."""
+        res = [encode_unsigned(len(self.values))]
+        res.extend(bytes(value) for value in self.values)
         return res
+
+    def __bytes__(self) -> bytes:
+        return b"".join(self.chunks())
@@ -21,7 +21,7 @@ from wasm_gen import instructions as I  # noqa
 from wasm_gen.type import i32_t
 
 
-def test_42() -> None:
+def test_42(tmp_path: Path) -> None:
 
     m = Module()
 
@@ -73,7 +73,7 @@ def test_42() -> None:
     sig = hashlib.sha256()
     sig.update(bytes(m))
 
-    target = Path(__file__).parent / "test_say42.wasm"
+    target = tmp_path / "test_say42.wasm"
 
     with open(target, "wb") as f:
         f.write(bytes(m))
@@ -21,7 +21,7 @@ from wasm_gen import instructions as I  # noqa
 from wasm_gen.type import i32_t
 
 
-def test_add() -> None:
+def test_add(tmp_path: Path) -> None:
 
     m = Module()
 
@@ -161,7 +161,7 @@ def test_add() -> None:
     sig = hashlib.sha256()
     sig.update(bytes(m))
 
-    target = Path(__file__).parent / "test_add.wasm"
+    target = tmp_path / "test_add.wasm"
 
     with open(target, "wb") as f:
         f.write(bytes(m))
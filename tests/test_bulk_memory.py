@@ -0,0 +1,90 @@
+# SPDX-FileCopyrightText: 2026 Jacques Supcik <jacques.supcik@hefr.ch>
+#
+# SPDX-License-Identifier: MIT
+
+import pytest
+
+from wasm_gen import instructions as I  # noqa
+from wasm_gen.data import ActiveData, PassiveData
+from wasm_gen.function import Function, FunctionType
+from wasm_gen.memory import Memory, MemoryType
+from wasm_gen.module import Module
+from wasm_gen.opt import optimize_data
+from wasm_gen.reader import DATA_COUNT_SECTION, ModuleReader
+
+
+def test_bulk_memory_encoding() -> None:
+    segment = PassiveData(source=b"hello")
+    segment._index = 3
+    assert bytes(I.MemoryInit(data=segment)) == b"\xfc\x08\x03\x00"
+    assert bytes(I.DataDrop(data=segment)) == b"\xfc\x09\x03"
+    assert bytes(I.MemoryCopy()) == b"\xfc\x0a\x00\x00"
+    assert bytes(I.MemoryFill()) == b"\xfc\x0b\x00"
+    assert bytes(I.TableInit(elemidx=1, tableidx=2)) == b"\xfc\x0c\x01\x02"
+    assert bytes(I.ElemDrop(elemidx=1)) == b"\xfc\x0d\x01"
+    assert bytes(I.TableCopy(dst=1, src=2)) == b"\xfc\x0e\x01\x02"
+    assert bytes(I.TableGrow(tableidx=1)) == b"\xfc\x0f\x01"
+    assert bytes(I.TableSize()) == b"\xfc\x10\x00"
+    assert bytes(I.TableFill()) == b"\xfc\x11\x00"
+    assert bytes(I.I32TruncSatF32S()) == b"\xfc\x00"
+    assert bytes(I.I64TruncSatF64U()) == b"\xfc\x07"
+    assert I.MemoryFill.info.stack_effect == (("i32", "i32", "i32"), ())
+
+
+def _module(data_count: bool | None = None) -> tuple[Module, PassiveData]:
+    segment = PassiveData(source=b"hello")
+    f = Function(type=FunctionType(params=[], results=[]))
+    f.body.extend(
+        [
+            I.I32Const(value=0),
+            I.I32Const(value=0),
+            I.I32Const(value=5),
+            I.MemoryInit(data=segment),
+            I.DataDrop(data=segment),
+            I.End(),
+        ]
+    )
+    m = Module(
+        funcs=[f],
+        memories=[Memory(type=MemoryType(min_pages=1))],
+        data=[ActiveData(source=b"abc", expr=[I.I32Const(value=0), I.End()]), segment],
+        data_count=data_count,
+    )
+    return m, segment
+
+
+def _has_data_count(m: Module) -> bool:
+    return DATA_COUNT_SECTION in ModuleReader(bytes(m)).sections
+
+
+def test_data_count_section() -> None:
+    m, segment = _module()
+    assert _has_data_count(m)
+    assert segment._index == 1
+    assert b"\xfc\x08\x01\x00" in bytes(m)
+    # Nothing refers to the data
+    m.funcs[0].body[:] = [I.End()]
+    assert not _has_data_count(m)
+    m.data_count = True
+    assert _has_data_count(m)
+    m.data_count = False
+    assert not _has_data_count(m)
+    # The instructions cannot be encoded without the section
+    m, _ = _module(data_count=False)
+    with pytest.raises(ValueError):
+        bytes(m)
+
+
+def test_data_count_round_trip() -> None:
+    m, _ = _module()
+    data = bytes(m)
+    reader = ModuleReader(data)
+    read = reader.module()
+    assert read.data_count
+    # The body is written as it was read
+    assert bytes(read) == data
+    body = read.funcs[0].body
+    assert body[3].data is read.data[1]  # type: ignore[attr-defined]
+    assert bytes(read) == data
+    # Segments referred to by the code are not rewritten
+    assert optimize_data(read) == 0
@@ -0,0 +1,140 @@
+# SPDX-FileCopyrightText: 2026 Jacques Supcik <jacques.supcik@hefr.ch>
+#
+# SPDX-License-Identifier: MIT
+
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+import test_reader
+import test_wasi
+
+from wasm_gen import (
+    ActiveData,
+    Export,
+    Function,
+    FunctionType,
+    Memory,
+    MemoryType,
+    Module,
+)
+from wasm_gen import instructions as I  # noqa
+from wasm_gen.cache import STALE_TEMP_SECONDS, ModuleCache, structural_hash
+from wasm_gen.function import Body
+from wasm_gen.reader import LazyFunction
+from wasm_gen.type import i32_t
+
+
+def build(value: int) -> Module:
+    callee = Function(
+        type=FunctionType(results=[i32_t]), body=[I.I32Const(value=value), I.End()]
+    )
+    main = Function(
+        type=FunctionType(results=[i32_t]), body=[I.Call(function=callee), I.End()]
+    )
+    return Module(
+        funcs=[callee, main],
+        memories=[Memory(type=MemoryType(min_pages=1))],
+        exports=[Export(main, "main")],
+        data=[ActiveData(source=b"hello", expr=[I.I32Const(value=16)])],
+    )
+
+
+def test_structural_hash(tmp_path: Path) -> None:
+    assert structural_hash(build(1)) == structural_hash(build(1))
+    assert structural_hash(build(1)) != structural_hash(build(2))
+    # Calling the other function changes the index, hence the hash
+    m = build(1)
+    m.funcs.reverse()
+    assert structural_hash(m) != structural_hash(build(1))
+    # Modules read from a binary are hashed without decoding their code
+    data = test_reader.written(test_wasi.test_wasi, "test_wasi.wasm", tmp_path)
+    a, b = Module.from_bytes(data), Module.from_bytes(data)
+    assert structural_hash(a) == structural_hash(b)
+    # The code is still not decoded
+    assert all(isinstance(f, LazyFunction) and f.raw_code() for f in b.funcs)
+    # Decoding the code does not change the hash
+    assert all(len(f.body) > 0 for f in b.funcs)
+    assert structural_hash(a) == structural_hash(b)
+
+
+def test_structural_hash_cached_chunks() -> None:
+    m = build(1)
+    h = structural_hash(m)
+    # Once encoded, the cached chunks of the functions are hashed
+    bytes(m)
+    callee, main = m.funcs
+    assert main._encoded is not None
+    positions = {id(callee): 0, id(main): 1}
+    assert main.positioned_chunks(positions) is main._encoded.chunks
+    assert main.positioned_chunks({id(callee): 1})[-1] == b"\x10\x01\x0b"
+    assert structural_hash(m) == h
+    assert bytes(m) == bytes(build(1))
+    # The cached chunks are not used when the indices moved
+    m.funcs.reverse()
+    assert structural_hash(m) != h
+    m.funcs.reverse()
+    assert structural_hash(m) == h
+    # Nor when the body changed
+    m.funcs[0].body[0] = I.I32Const(value=2)
+    assert structural_hash(m) == structural_hash(build(2))
+
+
+def test_module_cache_encodes_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    encoded: list[object] = []
+    for name in ("encode_body", "encode_body_indexed"):
+        encode = getattr(I, name)
+
+        def counted(body: Any, *args: Any, encode: Any = encode) -> None:
+            if isinstance(body, Body):
+                # A function body, not a constant expression
+                encoded.append(body)
+            encode(body, *args)
+
+        monkeypatch.setattr(I, name, counted)
+    cache = ModuleCache(tmp_path)
+    # A miss encodes each body once, for the hash
+    data = cache.get_or_build(build(1))
+    assert len(encoded) == 2
+    # A hit encodes each body only for the hash
+    encoded.clear()
+    m = build(1)
+    assert cache.get_or_build(m) == data
+    assert len(encoded) == 2
+    # and nothing once the bodies are encoded
+    encoded.clear()
+    assert cache.get_or_build(m) == data
+    assert bytes(m) == data
+    assert encoded == []
+
+
+def test_module_cache(tmp_path: Path) -> None:
+    cache = ModuleCache(tmp_path)
+    m = build(1)
+    assert cache.get_or_build(m) == bytes(m)
+    assert len(list(tmp_path.iterdir())) == 1
+    assert cache.get(structural_hash(m)) == bytes(m)
+    # Only the most recently used entry fits
+    cache.max_size = len(bytes(m))
+    old = tmp_path / f"{structural_hash(m)}.wasm"
+    os.utime(old, (0, 0))
+    assert cache.get_or_build(build(2)) == bytes(build(2))
+    assert not old.exists()
+    assert len(list(tmp_path.iterdir())) == 1
+
+
+def test_module_cache_stale_temp_files(tmp_path: Path) -> None:
+    cache = ModuleCache(tmp_path)
+    stale, recent = tmp_path / "stale.tmp", tmp_path / "recent.tmp"
+    stale.write_bytes(b"partial")
+    recent.write_bytes(b"being written")
+    old = time.time() - 2 * STALE_TEMP_SECONDS
+    os.utime(stale, (old, old))
+    cache.evict()
+    assert not stale.exists()
+    # It may still be written by another process
+    assert recent.exists()
@@ -0,0 +1,87 @@
+# SPDX-FileCopyrightText: 2026 Jacques Supcik <jacques.supcik@hefr.ch>
+#
+# SPDX-License-Identifier: MIT
+
+import mmap
+from array import array
+from io import BytesIO
+from pathlib import Path
+
+from wasm_gen import ActiveData, Memory, MemoryType, Module, PassiveData
+from wasm_gen import instructions as I  # noqa
+
+
+def test_data_is_not_shared() -> None:
+    a = ActiveData()
+    b = ActiveData()
+    a._data.write(b"a")
+    assert b._data.getvalue() == b""
+
+
+def test_buffer_sources(tmp_path: Path) -> None:
+    table = bytearray(range(256)) * 4
+    path = tmp_path / "table.bin"
+    path.write_bytes(table)
+    expected = b"\x00\x41\x00\x0b\x80\x08" + table
+    sources = [
+        bytes(table),
+        table,
+        memoryview(table),
+        array("I", table),
+        path,
+        str(path),
+    ]
+    for source in sources:
+        d = ActiveData(source=source, expr=[I.I32Const(value=0)])
+        assert bytes(d) == expected
+    # The content is not copied
+    d = ActiveData(source=table)
+    content = d.chunks()[-1]
+    assert isinstance(content, memoryview) and content.obj is table
+    assert bytes(PassiveData(source=b"")) == b"\x01\x00"
+
+
+def test_data_section() -> None:
+    m = Module()
+    m.memories.append(Memory(type=MemoryType(min_pages=1)))
+    m.data.append(ActiveData(source=b"abc", expr=[I.I32Const(value=8)]))
+    d = ActiveData(_data=BytesIO(b"def"))
+    d.append_expr(I.I32Const(value=16))
+    m.data.append(d)
+    data = bytes(m)
+    stream = BytesIO()
+    m.write_to(stream)
+    assert stream.getvalue() == data
+    segments = Module.from_bytes(data).data
+    assert [bytes(s) for s in segments] == [bytes(s) for s in m.data]
+
+
+def test_positional_fields() -> None:
+    d = ActiveData(BytesIO(b"abc"), 1, 0, [I.I32Const(value=0)])
+    assert d.memory == 1
+    assert bytes(d) == b"\x02\x01\x41\x00\x0b\x03abc"
+
+
+def test_write_after_encoding() -> None:
+    d = PassiveData()
+    d._data.write(b"a")
+    chunks = d.chunks()
+    d._data.write(b"b")
+    assert bytes(chunks[-1]) == b"a"
+    assert bytes(d) == b"\x01\x02ab"
+
+
+def test_file_is_mapped_once(tmp_path: Path) -> None:
+    path = tmp_path / "data.bin"
+    path.write_bytes(b"content")
+    with PassiveData(source=path) as d:
+        first, second = d.content(), d.content()
+        mapped = first.obj
+        assert isinstance(mapped, mmap.mmap) and second.obj is mapped
+        assert bytes(d) == b"\x01\x07content"
+        first.release()
+        second.release()
+    # The map is closed, a new one is made when needed
+    assert mapped.closed
+    assert bytes(d.content()) == b"content"
+    d.close()
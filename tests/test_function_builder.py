@@ -0,0 +1,224 @@
+# SPDX-FileCopyrightText: 2026 Jacques Supcik <jacques.supcik@hefr.ch>
+#
+# SPDX-License-Identifier: MIT
+
+import pytest
+
+from wasm_gen import (
+    BaseFunction,
+    BaseGlobal,
+    Export,
+    Function,
+    FunctionBuilder,
+    FunctionType,
+    GlobalType,
+    Import,
+    Module,
+)
+from wasm_gen import instructions as I  # noqa
+from wasm_gen.opcodes import OPCODES
+from wasm_gen.type import i32_t
+from wasm_gen.values import TypeIndex
+
+
+def build_module(use_builder: bool) -> Module:
+    m = Module()
+
+    write_int = BaseFunction(type=FunctionType(params=[i32_t, i32_t], results=[]))
+    m.imports.append(Import(node=write_int, module="sys", name="WriteInt"))
+    sp = BaseGlobal(type=GlobalType(type=i32_t, mutable=True))
+    m.imports.append(Import(node=sp, module="env", name="__stack_pointer"))
+
+    t = FunctionType(params=[i32_t], results=[])
+    if use_builder:
+        fb = FunctionBuilder(type=t)
+        fb.global_get(sp)
+        fb.i32_const(300)
+        fb.i32_load(align=2, offset=4)
+        fb.i32_add()
+        fb.global_set(sp)
+        fb.block()
+        fb.local_get(0)
+        fb.i32_eqz()
+        fb.br_if(0)
+        fb.local_get(0)
+        fb.i32_const(-5)
+        fb.call(write_int)
+        fb.end()
+        fb.emit(I.Nop())
+        f = fb.build()
+    else:
+        f = Function(type=t)
+        f.body.extend(
+            [
+                I.GlobalGet(global_=sp),
+                I.I32Const(value=300),
+                I.I32Load(align=2, offset=4),
+                I.I32Add(),
+                I.GlobalSet(global_=sp),
+                I.Block(),
+                I.LocalGet(localidx=0),
+                I.I32Eqz(),
+                I.BrIf(label=0),
+                I.LocalGet(localidx=0),
+                I.I32Const(value=-5),
+                I.Call(function=write_int),
+                I.End(),
+                I.Nop(),
+                I.End(),
+            ]
+        )
+
+    # The indices of the imports are only known when the module is encoded,
+    # so prepend a function to shift the indices of the later ones.
+    m.imports.insert(
+        0,
+        Import(node=BaseFunction(type=FunctionType()), module="sys", name="OpenInput"),
+    )
+    m.funcs.append(f)
+    m.exports.append(Export(node=f, name="main"))
+    return m
+
+
+def test_builder_matches_list_body() -> None:
+    assert bytes(build_module(True)) == bytes(build_module(False))
+
+
+def test_builder_unclosed_block() -> None:
+    fb = FunctionBuilder(type=FunctionType())
+    fb.loop()
+    with pytest.raises(Exception, match="unclosed"):
+        fb.build()
+
+
+def test_builder_labels() -> None:
+    fb = FunctionBuilder(type=FunctionType(params=[i32_t], results=[i32_t]))
+    with fb.block(0x7F) as result:
+        with fb.block() as one:
+            with fb.block() as zero:
+                with fb.loop() as again:
+                    fb.local_get(0)
+                    fb.br_table([zero, one, again], result)
+                fb.nop()
+            fb.i32_const(10)
+            fb.br(result)
+        fb.i32_const(11)
+    f = fb.build()
+    expected = Function(
+        type=fb.type,
+        body=[
+            I.Block(block_type=0x7F),
+            I.Block(),
+            I.Block(),
+            I.Loop(),
+            I.LocalGet(localidx=0),
+            I.BrTable(targets=[1, 2, 0], default=3),
+            I.End(),
+            I.Nop(),
+            I.End(),
+            I.I32Const(value=10),
+            I.Br(label=1),
+            I.End(),
+            I.I32Const(value=11),
+            I.End(),
+            I.End(),
+        ],
+    )
+    assert bytes(f) == bytes(expected)
+
+
+def test_builder_closed_label() -> None:
+    fb = FunctionBuilder(type=FunctionType())
+    with fb.block() as outer:
+        inner = fb.block()
+        with pytest.raises(Exception, match="innermost first"):
+            fb.end(outer)
+        fb.end(inner)
+    with pytest.raises(Exception, match="not open"):
+        fb.br(inner)
+    with pytest.raises(Exception, match="not open"):
+        FunctionBuilder(type=FunctionType()).br_if(outer)
+
+
+def test_builder_block_types() -> None:
+    # The empty type, a value type and type indices of one and two bytes,
+    # including one that only TypeIndex can express
+    block_types: list[int | TypeIndex] = [0x40, 0x7F, 3, 200, TypeIndex(value=100)]
+    for block_type in block_types:
+        fb = FunctionBuilder(type=FunctionType())
+        fb.block(block_type)
+        fb.end()
+        fb.loop(block_type)
+        fb.end()
+        fb.i32_const(0)
+        fb.if_(block_type)
+        fb.end()
+        expected = Function(
+            type=fb.type,
+            body=[
+                I.Block(block_type=block_type),
+                I.End(),
+                I.Loop(block_type=block_type),
+                I.End(),
+                I.I32Const(value=0),
+                I.If(block_type=block_type),
+                I.End(),
+                I.End(),
+            ],
+        )
+        assert bytes(fb.build()) == bytes(expected)
+
+
+def test_builder_float_and_memory() -> None:
+    fb = FunctionBuilder(type=FunctionType())
+    fb.memory_size()
+    fb.memory_grow()
+    fb.i32_const(0)
+    fb.f32_load(offset=8)
+    fb.f32_const(1.5)
+    fb.f32_mul()
+    fb.f64_promote_f32()
+    fb.f64_const(-0.25)
+    fb.f64_add()
+    fb.f64_sqrt()
+    fb.f64_const(2.0)
+    fb.f64_lt()
+    fb.f64_convert_i32_u()
+    fb.f32_demote_f64()
+    fb.i32_const(0)
+    fb.f32_store(align=0)
+    expected = Function(
+        type=fb.type,
+        body=[
+            I.MemorySize(),
+            I.MemoryGrow(),
+            I.I32Const(value=0),
+            I.F32Load(offset=8),
+            I.F32Const(value=1.5),
+            I.F32Mul(),
+            I.F64PromoteF32(),
+            I.F64Const(value=-0.25),
+            I.F64Add(),
+            I.F64Sqrt(),
+            I.F64Const(value=2.0),
+            I.F64Lt(),
+            I.F64ConvertI32U(),
+            I.F32DemoteF64(),
+            I.I32Const(value=0),
+            I.F32Store(align=0),
+            I.End(),
+        ],
+    )
+    assert bytes(fb.build()) == bytes(expected)
+
+
+def test_builder_simple_instructions() -> None:
+    # Each method without immediates appends the instruction of its name,
+    # except end, which closes the open blocks
+    for info in OPCODES:
+        method = getattr(FunctionBuilder, info.name.replace(".", "_"), None)
+        if info.immediates or method is None or info.name == "end":
+            continue
+        fb = FunctionBuilder(type=FunctionType())
+        method(fb)
+        assert bytes(fb._code) == info.encoding()
@@ -0,0 +1,86 @@
+# SPDX-FileCopyrightText: 2026 Jacques Supcik <jacques.supcik@hefr.ch>
+#
+# SPDX-License-Identifier: MIT
+
+from wasm_gen import (
+    BaseFunction,
+    Export,
+    Function,
+    FunctionBuilder,
+    FunctionType,
+    Import,
+    Module,
+)
+from wasm_gen import instructions as I  # noqa
+from wasm_gen.function import Bytecode
+from wasm_gen.type import i32_t, i64_t
+
+
+def reference_bytes(m: Module) -> bytes:
+    # Encode without any cached function body
+    for f in m.funcs:
+        f._encoded = None
+    return bytes(m)
+
+
+def test_function_cache() -> None:
+    m = Module()
+    callee = Function(type=FunctionType(params=[], results=[i32_t]))
+    callee.body.extend([I.I32Const(value=42), I.End()])
+    caller = Function(type=FunctionType(params=[], results=[i32_t]))
+    caller.body.extend([I.Call(function=callee), I.End()])
+    m.funcs.extend([caller, callee])
+    m.exports.append(Export(node=caller, name="main"))
+
+    first = bytes(m)
+    chunks = caller.chunks()
+    assert bytes(m) == first
+    assert caller.chunks() is chunks
+
+    # Mutating the body invalidates the cache
+    caller.body.insert(0, I.Nop())
+    assert caller.chunks() is not chunks
+    assert bytes(m) == reference_bytes(m)
+
+    # A new import shifts the index of the callee
+    chunks = caller.chunks()
+    m.imports.append(
+        Import(node=BaseFunction(type=FunctionType()), module="env", name="f")
+    )
+    assert bytes(m) == reference_bytes(m)
+    assert caller.chunks() is not chunks
+
+    # Plain lists are never cached
+    callee.body = [I.I32Const(value=7), I.End()]
+    assert bytes(m) == reference_bytes(m)
+    callee.body[0] = I.I32Const(value=8)
+    assert bytes(m) == reference_bytes(m)
+
+
+def test_function_cache_type_and_bytecode() -> None:
+    f = Function(type=FunctionType(params=[i32_t]))
+    for t in (i32_t, i64_t, i32_t):
+        f.add_local(t)
+    f.body.extend([I.LocalGet(localidx=3), I.Drop(), I.End()])
+    first = b"".join(f.chunks())
+    # A new parameter changes which declared local is renumbered
+    f.type.params.append(i32_t)
+    assert b"".join(f.chunks()) != first
+    f._encoded = None
+    assert b"".join(f.chunks()) != first
+
+    callee = Function(type=FunctionType(), body=[I.End()])
+    other = Function(type=FunctionType(), body=[I.End()])
+    callee._index, other._index = 0, 1
+    fb = FunctionBuilder(type=FunctionType())
+    fb.call(callee)
+    g = fb.build()
+    chunks = g.chunks()
+    assert g.chunks() is chunks
+    # The Bytecode changes, not the body
+    bytecode = g.body[0]
+    assert isinstance(bytecode, Bytecode)
+    bytecode.fixups[0] = (bytecode.fixups[0][0], other)
+    assert g.chunks()[2] == b"\x10\x01\x0b"
+    bytecode.code += b"\x01"
+    assert g.chunks()[2] == b"\x10\x01\x01\x0b"
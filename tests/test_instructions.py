@@ -0,0 +1,65 @@
+# SPDX-FileCopyrightText: 2026 Jacques Supcik <jacques.supcik@hefr.ch>
+#
+# SPDX-License-Identifier: MIT
+
+import pickle
+from dataclasses import FrozenInstanceError
+from pathlib import Path
+
+import pytest
+
+from wasm_gen import instructions as I  # noqa
+from wasm_gen.opcodes import OPCODES
+
+
+def test_simple_instructions_are_singletons() -> None:
+    assert I.End() is I.End()
+    assert I.I32Add() is I.I32Add()
+    assert bytes(I.I64Add()) == b"\x7c"
+    assert pickle.loads(pickle.dumps(I.Drop())) is I.Drop()
+
+
+def test_instructions_are_frozen_and_slotted() -> None:
+    c = I.I32Const(value=1)
+    assert not hasattr(c, "__dict__")
+    with pytest.raises(FrozenInstanceError):
+        c.value = 2  # type: ignore[misc]
+    assert I.I32Const(value=1) == c
+
+
+def test_encoding() -> None:
+    assert bytes(I.I32Const(value=-1)) == b"\x41\x7f"
+    assert bytes(I.I64Const(value=64)) == b"\x42\xc0\x00"
+    assert bytes(I.F32Const(value=1.0)) == b"\x43\x00\x00\x80\x3f"
+    assert bytes(I.I32Load()) == b"\x28\x02\x00"
+    assert bytes(I.I32Load8U(offset=200)) == b"\x2d\x00\xc8\x01"
+    assert bytes(I.I64Store32()) == b"\x3e\x02\x00"
+    assert bytes(I.CallIndirect(typeidx=3)) == b"\x11\x03\x00"
+    assert bytes(I.BrTable(targets=[0, 1, 2], default=3)) == b"\x0e\x03\x00\x01\x02\x03"
+    assert bytes(I.MemoryGrow()) == b"\x40\x00"
+    assert bytes(I.I64Extend8S()) == b"\xc2"
+    assert bytes(I.I64Extend32S()) == b"\xc4"
+
+
+def test_encode_body() -> None:
+    body = [I.LocalGet(localidx=0), I.I32Const(value=1), I.I32Add(), I.End()]
+    buf = bytearray()
+    I.encode_body(body, buf)
+    assert buf == b"".join(bytes(i) for i in body) == b"\x20\x00\x41\x01\x6a\x0b"
+
+
+def test_generated_from_table() -> None:
+    for info in OPCODES:
+        cls = getattr(I, I.class_name(info.name))
+        assert cls.info is info
+    assert I.class_name("i32.trunc_f32_s") == "I32TruncF32S"
+    assert issubclass(I.I32Load8S, I.I32)
+    assert issubclass(I.I64Load, I.I64)
+    assert issubclass(I.Loop, I.BlockInstruction)
+    assert I.I32Add.info.stack_effect == (("i32", "i32"), ("i32",))
+
+
+def test_stub_up_to_date() -> None:
+    stub = (Path(I.__file__).parent / "instructions.pyi").read_text()
+    for cls in I.instruction_classes():
+        assert f"class {cls.__name__}(" in stub
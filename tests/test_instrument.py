@@ -0,0 +1,102 @@
+# SPDX-FileCopyrightText: 2026 Jacques Supcik <jacques.supcik@hefr.ch>
+#
+# SPDX-License-Identifier: MIT
+
+import tracemalloc
+from io import BytesIO
+
+from wasm_gen import Export, Function, FunctionType, Module
+from wasm_gen import instructions as I  # noqa
+from wasm_gen.instrument import LogReporter, Phase, TableReporter, instrument, phase
+from wasm_gen.type import i32_t
+
+
+def build() -> Module:
+    funcs = [
+        Function(
+            type=FunctionType(results=[i32_t]), body=[I.I32Const(value=i), I.End()]
+        )
+        for i in range(3)
+    ]
+    return Module(funcs=funcs, exports=[Export(funcs[0], "main")])
+
+
+def test_instrument() -> None:
+    m = build()
+    phases: list[Phase] = []
+    with instrument(phases.append):
+        data = bytes(m)
+    names = [p.label() for p in phases]
+    assert names == [
+        "compute_indexes",
+        "header",
+        "type section",
+        "import section",
+        "function section",
+        "table section",
+        "memory section",
+        "global section",
+        "export section",
+        "data count section",
+        "code section",
+        "data section",
+    ]
+    # Absent sections emit nothing
+    assert sum(p.size or 0 for p in phases) == len(data)
+    assert phases[5].size is None
+    report = TableReporter()
+    with instrument(report, functions=True):
+        stream = BytesIO()
+        m.write_to(stream)
+    assert [p.label() for p in report.phases[-5:-1]] == [
+        "function 0",
+        "function 1",
+        "function 2",
+        "code section",
+    ]
+    assert sum(p.size or 0 for p in report.phases[-5:-2]) + 3 == report.phases[-2].size
+    assert report.table().row_count == len(report.phases) + 1
+    # Nothing is reported outside of the context
+    bytes(m)
+    assert len(phases) == 12
+    # The peak memory is only measured while tracemalloc is tracing
+    assert all(p.peak_bytes is None for p in phases)
+
+
+def test_instrument_peak() -> None:
+    phases: list[Phase] = []
+    tracemalloc.start()
+    try:
+        with instrument(phases.append):
+            with phase("outer"):
+                with phase("inner"):
+                    # Freed before the end of the phase
+                    buf = bytearray(1 << 20)
+                    del buf
+                with phase("after"):
+                    pass
+            bytes(build())
+    finally:
+        tracemalloc.stop()
+    peaks = {p.label(): p.peak_bytes for p in phases}
+    assert all(peak is not None and peak >= 0 for peak in peaks.values())
+    inner, after, outer = (peaks[name] or 0 for name in ("inner", "after", "outer"))
+    assert inner >= 1 << 20
+    assert after < 1 << 20
+    # The peak of a phase includes the peaks of the phases it encloses
+    assert outer >= inner
+
+
+def test_log_reporter() -> None:
+    from loguru import logger
+
+    messages: list[str] = []
+    handler = logger.add(messages.append, format="{message}")
+    try:
+        with instrument(LogReporter(level="INFO")):
+            bytes(build())
+    finally:
+        logger.remove(handler)
+    assert messages[0].startswith("compute_indexes: ")
+    assert messages[1].startswith("header: ")
+    assert messages[1].endswith(" net blocks, 8 bytes\n")
@@ -0,0 +1,53 @@
+# SPDX-FileCopyrightText: 2026 Jacques Supcik <jacques.supcik@hefr.ch>
+#
+# SPDX-License-Identifier: MIT
+
+from wasm_gen import Function, FunctionBuilder, FunctionType
+from wasm_gen import instructions as I  # noqa
+from wasm_gen.function import LocalVariables
+from wasm_gen.type import f64_t, i32_t, i64_t
+
+
+def test_add_local() -> None:
+    f = Function(
+        type=FunctionType(params=[i32_t]),
+        local_vars=[bytes(LocalVariables(count=2, type=f64_t))],
+    )
+    a = f.add_local(i32_t)
+    b = f.add_local(i64_t)
+    c = f.add_local(i32_t)
+    assert (a, b, c) == (3, 4, 5)
+    f.body.extend(
+        [
+            I.LocalGet(localidx=c),
+            I.LocalSet(localidx=a),
+            I.LocalGet(localidx=b),
+            I.LocalTee(localidx=b),
+            I.Drop(),
+            I.End(),
+        ]
+    )
+    first = bytes(f)
+    # The i32 locals are grouped, the i64 local moves after them
+    assert first == (
+        b"\x11"
+        + b"\x03\x02\x7c\x02\x7f\x01\x7e"
+        + b"\x20\x04\x21\x03\x20\x05\x22\x05\x1a\x0b"
+    )
+    # The body itself is not renumbered
+    assert f.body[0] == I.LocalGet(localidx=5)
+
+    # Declaring a local invalidates the cached encoding
+    f.add_local(i64_t)
+    assert bytes(f)[1:6] == b"\x03\x02\x7c\x02\x7f"
+    assert bytes(f)[6:8] == b"\x02\x7e"
+
+
+def test_add_local_with_bytecode() -> None:
+    f = FunctionBuilder(type=FunctionType()).build()
+    f.add_local(i32_t)
+    f.add_local(i32_t)
+    f.add_local(i64_t)
+    f.add_local(i32_t)
+    # Encoded instructions cannot be renumbered, only runs are grouped
+    assert bytes(f) == b"\x08\x03\x02\x7f\x01\x7e\x01\x7f\x0b"
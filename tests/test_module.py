@@ -0,0 +1,79 @@
+# SPDX-FileCopyrightText: 2026 Jacques Supcik <jacques.supcik@hefr.ch>
+#
+# SPDX-License-Identifier: MIT
+
+from io import BytesIO
+
+from wasm_gen import (
+    ActiveData,
+    Export,
+    Function,
+    FunctionType,
+    Memory,
+    MemoryType,
+    Module,
+)
+from wasm_gen import instructions as I  # noqa
+from wasm_gen.type import i32_t
+
+# The encoding of small_module(), checked by hand against the specification
+GOLDEN = (
+    b"\0asm\x01\x00\x00\x00"
+    b"\x01\x05\x01\x60\x00\x01\x7f"  # type: () -> i32
+    b"\x02\x01\x00"  # no imports
+    b"\x03\x02\x01\x00"  # function 0 has type 0
+    b"\x05\x03\x01\x00\x01"  # memory, min 1 page
+    b"\x07\x05\x01\x01f\x00\x00"  # export "f" = function 0
+    b"\x0a\x06\x01\x04\x00\x41\x2a\x0b"  # i32.const 42, end
+    b"\x0b\x0a\x01\x00\x41\x00\x0b\x04data"  # "data" at 0
+)
+
+
+def build_module() -> Module:
+    m = Module()
+    for i in range(10):
+        f = Function(type=FunctionType(params=[], results=[i32_t]))
+        f.body.extend([I.I32Const(value=i), I.End()])
+        m.funcs.append(f)
+        m.exports.append(Export(node=f, name=f"f{i}"))
+    m1 = Memory(type=MemoryType(min_pages=1))
+    m.memories.append(m1)
+    d = ActiveData(_data=BytesIO(b"data"))
+    d.expr.append(I.I32Const(value=0))
+    m.data.append(d)
+    return m
+
+
+def small_module() -> Module:
+    f = Function(type=FunctionType(params=[], results=[i32_t]))
+    f.body.extend([I.I32Const(value=42), I.End()])
+    return Module(
+        funcs=[f],
+        memories=[Memory(type=MemoryType(min_pages=1))],
+        exports=[Export(node=f, name="f")],
+        data=[ActiveData(source=b"data", expr=[I.I32Const(value=0)])],
+    )
+
+
+def test_golden() -> None:
+    assert b"".join(small_module().iter_chunks()) == GOLDEN
+    assert small_module().to_bytes() == GOLDEN
+    stream = BytesIO()
+    assert small_module().write_to(stream) == len(GOLDEN)
+    assert stream.getvalue() == GOLDEN
+
+
+def test_iter_chunks() -> None:
+    m = build_module()
+    chunks = list(m.iter_chunks())
+    assert chunks[0] == b"\0asm"
+    assert chunks[1] == b"\x01\x00\x00\x00"
+    assert b"".join(chunks) == bytes(m)
+
+
+def test_write_to() -> None:
+    m = build_module()
+    stream = BytesIO()
+    n = m.write_to(stream)
+    assert n == len(stream.getvalue())
+    assert stream.getvalue() == bytes(m)
@@ -0,0 +1,252 @@
+# SPDX-FileCopyrightText: 2026 Jacques Supcik <jacques.supcik@hefr.ch>
+#
+# SPDX-License-Identifier: MIT
+
+from wasm_gen import (
+    ActiveData,
+    BaseFunction,
+    BaseGlobal,
+    BaseMemory,
+    Export,
+    Function,
+    FunctionType,
+    Global,
+    GlobalType,
+    Import,
+    Memory,
+    MemoryType,
+    Module,
+)
+from wasm_gen import instructions as I  # noqa
+from wasm_gen.opt import coalesce_locals, optimize_data, peephole, tree_shake
+from wasm_gen.type import i32_t, i64_t
+
+
+def test_peephole() -> None:
+    f = Function(type=FunctionType())
+    f.body.extend(
+        [
+            I.LocalSet(localidx=1),
+            I.LocalGet(localidx=1),
+            I.I32Const(value=0),
+            I.I32Add(),
+            I.I32Const(value=0x10000),
+            I.I32Const(value=0x10000),
+            I.I32Mul(),
+            I.I32Const(value=2),
+            I.I32Const(value=3),
+            I.I32Add(),
+            I.I32Mul(),
+            I.I32Eqz(),
+            I.I32Eqz(),
+            I.BrIf(label=0),
+            I.I64Const(value=-1),
+            I.I64Const(value=60),
+            I.I64ShrU(),
+            I.Drop(),
+            I.LocalSet(localidx=1),
+            I.LocalGet(localidx=2),
+            I.End(),
+        ]
+    )
+    assert peephole(f) == 7
+    assert f.body == [
+        I.LocalTee(localidx=1),
+        # 0x10000 * 0x10000 wraps to 0, then 0 * 5 folds to 0
+        I.I32Const(value=0),
+        I.BrIf(label=0),
+        I.I64Const(value=15),
+        I.Drop(),
+        I.LocalSet(localidx=1),
+        I.LocalGet(localidx=2),
+        I.End(),
+    ]
+    assert peephole(f) == 0
+
+
+def test_peephole_shr_s() -> None:
+    # The left operand is shifted as a signed integer, whatever its encoding
+    f = Function(type=FunctionType())
+    f.body.extend(
+        [
+            I.I32Const(value=0xFFFFFFFF),
+            I.I32Const(value=1),
+            I.I32ShrS(),
+            I.I32Const(value=0x80000000),
+            I.I32Const(value=31),
+            I.I32ShrS(),
+            I.I64Const(value=0xFFFFFFFFFFFFFFFF),
+            I.I64Const(value=4),
+            I.I64ShrS(),
+            I.End(),
+        ]
+    )
+    assert peephole(f) == 3
+    assert f.body == [
+        I.I32Const(value=-1),
+        I.I32Const(value=-1),
+        I.I64Const(value=-1),
+        I.End(),
+    ]
+
+
+def test_tree_shake() -> None:
+    sp = BaseGlobal(type=GlobalType(type=i32_t, mutable=True))
+    unused_global = Global(
+        type=GlobalType(type=i32_t, mutable=False),
+        expr=[I.I32Const(value=0), I.End()],
+    )
+    counter = Global(
+        type=GlobalType(type=i32_t, mutable=True),
+        expr=[I.GlobalGet(global_=sp), I.End()],
+    )
+    write = BaseFunction(type=FunctionType(params=[i32_t]))
+    read = BaseFunction(type=FunctionType(results=[i32_t]))
+    helper = Function(type=FunctionType())
+    helper.body.extend([I.GlobalGet(global_=counter), I.Call(function=write), I.End()])
+    dead = Function(type=FunctionType())
+    dead.body.extend([I.Call(function=read), I.Drop(), I.Call(function=dead), I.End()])
+    main = Function(type=FunctionType())
+    main.body.extend([I.Call(function=helper), I.End()])
+
+    m = Module()
+    m.imports.extend(
+        [
+            Import(node=read, module="sys", name="read"),
+            Import(node=write, module="sys", name="write"),
+            Import(node=sp, module="env", name="sp"),
+        ]
+    )
+    m.funcs.extend([dead, helper, main])
+    m.globals_.extend([unused_global, counter])
+    m.exports.append(Export(node=main, name="main"))
+
+    assert tree_shake(m) == 3
+    assert [i.node for i in m.imports] == [write, sp]
+    assert m.funcs == [helper, main]
+    assert m.globals_ == [counter]
+    m.compute_indexes()
+    assert (write._index, helper._index, main._index) == (0, 1, 2)
+    assert tree_shake(m) == 0
+
+
+def test_coalesce_locals() -> None:
+    f = Function(type=FunctionType(params=[i32_t], results=[i32_t]))
+    t1, t2, t3, unused, wide = (
+        f.add_local(i32_t),
+        f.add_local(i32_t),
+        f.add_local(i32_t),
+        f.add_local(i32_t),
+        f.add_local(i64_t),
+    )
+    f.body.extend(
+        [
+            # t1 and t2 are used one after the other
+            I.LocalGet(localidx=0),
+            I.LocalSet(localidx=t1),
+            I.LocalGet(localidx=t1),
+            I.LocalSet(localidx=t2),
+            I.I64Const(value=1),
+            I.LocalSet(localidx=wide),
+            # t3 is live across the loop, in which t2 is assigned
+            I.LocalGet(localidx=t2),
+            I.LocalSet(localidx=t3),
+            I.Loop(),
+            I.LocalGet(localidx=0),
+            I.LocalSet(localidx=t2),
+            I.LocalGet(localidx=t3),
+            I.LocalGet(localidx=t2),
+            I.I32Add(),
+            I.LocalTee(localidx=t3),
+            I.BrIf(label=0),
+            I.End(),
+            I.LocalGet(localidx=t3),
+            I.End(),
+        ]
+    )
+    assert coalesce_locals(f) == 2
+    # t1 and t2 share the most used index, the unused local is dropped
+    assert f.local_types == [i32_t, i32_t, i64_t]
+    assert [i.localidx for i in f.body if isinstance(i, I.LocalSet)] == [
+        1,
+        1,
+        3,
+        2,
+        1,
+    ]
+    assert f.body[-5] == I.LocalTee(localidx=2)
+    assert unused not in [getattr(i, "localidx", None) for i in f.body]
+
+
+def test_coalesce_locals_hot_indexes() -> None:
+    f = Function(type=FunctionType(params=[i32_t]))
+    cold = [f.add_local(i64_t) for _ in range(200)]
+    hot = [f.add_local(i32_t) for _ in range(10)]
+    # All the locals are live at the same time. The cold ones are used twice
+    # each, more than the hot ones in total, but each hot local is used more.
+    for local in cold:
+        f.body.extend([I.I64Const(value=local), I.LocalSet(localidx=local)])
+    for local in hot:
+        f.body.extend([I.LocalGet(localidx=0), I.LocalSet(localidx=local)])
+    for _ in range(5):
+        for local in hot:
+            f.body.extend([I.LocalGet(localidx=local), I.Drop()])
+    for local in cold:
+        f.body.extend([I.LocalGet(localidx=local), I.Drop()])
+    f.body.append(I.End())
+    assert coalesce_locals(f) == 0
+    # The hot locals come first, the declarations stay grouped by type
+    assert f.local_types == [i32_t] * 10 + [i64_t] * 200
+    sets = [i.localidx for i in f.body if isinstance(i, I.LocalSet)]
+    assert sets[200:] == list(range(1, 11))
+
+
+def memory_image(m: Module) -> bytes:
+    image = bytearray(2000)
+    for d in m.data:
+        assert isinstance(d, ActiveData)
+        offset = d.expr[0]
+        assert isinstance(offset, I.I32Const)
+        content = d.content()
+        image[offset.value : offset.value + len(content)] = content
+    return bytes(image)
+
+
+def test_optimize_data() -> None:
+    m = Module()
+    m.memories.append(Memory(type=MemoryType(min_pages=1)))
+    for offset, content in [
+        (0, b"abc" + bytes(1000) + b"def"),
+        (1010, b"gh"),
+        (1500, bytes(10)),
+        (1, b"X"),
+    ]:
+        m.data.append(ActiveData(source=content, expr=[I.I32Const(value=offset)]))
+    image = memory_image(m)
+    size = len(bytes(m))
+
+    saved = optimize_data(m)
+    # The section size may also take fewer bytes
+    assert size - len(bytes(m)) in (saved, saved + 1)
+    assert saved > 1000
+    assert memory_image(m) == image
+    assert [bytes(d.content()) for d in m.data if isinstance(d, ActiveData)] == [
+        b"aXc",
+        b"def\0\0\0\0gh",
+    ]
+    assert optimize_data(m) == 0
+
+
+def test_optimize_data_imported_memory() -> None:
+    m = Module()
+    m.imports.append(
+        Import(node=BaseMemory(type=MemoryType(min_pages=1)), module="env", name="m")
+    )
+    for offset, content in [(0, b"ab\0\0"), (4, b"cd"), (100, b"ef")]:
+        m.data.append(ActiveData(source=content, expr=[I.I32Const(value=offset)]))
+    # The memory may not be zeroed, only the touching segments are merged
+    assert optimize_data(m) > 0
+    assert [bytes(d.content()) for d in m.data if isinstance(d, ActiveData)] == [
+        b"ab\0\0cd",
+        b"ef",
+    ]
@@ -0,0 +1,53 @@
+# SPDX-FileCopyrightText: 2026 Jacques Supcik <jacques.supcik@hefr.ch>
+#
+# SPDX-License-Identifier: MIT
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from io import BytesIO
+
+from wasm_gen import Export, Function, FunctionType, Global, GlobalType, Module
+from wasm_gen import instructions as I  # noqa
+from wasm_gen.module import EXECUTOR_CHUNK_SIZE
+from wasm_gen.reader import LazyFunction
+from wasm_gen.type import i32_t
+
+
+def make_module(n: int) -> Module:
+    m = Module()
+    g = Global(
+        type=GlobalType(type=i32_t, mutable=True), expr=[I.I32Const(value=0), I.End()]
+    )
+    m.globals_.append(g)
+    previous: Function | None = None
+    for i in range(n):
+        f = Function(type=FunctionType(params=[], results=[i32_t]))
+        f.body.append(I.I32Const(value=i))
+        if previous is not None:
+            f.body.extend([I.Call(function=previous), I.I32Add()])
+        f.body.extend([I.GlobalSet(global_=g), I.GlobalGet(global_=g), I.End()])
+        m.funcs.append(f)
+        previous = f
+    assert previous is not None
+    m.exports.append(Export(node=previous, name="main"))
+    return m
+
+
+def test_parallel_matches_serial() -> None:
+    m = make_module(2 * EXECUTOR_CHUNK_SIZE + 3)
+    serial = bytes(m)
+    assert m.to_bytes(workers=2) == serial
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        assert m.to_bytes(executor=executor) == serial
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        stream = BytesIO()
+        assert m.write_to(stream, executor=executor) == len(serial)
+        assert stream.getvalue() == serial
+
+
+def test_parallel_lazy_bodies() -> None:
+    data = bytes(make_module(EXECUTOR_CHUNK_SIZE + 3))
+    m = Module.from_bytes(data)
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        assert m.to_bytes(executor=executor) == data
+    # The bodies were sent as they are in the binary, without being decoded
+    assert all(isinstance(f, LazyFunction) and f.raw_code() for f in m.funcs)
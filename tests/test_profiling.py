@@ -0,0 +1,81 @@
+# SPDX-FileCopyrightText: 2026 Jacques Supcik <jacques.supcik@hefr.ch>
+#
+# SPDX-License-Identifier: MIT
+
+import json
+
+import pytest
+
+from wasm_gen import (
+    BaseFunction,
+    Export,
+    Function,
+    FunctionType,
+    Import,
+    Memory,
+    MemoryType,
+    Module,
+)
+from wasm_gen import instructions as I  # noqa
+from wasm_gen.profiling import SECTION, ProfileCounter, ProfileLayout, add_counters
+from wasm_gen.reader import ModuleReader
+
+
+def build() -> Module:
+    log = BaseFunction(type=FunctionType())
+    f = Function(
+        type=FunctionType(),
+        body=[I.Loop(), I.Call(function=log), I.Br(label=0), I.End(), I.End()],
+    )
+    g = Function(type=FunctionType(), body=[I.Call(function=f), I.End()])
+    return Module(
+        imports=[Import(node=log, module="env", name="log")],
+        funcs=[f, g],
+        exports=[Export(g, "main")],
+    )
+
+
+def test_global_counters() -> None:
+    m = build()
+    layout = add_counters(m, loops=True)
+    assert layout.counters == [
+        ProfileCounter(1, None),
+        ProfileCounter(1, None, 0),
+        ProfileCounter(2, "main"),
+    ]
+    assert json.loads(layout.to_json())["counters"][2]["name"] == "main"
+    assert ProfileLayout.from_json(layout.to_json()) == layout
+    assert len(m.globals_) == 3
+    f = m.funcs[0]
+    assert f.body[0] == I.GlobalGet(global_=m.globals_[0])
+    assert isinstance(f.body[4], I.Loop)
+    assert f.body[5] == I.GlobalGet(global_=m.globals_[1])
+    reader = ModuleReader(bytes(m))
+    assert [e.name for e in reader.exports] == ["main", "__profile_dump"]
+    dump = reader.code[-1]
+    assert dump.body[5] == I.BrTable(targets=(0, 1, 2), default=3)
+    # The layout is embedded in the module
+    [(name, content)] = reader.custom_sections
+    assert name == SECTION
+    assert ProfileLayout.from_json(bytes(content)) == layout
+    with pytest.raises(Exception, match="already exports"):
+        add_counters(m)
+
+
+def test_memory_counters() -> None:
+    m = build()
+    with pytest.raises(Exception, match="need a memory"):
+        add_counters(m, base=0)
+    m.memories.append(Memory(type=MemoryType(min_pages=1)))
+    with pytest.raises(Exception, match="do not fit"):
+        add_counters(m, loops=True, base=0xFFF0)
+    layout = add_counters(m, loops=True, base=0x1000)
+    assert len(layout.counters) == 3
+    assert m.globals_ == []
+    assert m.funcs[1].body[2] == I.I64Load(offset=0x1010)
+    # Counter numbers are checked against the number of counters
+    dump = m.funcs[-1].body
+    assert dump[2:5] == [I.I32Const(value=3), I.I32GeU(), I.BrIf(label=0)]
+    assert dump[8] == I.I64Load(offset=0x1000)
+    assert bytes(ModuleReader(bytes(m)).module()) == bytes(m)
+    assert ProfileLayout.from_json(bytes(m.custom_sections[0].content)) == layout
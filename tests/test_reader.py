@@ -0,0 +1,190 @@
+# SPDX-FileCopyrightText: 2026 Jacques Supcik <jacques.supcik@hefr.ch>
+#
+# SPDX-License-Identifier: MIT
+
+import gc
+import mmap
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+import test_42
+import test_add
+import test_wasi
+
+from wasm_gen import (
+    BaseFunction,
+    BaseTable,
+    CustomSection,
+    Export,
+    Function,
+    FunctionType,
+    Global,
+    GlobalType,
+    Import,
+    Module,
+    Table,
+    TableType,
+    UnsupportedFeature,
+)
+from wasm_gen import instructions as I  # noqa
+from wasm_gen.reader import LazyFunction, ModuleReader
+from wasm_gen.type import funcref_t, i32_t
+
+
+def written(test: Callable[[Path], None], name: str, tmp_path: Path) -> bytes:
+    """Run ``test``, which writes a module to ``tmp_path``, and return the
+    module in the file ``name``."""
+    test(tmp_path)
+    return (tmp_path / name).read_bytes()
+
+
+def test_round_trip(tmp_path: Path) -> None:
+    for test, name in (
+        (test_add.test_add, "test_add.wasm"),
+        (test_42.test_42, "test_say42.wasm"),
+        (test_wasi.test_wasi, "test_wasi.wasm"),
+    ):
+        data = written(test, name, tmp_path)
+        assert bytes(Module.from_bytes(data)) == data
+
+
+def test_exports_without_code(tmp_path: Path) -> None:
+    test_wasi.test_wasi(tmp_path)
+    path = tmp_path / "test_wasi.wasm"
+    with (
+        open(path, "rb") as f,
+        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data,
+    ):
+        reader = ModuleReader(data)
+        assert [e.name for e in reader.exports] == ["_start", "memory"]
+        start = reader.exports[0].node
+        assert isinstance(start, Function)
+        # The code section is only decoded on demand
+        assert len(start.body) == 0
+        assert "code" not in vars(reader)
+        assert reader.code[0] is start
+        assert isinstance(start.body[0], I.I32Const)
+        assert isinstance(start.body[-1], I.End)
+        # The functions and the reader refer to each other and keep views
+        # on the map until they are collected.
+        del reader, start
+        gc.collect()
+
+
+def test_decode_body() -> None:
+    body = [
+        I.Block(block_type=0x7F),
+        I.I32Const(value=-1000),
+        I.I64Const(value=1 << 40),
+        I.F32Const(value=1.5),
+        I.F64Const(value=-2.25),
+        I.BrTable(targets=[0, 1], default=0),
+        I.I32Load8U(offset=12),
+        I.MemoryGrow(),
+        I.End(),
+        I.End(),
+    ]
+    code = bytearray()
+    I.encode_body(body, code)
+    assert code[:2] == b"\x02\x7f"
+    decoded, pos = I.decode_body(bytes(code), 0, len(code), lambda i, index: None)
+    assert pos == len(code)
+    assert decoded[5] == I.BrTable(targets=(0, 1), default=0)
+    assert decoded == body[:5] + decoded[5:6] + body[6:]
+    # Without an end, decoding stops after the end of the expression
+    assert I.decode_body(bytes(code), 0, None, lambda i, index: None)[1] == len(code)
+
+
+def test_lazy_bodies(tmp_path: Path) -> None:
+    data = written(test_add.test_add, "test_add.wasm", tmp_path)
+    m = Module.from_bytes(data)
+    funcs = [f for f in m.funcs if isinstance(f, LazyFunction)]
+    assert len(funcs) == len(m.funcs)
+    # Untouched bodies are copied from the binary without being decoded
+    assert bytes(m) == data
+    assert all(f._code is not None for f in funcs)
+
+    # Reading a body does not change the output
+    f = funcs[-1]
+    assert isinstance(f.body[-1], I.End)
+    assert f._code is None
+    assert bytes(m) == data
+
+    # Shifting the function indexes invalidates the original bytes
+    m.imports.insert(
+        0, Import(node=BaseFunction(type=FunctionType()), module="env", name="f")
+    )
+    expected = Module.from_bytes(data)
+    expected.imports.insert(0, m.imports[0])
+    for g in expected.funcs:
+        g.body = list(g.body)
+    assert bytes(m) == bytes(expected)
+    assert bytes(m) != data
+
+
+def table_module() -> Module:
+    f = Function(type=FunctionType(results=[i32_t]))
+    table = Table(type=TableType(min_size=2, max_size=10))
+    f.body.extend(
+        [
+            I.I32Const(value=1),
+            I.I32Const(value=2),
+            I.I32Const(value=0),
+            I.SelectT(types=[i32_t]),
+            I.Drop(),
+            I.I32Const(value=0),
+            I.RefFunc(function=f),
+            I.TableSet(tableidx=1),
+            I.RefNull(ref_type=funcref_t),
+            I.RefIsNull(),
+            I.End(),
+        ]
+    )
+    # ref.func needs the function to be declared outside of the code
+    g = Global(
+        type=GlobalType(type=funcref_t, mutable=False),
+        expr=[I.RefFunc(function=f), I.End()],
+    )
+    imported = BaseTable(type=TableType(min_size=1))
+    return Module(
+        imports=[Import(node=imported, module="env", name="table")],
+        funcs=[f],
+        tables=[table],
+        globals_=[g],
+        exports=[Export(f, "f"), Export(table, "table")],
+        custom_sections=[
+            CustomSection(name="early", content=b"\x01\x02", after=1),
+            CustomSection(name="name", content=b"\x00\x04\x03mod"),
+        ],
+    )
+
+
+def test_tables_and_custom_sections() -> None:
+    data = bytes(table_module())
+    reader = ModuleReader(data)
+    assert [name for name, _ in reader.custom_sections] == ["early", "name"]
+    assert [s[0] for s in reader.layout][:3] == [1, 0, 2]
+    assert reader.exports[1].node is reader.tables[0]
+    assert isinstance(reader.imports[0].node, BaseTable)
+    m = reader.module()
+    assert bytes(m) == data
+    f = m.funcs[0]
+    assert f.body[3] == I.SelectT(types=(i32_t,))
+    assert f.body[6] == I.RefFunc(function=f)
+    assert bytes(m) == data
+    # Tables and custom sections are carried over when the module changes
+    m.funcs.insert(0, Function(type=FunctionType(), body=[I.End()]))
+    read = Module.from_bytes(bytes(m))
+    assert [c.name for c in read.custom_sections] == ["early", "name"]
+    assert read.tables[0].type == TableType(min_size=2, max_size=10)
+    assert read.funcs[1].body[6] == I.RefFunc(function=read.funcs[1])
+
+
+def test_unsupported_feature() -> None:
+    # An empty element section
+    data = bytes(table_module()) + b"\x09\x01\x00"
+    with pytest.raises(UnsupportedFeature, match="element"):
+        Module.from_bytes(data)
+    with pytest.raises(UnsupportedFeature, match="opcode"):
+        I.decode_body(b"\xff", 0, 1, lambda i, index: None)
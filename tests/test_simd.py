@@ -0,0 +1,58 @@
+# SPDX-FileCopyrightText: 2026 Jacques Supcik <jacques.supcik@hefr.ch>
+#
+# SPDX-License-Identifier: MIT
+
+import pytest
+
+from wasm_gen import instructions as I  # noqa
+from wasm_gen.opcodes import OPCODES, SIMD
+
+
+def test_simd_encoding() -> None:
+    assert bytes(I.V128Load()) == b"\xfd\x00\x04\x00"
+    assert bytes(I.V128Store(offset=16)) == b"\xfd\x0b\x04\x10"
+    assert bytes(I.V128Load8Splat()) == b"\xfd\x07\x00\x00"
+    assert bytes(I.V128Load32Lane(lane=3)) == b"\xfd\x56\x02\x00\x03"
+    assert bytes(I.V128Store64Lane(offset=8, lane=1)) == b"\xfd\x5b\x03\x08\x01"
+    value = bytes(range(16))
+    assert bytes(I.V128Const(value=value)) == b"\xfd\x0c" + value
+    lanes = list(range(0, 32, 2))
+    assert bytes(I.I8x16Shuffle(lanes=lanes)) == b"\xfd\x0d" + bytes(lanes)
+    assert bytes(I.I8x16Swizzle()) == b"\xfd\x0e"
+    assert bytes(I.F64x2Splat()) == b"\xfd\x14"
+    assert bytes(I.I8x16ExtractLaneU(lane=15)) == b"\xfd\x16\x0f"
+    assert bytes(I.F32x4ReplaceLane(lane=2)) == b"\xfd\x20\x02"
+    # Opcodes from 0x80 take two LEB128 bytes
+    assert bytes(I.I8x16Add()) == b"\xfd\x6e"
+    assert bytes(I.I16x8Abs()) == b"\xfd\x80\x01"
+    assert bytes(I.I32x4DotI16x8S()) == b"\xfd\xba\x01"
+    assert bytes(I.F32x4Add()) == b"\xfd\xe4\x01"
+    assert bytes(I.F64x2ConvertLowI32x4U()) == b"\xfd\xff\x01"
+    assert I.F32x4Mul.info.stack_effect == (("v128", "v128"), ("v128",))
+    assert I.I64x2ExtractLane.info.stack_effect == (("v128",), ("i64",))
+    with pytest.raises(Exception, match="16 bytes"):
+        bytes(I.V128Const(value=b"\x00"))
+    with pytest.raises(Exception, match="16 lane"):
+        bytes(I.I8x16Shuffle(lanes=[0]))
+
+
+def test_simd_table() -> None:
+    simd = [info for info in OPCODES if info.prefix == SIMD]
+    assert len(simd) == 236
+    assert len({info.opcode for info in simd}) == 236
+    # Every instruction decodes back to itself
+    body = []
+    for info in simd:
+        cls = getattr(I, I.class_name(info.name))
+        values = {
+            i.name: {"value": bytes(16), "lanes": tuple(range(16)), "lane": 1}.get(
+                i.name, i.default
+            )
+            for i in cls.immediates
+        }
+        body.append(cls(**values))
+    code = bytearray()
+    I.encode_body(body, code)
+    decoded, pos = I.decode_body(bytes(code), 0, len(code), lambda i, index: None)
+    assert pos == len(code)
+    assert decoded == body
@@ -0,0 +1,78 @@
+# SPDX-FileCopyrightText: 2026 Jacques Supcik <jacques.supcik@hefr.ch>
+#
+# SPDX-License-Identifier: MIT
+
+from pathlib import Path
+
+import test_reader
+import test_wasi
+from typer.testing import CliRunner
+
+from wasm_gen import Function, FunctionType
+from wasm_gen import instructions as I  # noqa
+from wasm_gen.cli import app
+from wasm_gen.function import Bytecode
+from wasm_gen.size import size_report
+
+SCRIPT = """
+from wasm_gen import Export, Function, FunctionType, Module
+from wasm_gen import instructions as I
+
+
+def module():
+    f = Function(type=FunctionType(), body=[I.Nop()] * N + [I.End()])
+    g = Function(type=FunctionType(), body=[I.Call(function=f), I.End()])
+    return Module(funcs=[f, g], exports=[Export(g, "main")])
+"""
+
+
+def test_size_report(tmp_path: Path) -> None:
+    data = test_reader.written(test_wasi.test_wasi, "test_wasi.wasm", tmp_path)
+    report = size_report(data)
+    assert sum(report.sections.values()) + 8 == report.total == len(data)
+    assert report.imports == {"wasi_snapshot_preview1": 1}
+    assert [f.name for f in report.functions] == ["_start"]
+    assert report.opcodes["call"] == 1
+    assert report.calls == {"wasi_snapshot_preview1.fd_write": 1}
+    assert report.data == [14]
+
+
+def test_size_report_unsupported() -> None:
+    m = test_reader.table_module()
+    # A try block (exception handling) cannot be decoded
+    unknown = Function(type=FunctionType(), body=[Bytecode(b"\x06\x40\x0b"), I.End()])
+    caller = Function(type=FunctionType(), body=[I.Call(function=unknown), I.End()])
+    m.funcs += [unknown, caller]
+    data = bytes(m)
+    report = size_report(data)
+    assert sum(report.sections.values()) + 8 == report.total == len(data)
+    assert report.sections["table"] > 0
+    assert report.sections["custom:name"] > 0
+    assert report.imports == {"env": 1}
+    assert [f.name for f in report.functions] == ["f", "func[1]", "func[2]"]
+    # The size of a code entry is its size prefix
+    sizes = [len(bytes(f)) - len(f.chunks()[0]) for f in m.funcs]
+    assert [f.size for f in report.functions] == sizes
+    assert report.opcodes["other"] == 1
+    assert report.opcodes["ref.func"] == 1
+    assert report.opcodes["end"] == 2
+    assert report.calls == {"func[1]": 1}
+
+
+def test_size_command(tmp_path: Path) -> None:
+    test_wasi.test_wasi(tmp_path)
+    path = tmp_path / "test_wasi.wasm"
+    runner = CliRunner()
+    result = runner.invoke(app, ["size", str(path)])
+    assert result.exit_code == 0
+    assert "wasi_snapshot_preview1" in result.output
+    old, new = tmp_path / "old.py", tmp_path / "new.py"
+    old.write_text("N = 1\n" + SCRIPT)
+    new.write_text("N = 5\n" + SCRIPT)
+    result = runner.invoke(app, ["size", str(new), "--against", str(old)])
+    assert result.exit_code == 0
+    assert "+4" in result.output
+    result = runner.invoke(
+        app, ["size", str(new), "--against", str(old), "--max-growth", "2"]
+    )
+    assert result.exit_code == 1
@@ -0,0 +1,123 @@
+# SPDX-FileCopyrightText: 2026 Jacques Supcik <jacques.supcik@hefr.ch>
+#
+# SPDX-License-Identifier: MIT
+
+from collections.abc import Sequence
+
+import pytest
+
+from wasm_gen import Function, FunctionType
+from wasm_gen import instructions as I  # noqa
+from wasm_gen.core import Node
+from wasm_gen.switch import lower_switch
+from wasm_gen.type import i32_t
+
+
+def run(body: Sequence[Node], selector: int) -> tuple[int, int]:
+    """Interpret the subset of instructions used by switches, and return
+    the value left in local 1 and the number of comparisons."""
+    # Position of the end of each block
+    ends: dict[int, int] = {}
+    open_: list[int] = []
+    for pc, instruction in enumerate(body):
+        if isinstance(instruction, I.BlockInstruction):
+            open_.append(pc)
+        elif isinstance(instruction, I.End) and open_:
+            ends[open_.pop()] = pc
+    locals_ = [selector, -1]
+    stack: list[int] = []
+    blocks: list[int] = []
+    tests = 0
+    pc = 0
+
+    def branch(label: int) -> int:
+        target = blocks[-1 - label]
+        del blocks[len(blocks) - 1 - label :]
+        return ends[target] + 1
+
+    while pc < len(body):
+        instruction = body[pc]
+        pc += 1
+        match instruction:
+            case I.Block():
+                blocks.append(pc - 1)
+            case I.If():
+                blocks.append(pc - 1)
+                if stack.pop() == 0:
+                    pc = branch(0)
+            case I.End():
+                if blocks:
+                    blocks.pop()
+            case I.LocalGet(localidx=i):
+                stack.append(locals_[i])
+            case I.LocalSet(localidx=i):
+                locals_[i] = stack.pop()
+            case I.I32Const(value=v):
+                stack.append(v)
+            case I.I32Sub():
+                b, a = stack.pop(), stack.pop()
+                stack.append((a - b) & 0xFFFFFFFF)
+            case I.I32Eq() | I.I32LtS():
+                b, a = stack.pop(), stack.pop()
+                tests += 1
+                stack.append(int(a == b if isinstance(instruction, I.I32Eq) else a < b))
+            case I.Br(label=label):
+                pc = branch(label)
+            case I.BrIf(label=label):
+                if stack.pop() != 0:
+                    pc = branch(label)
+            case I.BrTable(targets=targets, default=default):
+                i = stack.pop() & 0xFFFFFFFF
+                tests += 1
+                pc = branch(targets[i] if i < len(targets) else default)
+            case _:
+                raise Exception(f"Unexpected {instruction}")
+    assert stack == []
+    return locals_[1], tests
+
+
+def code(value: int) -> list[Node]:
+    return [I.I32Const(value=value), I.LocalSet(localidx=1)]
+
+
+def check(values: list[int], max_tests: int) -> list[Node]:
+    cases = {v: code(v * 10) for v in values}
+    body = lower_switch(0, cases, code(-2))
+    probes = set(values) | {v + d for v in values for d in (-1, 1)}
+    for probe in probes | {-(1 << 31), (1 << 31) - 1}:
+        result, tests = run(body, probe)
+        assert result == (probe * 10 if probe in cases else -2)
+        assert tests <= max_tests
+    # The body is valid for a function
+    f = Function(type=FunctionType(params=[i32_t]), local_vars=[b"\x01\x7f"])
+    f.body.extend([*body, I.End()])
+    assert len(bytes(f)) > 0
+    return body
+
+
+def test_dense_switch() -> None:
+    body = check(list(range(100, 120)), 1)
+    assert sum(isinstance(i, I.BrTable) for i in body) == 1
+
+
+def test_sparse_switch() -> None:
+    body = check([i * i * 1000 for i in range(20)], 6)
+    assert not any(isinstance(i, I.BrTable) for i in body)
+
+
+def test_clustered_switch() -> None:
+    values = [*range(-5, 10), 1000, 5000, *range(10_000, 10_010, 2), -(1 << 31)]
+    body = check(values, 4)
+    assert sum(isinstance(i, I.BrTable) for i in body) == 2
+
+
+def test_small_switch() -> None:
+    check([], 0)
+    check([3, 7], 2)
+    shared = code(1)
+    body = lower_switch(0, {1: shared, 2: shared, 3: shared, 4: shared})
+    assert sum(i is shared[0] for i in body) == 1
+    assert run(body, 3) == (1, 1)
+    assert run(body, 5) == (-1, 1)
+    with pytest.raises(Exception, match="not an i32"):
+        lower_switch(0, {1 << 31: []})
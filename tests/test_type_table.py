@@ -0,0 +1,42 @@
+# SPDX-FileCopyrightText: 2026 Jacques Supcik <jacques.supcik@hefr.ch>
+#
+# SPDX-License-Identifier: MIT
+
+from wasm_gen import Function, FunctionType, Module, TypeTable
+from wasm_gen import instructions as I  # noqa
+from wasm_gen.type import i32_t, i64_t
+
+
+def make_function(params: list[bytes]) -> Function:
+    f = Function(type=FunctionType(params=params, results=[]))
+    f.body.append(I.End())
+    return f
+
+
+def test_types_are_deduplicated() -> None:
+    m = Module()
+    m.funcs.extend([make_function([i32_t]), make_function([i32_t])])
+    m.funcs.append(make_function([i64_t]))
+    m.compute_indexes()
+    assert [f.type._index for f in m.funcs] == [0, 0, 1]
+    assert len(m._types) == 2
+    # Indexes are recomputed from scratch without a shared table
+    m.funcs.pop(0)
+    m.funcs.pop(0)
+    m.compute_indexes()
+    assert m.funcs[0].type._index == 0
+    assert len(m._types) == 1
+
+
+def test_shared_type_table() -> None:
+    table = TypeTable()
+    a = Module(type_table=table)
+    a.funcs.append(make_function([i32_t]))
+    b = Module(type_table=table)
+    b.funcs.extend([make_function([i64_t]), make_function([i32_t])])
+    bytes(a)
+    bytes(b)
+    assert [f.type._index for f in b.funcs] == [1, 0]
+    assert len(table.types) == 2
+    assert len(a._types) == 1
+    assert len(b._types) == 2
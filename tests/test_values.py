@@ -2,7 +2,23 @@
 #
 # SPDX-License-Identifier: MIT
 
-from wasm_gen.values import FloatingPoint, Name, SignedInt, UnsignedInt
+import pytest
+
+from wasm_gen.values import (
+    FloatingPoint,
+    Name,
+    SignedInt,
+    TypeIndex,
+    UnsignedInt,
+    encode_blocktype,
+    encode_signed,
+    encode_unsigned,
+    read_blocktype,
+    read_signed,
+    read_unsigned,
+    write_signed,
+    write_unsigned,
+)
 
 
 def test_integers() -> None:
@@ -39,3 +55,57 @@ def test_names() -> None:
 
     n = Name(value="français")
     assert bytes(n) == b"\x09fran\xc3\xa7ais"
+
+
+def test_leb128_encoders() -> None:
+    for v in [0, 1, 63, 64, 127, 128, 8191, 8192, 16383, 16384, 624485, 2**32 - 1]:
+        assert encode_unsigned(v) == bytes(UnsignedInt(value=v))
+        buf = bytearray(b"\xff")
+        write_unsigned(buf, v)
+        assert buf == b"\xff" + encode_unsigned(v)
+    for v in [0, -1, 63, 64, -64, -65, 8191, -8192, 8192, -8193, -123456, 2**31]:
+        assert encode_signed(v) == bytes(SignedInt(value=v))
+        buf = bytearray()
+        write_signed(buf, v)
+        assert buf == encode_signed(v)
+
+    assert encode_unsigned(128) == b"\x80\x01"
+    assert encode_unsigned(16384) == b"\x80\x80\x01"
+    assert encode_signed(-8192) == b"\x80\x40"
+    assert encode_signed(8192) == b"\x80\xc0\x00"
+    assert encode_unsigned(1, 5) == b"\x81\x80\x80\x80\x00"
+    assert encode_signed(-1, 3) == b"\xff\xff\x7f"
+
+
+def test_read_leb128() -> None:
+    for value in (0, 1, 63, 64, 127, 128, 624485, 2**32 - 1, 2**64 - 1):
+        data = b"\xff" + encode_unsigned(value) + b"\x00"
+        assert read_unsigned(data, 1) == (value, len(data) - 1)
+        assert read_unsigned(memoryview(data), 1) == (value, len(data) - 1)
+    for value in (0, 1, -1, 63, 64, -64, -65, -123456, 2**31 - 1, -(2**63)):
+        data = b"\xff" + encode_signed(value) + b"\x00"
+        assert read_signed(data, 1) == (value, len(data) - 1)
+    # Padded encodings decode to the same value
+    assert read_unsigned(encode_unsigned(3, min_len=5), 0) == (3, 5)
+    assert read_signed(encode_signed(-3, min_len=5), 0) == (-3, 5)
+
+
+def test_blocktype() -> None:
+    assert encode_blocktype(0x40) == b"\x40"
+    assert encode_blocktype(0x7F) == b"\x7f"
+    # Type indices are signed LEB128 integers
+    assert encode_blocktype(3) == b"\x03"
+    assert encode_blocktype(200) == b"\xc8\x01"
+    assert encode_blocktype(TypeIndex(value=3)) == b"\x03"
+    assert encode_blocktype(TypeIndex(value=64)) == b"\xc0\x00"
+    assert encode_blocktype(TypeIndex(value=127)) == b"\xff\x00"
+    assert bytes(TypeIndex(value=64)) == b"\xc0\x00"
+    for block_type in (0x40, 0x7F, 0x7B):
+        assert read_blocktype(encode_blocktype(block_type), 0) == (block_type, 1)
+    for index in (0, 3, 63, 64, 127, 200, 100000):
+        data = encode_blocktype(TypeIndex(value=index))
+        assert read_blocktype(data, 0) == (TypeIndex(value=index), len(data))
+    with pytest.raises(ValueError):
+        encode_blocktype(-1)
+    with pytest.raises(ValueError):
+        encode_blocktype(TypeIndex(value=-1))
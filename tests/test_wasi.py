@@ -20,7 +20,7 @@ from wasm_gen import instructions as I  # noqa  # noqa
 from wasm_gen.type import i32_t
 
 
-def test_wasi() -> None:
+def test_wasi(tmp_path: Path) -> None:
     m = Module()
 
     f1 = BaseFunction(
@@ -66,7 +66,7 @@ def test_wasi() -> None:
     sig = hashlib.sha256()
     sig.update(bytes(m))
 
-    target = Path(__file__).parent / "test_wasi.wasm"
+    target = tmp_path / "test_wasi.wasm"
 
     with open(target, "wb") as f:
         f.write(bytes(m))